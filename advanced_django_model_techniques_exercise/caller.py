@@ -105,7 +105,6 @@ from main_app.models import Customer, Book, Product, DiscountedProduct, FlashHer
 # print(f"{flash.name} - Energy: {flash.energy}")
 ######################################################################################################################
 #   5.	*Vector Searching
-from django.contrib.postgres.search import SearchVector
 # Create the first 'Document' object with a title and content.
 document1 = Document.objects.create(
     title="Django Framework 1",
@@ -118,13 +117,11 @@ document2 = Document.objects.create(
     content="Django framework provides tools for creating web pages, handling URL routing, and more.",
 )
 
-# Update the 'search_vector' field in the 'Document' model with search vectors.
-Document.objects.update(search_vector=SearchVector('title', 'content'))
-
+# The 'search_vector' field is filled by a database trigger on every insert and update.
 # Perform a full-text search for documents containing the words 'django' and 'web framework'.
-results = Document.objects.filter(search_vector='django web framework')
+results = Document.objects.search('django web framework').highlight('django web framework')
 
 # Print the search results.
 for result in results:
-    print(f"Title: {result.title}")
+    print(f"Title: {result.title} ({result.rank:.3f}): {result.snippet}")
 
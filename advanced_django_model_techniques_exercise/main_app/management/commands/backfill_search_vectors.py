@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from main_app.models import Document
+
+
+class Command(BaseCommand):
+    help = "Fills Document.search_vector for existing rows in primary key batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help="Recompute every vector, not only the missing ones, e.g. to reweight vectors written before the "
+                 "trigger existed.",
+        )
+        parser.add_argument(
+            '--start-after',
+            type=int,
+            default=0,
+            help="Only process documents with a greater id; pass the last id an interrupted run printed.",
+        )
+
+    def handle(self, *args, **options):
+        documents = Document.objects.all() if options['all'] else Document.objects.filter(search_vector__isnull=True)
+        batch_size = options['batch_size']
+        last_pk = options['start_after']
+        updated = 0
+
+        # Each batch commits on its own. Rerunning the default mode skips the
+        # vectors already filled; an interrupted --all run resumes only when
+        # given the last printed id as --start-after.
+        while True:
+            pks = list(
+                documents
+                .filter(pk__gt=last_pk)
+                .order_by('pk')
+                .values_list('pk', flat=True)[:batch_size]
+            )
+
+            if not pks:
+                break
+
+            with transaction.atomic():
+                updated += Document.objects.filter(pk__in=pks).update_search_vectors()
+
+            last_pk = pks[-1]
+            self.stdout.write(f"{updated} documents updated, last id {last_pk}")
+
+        self.stdout.write(self.style.SUCCESS(f"Backfilled {updated} search vectors."))
@@ -0,0 +1,57 @@
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank, SearchVector
+from django.db import models
+from django.db.models import F
+
+SEARCH_CONFIG = 'english'
+
+# weights of the D, C, B and A labels; titles are A and content is B
+SEARCH_WEIGHTS = [0.1, 0.2, 0.4, 1.0]
+
+
+def document_search_vector():
+    """
+    The vector the database trigger stores for every row, for backfilling
+    rows written before the trigger existed.
+    """
+    return (
+        SearchVector('title', weight='A', config=SEARCH_CONFIG) +
+        SearchVector('content', weight='B', config=SEARCH_CONFIG)
+    )
+
+
+def document_search_query(text):
+    return SearchQuery(text, search_type='websearch', config=SEARCH_CONFIG)
+
+
+class DocumentQuerySet(models.QuerySet):
+    def search(self, text):
+        """
+        Documents matching text (web search syntax), best first. The match runs
+        against the stored, GIN-indexed vector; title hits outrank content hits.
+        """
+        query = document_search_query(text)
+
+        return self.filter(
+            search_vector=query,
+        ).annotate(
+            rank=SearchRank(F('search_vector'), query, weights=SEARCH_WEIGHTS),
+        ).order_by('-rank', 'pk')
+
+    def highlight(self, text, max_words=35, min_words=15, max_fragments=2):
+        """
+        Adds a snippet of the content with the matching words wrapped in <b>.
+        Headlines are built per returned row, so slice the queryset first.
+        """
+        return self.annotate(
+            snippet=SearchHeadline(
+                'content',
+                document_search_query(text),
+                config=SEARCH_CONFIG,
+                max_words=max_words,
+                min_words=min_words,
+                max_fragments=max_fragments,
+            ),
+        )
+
+    def update_search_vectors(self):
+        return self.update(search_vector=document_search_vector())
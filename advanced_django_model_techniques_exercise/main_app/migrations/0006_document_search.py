@@ -0,0 +1,55 @@
+# Generated by Django 5.0.4 on 2026-10-18 17:45
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+# must produce the same vector as main_app.managers.document_search_vector()
+CREATE_TRIGGER = """
+CREATE FUNCTION main_app_document_search_vector() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('english'::regconfig, COALESCE(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('english'::regconfig, COALESCE(NEW.content, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER main_app_document_search_vector
+BEFORE INSERT OR UPDATE OF title, content ON main_app_document
+FOR EACH ROW EXECUTE FUNCTION main_app_document_search_vector();
+"""
+
+DROP_TRIGGER = """
+DROP TRIGGER IF EXISTS main_app_document_search_vector ON main_app_document;
+DROP FUNCTION IF EXISTS main_app_document_search_vector();
+"""
+
+
+def run_on_postgresql(sql):
+    # other databases have no tsvector or plpgsql; there the column stays NULL
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor == 'postgresql':
+            schema_editor.execute(sql)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_app', '0005_document'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='document',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='document',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='document_search_vector_gin'),
+        ),
+        migrations.RunPython(run_on_postgresql(CREATE_TRIGGER), run_on_postgresql(DROP_TRIGGER)),
+    ]
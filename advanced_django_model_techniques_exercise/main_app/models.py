@@ -1,10 +1,12 @@
 from decimal import Decimal
 
+from django.contrib.postgres.indexes import GinIndex
 from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import RegexValidator, MinValueValidator, MinLengthValidator
 from django.db import models
 
 from main_app.custom_validator import ValidateName
+from main_app.managers import DocumentQuerySet
 from main_app.mixins import RechargeEnergyMixin
 
 
@@ -195,6 +197,15 @@ class Document(models.Model):
 
     content = models.TextField()
 
+    # kept up to date by the main_app_document_search_vector trigger
     search_vector = SearchVectorField(
         null=True,
+        editable=False,
     )
+
+    objects = DocumentQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=['search_vector'], name='document_search_vector_gin'),
+        ]
@@ -1,3 +1,71 @@
+from io import StringIO
+from unittest import skipUnless
+
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
 
+from main_app.models import Document
+
+
 # Create your tests here.
+@skipUnless(connection.vendor == 'postgresql', "Full text search and its trigger need PostgreSQL.")
+class DocumentSearchTests(TestCase):
+    def setUp(self):
+        self.title_hit = Document.objects.create(title='Django performance', content='Notes on caching.')
+        self.content_hit = Document.objects.create(
+            title='Release notes',
+            content='This release makes the Django ORM faster and fixes several bugs in the admin.',
+        )
+        self.miss = Document.objects.create(title='Gardening', content='Tomatoes need sun.')
+
+    def vectors(self):
+        return dict(Document.objects.values_list('pk', 'search_vector'))
+
+    def test_trigger_fills_the_vector_on_insert_and_update(self):
+        self.assertIn("'django':1A", self.vectors()[self.title_hit.pk])
+
+        self.miss.content = 'Tomatoes need Django.'
+        self.miss.save()
+
+        self.assertEqual(list(Document.objects.search('tomatoes django')), [self.miss])
+
+    def test_search_ranks_title_hits_first(self):
+        results = list(Document.objects.search('django'))
+
+        self.assertEqual(results, [self.title_hit, self.content_hit])
+        self.assertGreater(results[0].rank, results[1].rank)
+        self.assertEqual(list(Document.objects.search('"admin" -gardening')), [self.content_hit])
+        self.assertFalse(Document.objects.search('astronomy').exists())
+
+    def test_highlight_marks_the_matching_words(self):
+        document = Document.objects.search('faster').highlight('faster').get()
+
+        self.assertEqual(document, self.content_hit)
+        self.assertIn('<b>faster</b>', document.snippet)
+        self.assertNotIn('<b>', document.snippet.replace('<b>faster</b>', ''))
+
+    def test_backfill_fills_missing_vectors_and_resumes_all_runs(self):
+        expected = self.vectors()
+        Document.objects.update(search_vector=None)
+        out = StringIO()
+        call_command('backfill_search_vectors', batch_size=2, stdout=out)
+
+        self.assertEqual(self.vectors(), expected)
+        self.assertIn(f'3 documents updated, last id {self.miss.pk}', out.getvalue())
+
+        # a vector from before the trigger is only rewritten by --all
+        Document.objects.filter(pk__gt=self.title_hit.pk).update(search_vector=None)
+        Document.objects.filter(pk=self.title_hit.pk).update(search_vector='stale')
+        call_command('backfill_search_vectors', stdout=StringIO())
+        self.assertEqual(self.vectors()[self.title_hit.pk], "'stale'")
+
+        Document.objects.filter(pk__gt=self.title_hit.pk).update(search_vector=None)
+        call_command('backfill_search_vectors', '--all', start_after=self.title_hit.pk, stdout=StringIO())
+
+        self.assertEqual(self.vectors()[self.title_hit.pk], "'stale'")
+        self.assertEqual(Document.objects.filter(search_vector__isnull=True).count(), 0)
+
+        call_command('backfill_search_vectors', '--all', stdout=StringIO())
+
+        self.assertEqual(self.vectors(), expected)
@@ -7,6 +7,7 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "orm_skeleton.settings")
 django.setup()
 
 # Import your models here
+from main_app.managers import first_value, running_total
 from main_app.models import Pet, Artifact, Location, Car, Task, HotelRoom, Character
 
 
@@ -79,13 +80,7 @@ def delete_first_location() -> None:
 
 
 def apply_discount() -> None:
-    cars = Car.objects.all()
-
-    for car in cars:
-        discount_percent = sum(int(ch) for ch in str(car.year)) / 100
-        discount = float(car.price) * discount_percent
-        car.price_with_discount = float(car.price) - discount
-        car.save()
+    Car.objects.apply_discount()
 
 
 def get_recent_cars() -> QuerySet:
@@ -107,13 +102,15 @@ def show_unfinished_tasks() -> str:
 
 
 def complete_odd_tasks() -> None:
-    tasks = Task.objects.all()
+    tasks = Task.objects.only('id', 'is_finished')
+    odd_tasks = []
 
     for task in tasks:
         if task.id % 2 == 1:
             task.is_finished = True
+            odd_tasks.append(task)
 
-    Task.objects.bulk_update(tasks, ['is_finished'])
+    Task.objects.bulk_update_values(odd_tasks, ['is_finished'])
 
 
 def encode_and_replace(text: str, task_title: str) -> None:
@@ -132,22 +129,13 @@ def get_deluxe_rooms() -> str:
 
 
 def increase_room_capacity() -> None:
-    rooms = HotelRoom.objects.all().order_by('id')
-
-    previous_room_capacity = None
-
-    for room in rooms:
-        if not room.is_reserved:
-            continue
-
-        if previous_room_capacity is not None:
-            room.capacity += previous_room_capacity
-        else:
-            room.capacity += room.id
-
-        previous_room_capacity = room.capacity
-
-    HotelRoom.objects.bulk_update(rooms, ['capacity'])
+    # Reserved rooms in id order: the first one grows by its own id, every
+    # next one by the new capacity of the one before it. Unrolled, a room's
+    # new capacity is the running total of reserved capacities up to it plus
+    # the id of the first reserved room.
+    HotelRoom.objects.filter(is_reserved=True).annotate(
+        new_capacity=running_total('capacity', order_by='id') + first_value('id', order_by='id'),
+    ).update_from_annotations(capacity='new_capacity')
 
 
 def reserve_first_room() -> None:
@@ -0,0 +1,61 @@
+import random
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from main_app.managers import get_discounted_price
+from main_app.models import Car
+
+
+def row_at_a_time():
+    for car in Car.objects.all():
+        car.price_with_discount = get_discounted_price(car.price, car.year)
+        car.save()
+
+
+MODES = {
+    'row': row_at_a_time,
+    'bulk': lambda: Car.objects.apply_discount_in_batches(),
+    'sql': lambda: Car.objects.apply_discount(),
+}
+
+
+class Command(BaseCommand):
+    help = "Times apply_discount() row by row, with bulk_update and as a single UPDATE."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', nargs='+', type=int, default=[10_000, 100_000, 1_000_000])
+        parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES))
+
+    def handle(self, *args, **options):
+        for size in options['sizes']:
+            with transaction.atomic():
+                self.seed(size)
+
+                for mode in options['modes']:
+                    start = time.perf_counter()
+                    MODES[mode]()
+                    elapsed = time.perf_counter() - start
+
+                    self.stdout.write(f"{mode:>4} {size:>9} cars: {elapsed:.3f}s")
+
+                # the benchmark never leaves its synthetic cars behind
+                transaction.set_rollback(True)
+
+    def seed(self, size):
+        random.seed(size)
+
+        Car.objects.bulk_create(
+            (
+                Car(
+                    model=f'Model {i}',
+                    year=random.randint(1950, 2024),
+                    color='Black',
+                    price=Decimal(random.randint(100_000, 10_000_000)) / 100,
+                )
+                for i in range(size)
+            ),
+            batch_size=5000,
+        )
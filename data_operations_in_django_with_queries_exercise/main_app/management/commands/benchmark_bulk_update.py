@@ -0,0 +1,51 @@
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from main_app.models import Task
+
+MODES = {
+    'bulk_update': lambda tasks, batch_size: Task.objects.bulk_update(tasks, ['is_finished'], batch_size=batch_size),
+    'values': lambda tasks, batch_size: Task.objects.bulk_update_values(tasks, ['is_finished'], batch_size=batch_size),
+}
+
+
+class Command(BaseCommand):
+    help = "Times stock bulk_update() against the VALUES join of bulk_update_values() on Task.is_finished."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', nargs='+', type=int, default=[10_000, 100_000, 1_000_000])
+        parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES))
+        parser.add_argument('--batch-size', type=int, help="Rows per statement; each method's own default if omitted.")
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"vendor: {connection.vendor}")
+
+        for size in options['sizes']:
+            with transaction.atomic():
+                self.seed(size)
+                tasks = list(Task.objects.only('id', 'is_finished'))
+
+                for mode in options['modes']:
+                    for task in tasks:
+                        task.is_finished = not task.is_finished
+
+                    start = time.perf_counter()
+                    updated = MODES[mode](tasks, options['batch_size'])
+                    elapsed = time.perf_counter() - start
+
+                    self.stdout.write(f"{mode:>11} {size:>9} tasks: {elapsed:.3f}s ({updated} rows)")
+
+                # the benchmark never leaves its synthetic tasks behind
+                transaction.set_rollback(True)
+
+    def seed(self, size):
+        Task.objects.bulk_create(
+            (
+                Task(title=f'Task {i}', description='Synthetic task', due_date=date(2024, 1, 1))
+                for i in range(size)
+            ),
+            batch_size=5000,
+        )
@@ -0,0 +1,76 @@
+import random
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+import caller
+from main_app.models import HotelRoom
+
+
+def python_loop():
+    rooms = HotelRoom.objects.all().order_by('id')
+    previous_room_capacity = None
+
+    for room in rooms:
+        if not room.is_reserved:
+            continue
+
+        if previous_room_capacity is not None:
+            room.capacity += previous_room_capacity
+        else:
+            room.capacity += room.id
+
+        previous_room_capacity = room.capacity
+
+    HotelRoom.objects.bulk_update_values(rooms, ['capacity'])
+
+
+MODES = {
+    'python': python_loop,
+    'window': caller.increase_room_capacity,
+}
+
+
+class Command(BaseCommand):
+    help = "Times increase_room_capacity() as a Python loop and as one UPDATE over a running-total window."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', nargs='+', type=int, default=[10_000, 100_000, 1_000_000])
+        parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES))
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"vendor: {connection.vendor}")
+
+        for size in options['sizes']:
+            for mode in options['modes']:
+                with transaction.atomic():
+                    self.seed(size)
+
+                    start = time.perf_counter()
+                    MODES[mode]()
+                    elapsed = time.perf_counter() - start
+
+                    self.stdout.write(f"{mode:>6} {size:>9} rooms: {elapsed:.3f}s")
+
+                    # the benchmark never leaves its synthetic rooms behind
+                    transaction.set_rollback(True)
+
+    def seed(self, size):
+        random.seed(size)
+
+        HotelRoom.objects.bulk_create(
+            (
+                HotelRoom(
+                    room_number=i,
+                    room_type='Standard',
+                    capacity=random.randint(1, 4),
+                    amenities='TV',
+                    price_per_night=Decimal('50.00'),
+                    is_reserved=random.random() < 0.5,
+                )
+                for i in range(size)
+            ),
+            batch_size=5000,
+        )
@@ -0,0 +1,136 @@
+from decimal import Decimal
+
+from django.db import connections
+from django.db.models import BigIntegerField, DecimalField, ExpressionWrapper, F, RowRange, Sum, Value, Window
+from django.db.models.functions import Cast, FirstValue, Round
+
+from main_app.bulk_update import BulkUpdateQuerySet, supports_update_from
+
+# PositiveIntegerField tops out at 2147483647, so ten digits cover every year
+YEAR_DIGITS = 10
+
+
+def get_discounted_price(price, year):
+    discount_percent = sum(int(ch) for ch in str(year)) / 100
+    discount = float(price) * discount_percent
+
+    return float(price) - discount
+
+
+def year_digit_sum():
+    return sum(
+        (F('year') / 10 ** power) % 10
+        for power in range(YEAR_DIGITS)
+    )
+
+
+def discounted_price(half_even=False):
+    """
+    price - price * digit_sum(year) / 100 worked out with integer arithmetic,
+    which keeps SQLite, which may store decimals as INTEGER or REAL, from
+    truncating or drifting.
+
+    The exact result has at most four decimal places. While it stays below
+    1,000,000 the float from get_discounted_price() turns back into exactly
+    that decimal when Django converts it to the column's ten digits, and is
+    then rounded to cents: half away from zero by PostgreSQL, half to even
+    by Django itself on SQLite, which is what half_even selects. From
+    1,000,000 up the float is cut to three or two decimal places first and
+    its binary rounding error can decide a tie, so the two may differ by a
+    cent there.
+    """
+    price_in_cents = Cast(Round(F('price') * 100), BigIntegerField())
+    scaled = ExpressionWrapper(
+        price_in_cents * (100 - year_digit_sum()),
+        output_field=BigIntegerField(),
+    )
+
+    if half_even:
+        # A remainder of exactly 50 rounds up only when the cents are odd
+        rounded = (scaled + 49 + scaled / 100 % 2) / 100
+    else:
+        rounded = (scaled + 50) / 100
+
+    return ExpressionWrapper(
+        rounded * Value(Decimal('0.01')),
+        output_field=DecimalField(max_digits=10, decimal_places=2),
+    )
+
+
+class CarQuerySet(BulkUpdateQuerySet):
+    def apply_discount(self):
+        half_even = connections[self.db].vendor == 'sqlite'
+
+        return self.update(price_with_discount=discounted_price(half_even=half_even))
+
+    def apply_discount_in_batches(self, batch_size=2000):
+        batch = []
+        updated = 0
+
+        for car in self.only('id', 'year', 'price').iterator(chunk_size=batch_size):
+            car.price_with_discount = get_discounted_price(car.price, car.year)
+            batch.append(car)
+
+            if len(batch) == batch_size:
+                updated += self.model.objects.bulk_update(batch, ['price_with_discount'])
+                batch = []
+
+        if batch:
+            updated += self.model.objects.bulk_update(batch, ['price_with_discount'])
+
+        return updated
+
+
+def running_total(expression, order_by='pk'):
+    """
+    SUM(expression) over the rows up to and including the current one, in
+    order_by order: the cumulative sum a Python loop over the queryset would
+    carry from row to row.
+    """
+    return Window(Sum(expression), order_by=order_by, frame=RowRange(start=None, end=0))
+
+
+def first_value(expression, order_by='pk'):
+    """expression on the first row in order_by order, repeated on every row."""
+    return Window(FirstValue(expression), order_by=order_by)
+
+
+class CumulativeQuerySet(BulkUpdateQuerySet):
+    def with_running_total(self, field, alias=None, order_by='pk'):
+        return self.annotate(**{alias or f'{field}_running_total': running_total(field, order_by)})
+
+    def update_from_annotations(self, **fields):
+        """
+        Sets every given field to the annotation of the same row named by its
+        value, e.g. update_from_annotations(capacity='new_capacity'), and
+        returns the number of rows updated.
+
+        update() refuses window functions because it cannot evaluate them
+        per row. Here the annotated queryset is run as a subquery, so windows
+        see every row of the queryset, and joined back with one
+        UPDATE ... FROM statement.
+        """
+        meta = self.model._meta
+        connection = connections[self.db]
+        rows = self.order_by().values('pk', *fields.values())
+
+        if not supports_update_from(connection):
+            objs = [
+                self.model(pk=row['pk'], **{field: row[name] for field, name in fields.items()})
+                for row in rows
+            ]
+
+            return self.model._base_manager.using(self.db).bulk_update(objs, list(fields))
+
+        quote = connection.ops.quote_name
+        table = quote(meta.db_table)
+        pk = quote(meta.pk.column)
+        assignments = ', '.join(
+            f'{quote(meta.get_field(field).column)} = w.{quote(name)}' for field, name in fields.items()
+        )
+        sql, params = rows.query.get_compiler(self.db).as_sql()
+
+        with connection.cursor() as cursor:
+            cursor.execute(f'UPDATE {table} SET {assignments} FROM ({sql}) AS w WHERE {table}.{pk} = w.{pk}', params)
+
+            return cursor.rowcount
@@ -1,5 +1,8 @@
 from django.db import models
 
+from main_app.bulk_update import BulkUpdateQuerySet
+from main_app.managers import CarQuerySet, CumulativeQuerySet
+
 
 class Pet(models.Model):
     name = models.CharField(
@@ -71,6 +74,8 @@ class Car(models.Model):
         default=0,
     )
 
+    objects = CarQuerySet.as_manager()
+
 
 class Task(models.Model):
     title = models.CharField(
@@ -85,6 +90,8 @@ class Task(models.Model):
         default=False,
     )
 
+    objects = BulkUpdateQuerySet.as_manager()
+
     def __str__(self):
         return f"Task - {self.title} needs to be done until {self.due_date}!"
 
@@ -115,6 +122,8 @@ class HotelRoom(models.Model):
         default=False,
     )
 
+    objects = CumulativeQuerySet.as_manager()
+
     def __str__(self):
         return f"{self.room_type} room with number {self.room_number} costs {self.price_per_night}$ per night!"
 
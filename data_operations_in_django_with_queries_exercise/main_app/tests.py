@@ -1,3 +1,258 @@
-from django.test import TestCase
+import threading
+from datetime import date
+from decimal import Decimal
 
-# Create your tests here.
+from django.db.models import F
+from django.test import SimpleTestCase, TestCase
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_INTRANS
+
+import caller
+from main_app.managers import get_discounted_price
+from main_app.models import Car, HotelRoom, Task
+from orm_skeleton.pooled_postgresql import pool
+
+
+def make_rooms(count, reserved):
+    return HotelRoom.objects.bulk_create(
+        HotelRoom(
+            room_number=100 + i,
+            room_type='Standard',
+            capacity=i % 4 + 1,
+            amenities='TV',
+            price_per_night=Decimal('50.00'),
+            is_reserved=reserved(i),
+        )
+        for i in range(count)
+    )
+
+
+def increase_room_capacity_in_python(rooms):
+    previous_room_capacity = None
+
+    for room in sorted(rooms, key=lambda room: room.id):
+        if not room.is_reserved:
+            continue
+
+        if previous_room_capacity is not None:
+            room.capacity += previous_room_capacity
+        else:
+            room.capacity += room.id
+
+        previous_room_capacity = room.capacity
+
+    return {room.id: room.capacity for room in rooms}
+
+
+def apply_discount_in_python():
+    for car in Car.objects.all():
+        car.price_with_discount = get_discounted_price(car.price, car.year)
+        car.save()
+
+    return dict(Car.objects.values_list('id', 'price_with_discount'))
+
+
+def make_tasks(count):
+    return Task.objects.bulk_create(
+        Task(title=f'Task {i}', description='Test', due_date=date(2024, 1, 1))
+        for i in range(count)
+    )
+
+
+class BulkUpdateValuesTests(TestCase):
+    def test_updates_several_fields_with_one_statement_per_batch(self):
+        tasks = make_tasks(10)
+
+        for task in tasks:
+            task.is_finished = task.pk % 2 == 0
+            task.due_date = date(2024, 2, task.pk % 28 + 1)
+
+        with self.assertNumQueries(2):
+            updated = Task.objects.bulk_update_values(tasks, ['is_finished', 'due_date'], batch_size=5)
+
+        self.assertEqual(updated, 10)
+        self.assertEqual(
+            list(Task.objects.order_by('pk').values_list('pk', 'is_finished', 'due_date')),
+            [(task.pk, task.is_finished, task.due_date) for task in tasks],
+        )
+
+    def test_leaves_other_rows_and_fields_alone(self):
+        first, second = make_tasks(2)
+        first.is_finished = True
+        first.title = 'Not saved'
+
+        Task.objects.bulk_update_values([first], ['is_finished'])
+
+        self.assertEqual(Task.objects.get(pk=first.pk).title, 'Task 0')
+        self.assertFalse(Task.objects.get(pk=second.pk).is_finished)
+
+    def test_expressions_fall_back_to_bulk_update(self):
+        room = HotelRoom.objects.create(
+            room_number=101, room_type='Standard', capacity=2, amenities='TV', price_per_night=Decimal('50.00'),
+        )
+        room.capacity = F('capacity') + 1
+
+        HotelRoom.objects.bulk_update_values([room], ['capacity'])
+
+        room.refresh_from_db()
+        self.assertEqual(room.capacity, 3)
+
+    def test_complete_odd_tasks(self):
+        make_tasks(6)
+
+        caller.complete_odd_tasks()
+
+        for pk, is_finished in Task.objects.values_list('pk', 'is_finished'):
+            self.assertEqual(is_finished, pk % 2 == 1)
+
+
+class ApplyDiscountTests(TestCase):
+    def test_matches_the_python_loop_below_a_million(self):
+        # Steps of 7,777 cents and 1,234,567 cents hit plenty of half cent ties
+        prices = [Decimal(cents) / 100 for cents in [*range(1, 100_000, 7_777), *range(5, 99_999_999, 1_234_567)]]
+        years = [1, 1900, 1955, 1999, 2000, 2024, 9999, 123456789]
+        Car.objects.bulk_create(
+            Car(model='Model', year=year, color='Red', price=price)
+            for price in prices
+            for year in years
+        )
+        expected = apply_discount_in_python()
+        Car.objects.update(price_with_discount=0)
+
+        with self.assertNumQueries(1):
+            caller.apply_discount()
+
+        self.assertEqual(dict(Car.objects.values_list('id', 'price_with_discount')), expected)
+        self.assertEqual(len(expected), len(prices) * len(years))
+
+
+class IncreaseRoomCapacityTests(TestCase):
+    def test_matches_the_python_running_total_in_one_statement(self):
+        make_rooms(3, reserved=lambda i: False)
+        rooms = make_rooms(20, reserved=lambda i: i % 3 != 1)
+        expected = increase_room_capacity_in_python(list(HotelRoom.objects.all()))
+
+        with self.assertNumQueries(1):
+            caller.increase_room_capacity()
+
+        self.assertEqual(dict(HotelRoom.objects.values_list('id', 'capacity')), expected)
+        self.assertEqual(len(expected), len(rooms) + 3)
+
+    def test_without_reserved_rooms_changes_nothing(self):
+        make_rooms(3, reserved=lambda i: False)
+
+        caller.increase_room_capacity()
+
+        self.assertEqual(list(HotelRoom.objects.order_by('id').values_list('capacity', flat=True)), [1, 2, 3])
+
+    def test_with_running_total(self):
+        make_rooms(4, reserved=lambda i: True)
+
+        totals = HotelRoom.objects.with_running_total('capacity').order_by('id')
+
+        self.assertEqual([room.capacity_running_total for room in totals], [1, 3, 6, 10])
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def execute(self, sql):
+        if self.connection.broken:
+            raise ConnectionError('server closed the connection unexpectedly')
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = 0
+        self.broken = False
+        self.status = TRANSACTION_STATUS_IDLE
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def get_transaction_status(self):
+        return self.status
+
+    def rollback(self):
+        self.status = TRANSACTION_STATUS_IDLE
+
+    def close(self):
+        self.closed = 1
+
+
+class ConnectionPoolTests(SimpleTestCase):
+    def make_pool(self, **options):
+        return pool.ConnectionPool('test', **{**pool.DEFAULTS, 'health_checks': True, **options})
+
+    def test_exhausted_pool_times_out_and_counts_the_wait(self):
+        connections = self.make_pool(max_size=1, timeout=0.05)
+        connections.getconn(FakeConnection)
+
+        with self.assertRaises(pool.PoolTimeout):
+            connections.getconn(FakeConnection)
+
+        stats = connections.stats()
+        self.assertEqual((stats['waits'], stats['timeouts'], stats['open']), (1, 1, 1))
+        self.assertGreaterEqual(stats['wait_seconds'], 0.04)
+
+    def test_waiting_checkout_gets_the_returned_connection(self):
+        connections = self.make_pool(max_size=1, timeout=5)
+        connection = connections.getconn(FakeConnection)
+        threading.Timer(0.05, connections.putconn, [connection]).start()
+
+        self.assertIs(connections.getconn(FakeConnection), connection)
+
+        stats = connections.stats()
+        self.assertEqual((stats['waits'], stats['timeouts'], stats['connects'], stats['checkouts']), (1, 0, 1, 2))
+        self.assertGreater(stats['wait_seconds'], 0)
+
+    def test_connection_failing_the_health_check_is_discarded(self):
+        connections = self.make_pool()
+        broken = connections.getconn(FakeConnection)
+        connections.putconn(broken)
+        broken.broken = True
+
+        connection = connections.getconn(FakeConnection)
+
+        self.assertIsNot(connection, broken)
+        self.assertTrue(broken.closed)
+        self.assertEqual(connections.stats()['discards'], 1)
+        self.assertEqual(connections.stats()['open'], 1)
+
+    def test_open_transaction_is_rolled_back_when_returned(self):
+        connections = self.make_pool()
+        connection = connections.getconn(FakeConnection)
+        connection.status = TRANSACTION_STATUS_INTRANS
+
+        connections.putconn(connection)
+
+        self.assertEqual(connection.status, TRANSACTION_STATUS_IDLE)
+        self.assertFalse(connection.closed)
+        self.assertEqual(connections.stats()['idle'], 1)
+
+    def test_close_pools_closes_the_pools_of_one_database(self):
+        test_pool = pool.get_pool({'dbname': 'test_db', 'user': 'postgres'}, {}, health_checks=False)
+        other_pool = pool.get_pool({'dbname': 'other_db', 'user': 'postgres'}, {}, health_checks=False)
+        idle, in_use = test_pool.getconn(FakeConnection), test_pool.getconn(FakeConnection)
+        test_pool.putconn(idle)
+
+        try:
+            pool.close_pools('test_db')
+
+            self.assertTrue(test_pool.closed)
+            self.assertTrue(idle.closed)
+            self.assertFalse(in_use.closed)
+            self.assertFalse(other_pool.closed)
+            self.assertNotIn(test_pool.name, pool.stats())
+
+            test_pool.putconn(in_use)
+            self.assertTrue(in_use.closed)
+            self.assertEqual(test_pool.stats()['open'], 0)
+        finally:
+            pool.close_pools('other_db')
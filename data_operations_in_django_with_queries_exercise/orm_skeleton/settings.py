@@ -48,6 +48,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'orm_skeleton.nplusone.NPlusOneMiddleware',
 ]
 
 ROOT_URLCONF = 'orm_skeleton.urls'
@@ -75,14 +76,33 @@ WSGI_APPLICATION = 'orm_skeleton.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
+# Connections are pooled in-process (see orm_skeleton/pooled_postgresql): a
+# request checks one out and returns it when Django closes it, so the pool, not
+# CONN_MAX_AGE, keeps connections open between requests. At most max_size are
+# open per process; a checkout waits up to timeout seconds for a free one.
+# Idle connections are checked with SELECT 1 before reuse and replaced once
+# they are max_lifetime seconds old. Measure with `python -m orm_skeleton.pool_benchmark`.
+# Every thread holds its own connection, so threaded commands and tests get at
+# most max_size connections at once and further threads wait or fail with
+# PoolTimeout: raise max_size to the thread count for such runs.
+
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.postgresql",
+        "ENGINE": "orm_skeleton.pooled_postgresql",
         "NAME": "data_operations_in_django_with_queries_exercise",
         "USER": "postgres",
         "PASSWORD": "WerewolF1324!",
         "HOST": "localhost",
         "PORT": "5432",
+        "CONN_MAX_AGE": 0,
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            "pool": {
+                "max_size": 10,
+                "timeout": 5,
+                "max_lifetime": 3600,
+            },
+        },
     }
 }
 
@@ -126,3 +146,11 @@ STATIC_URL = 'static/'
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# N+1 query detection (see orm_skeleton/nplusone.py): a statement repeated more
+# than N_PLUS_ONE_THRESHOLD times from one call site is logged, or raised when
+# N_PLUS_ONE_RAISE is True.
+
+N_PLUS_ONE_THRESHOLD = 10
+
+N_PLUS_ONE_RAISE = False
@@ -1,5 +1,6 @@
 import os
 from datetime import timedelta, date
+from typing import Iterator
 
 import django
 from django.db.models import QuerySet, Avg
@@ -17,20 +18,13 @@ from main_app.models import Author, Book, Song, Artist, Product, Review, Driving
 
 # Create queries within functions
 
-def show_all_authors_with_their_books() -> str:
-    final_str = []
-    authors = Author.objects.all().order_by('id')
-
-    for author in authors:
-        book = Book.objects.filter(author=author)
-
-        if not book:
-            continue
+def iter_authors_with_their_books() -> Iterator[str]:
+    for author_name, titles in Book.objects.iter_titles_by_author():
+        yield f"{author_name} has written - {', '.join(titles)}!"
 
-        title = ', '.join(b.title for b in book)
-        final_str.append(f"{author.name} has written - {title}!")
 
-    return '\n'.join(final_str)
+def show_all_authors_with_their_books() -> str:
+    return '\n'.join(iter_authors_with_their_books())
 
 
 def delete_all_authors_without_books() -> None:
@@ -90,15 +84,7 @@ def get_drivers_with_expired_licenses(due_date: date) -> str:
 
 
 def register_car_by_owner(owner: Owner) -> str:
-    registration = Registration.objects.filter(car__isnull=True).first()
-    car = Car.objects.filter(owner__isnull=True).first()
-
-    car.owner = owner
-    car.save()
-
-    registration.registration_date = date.today()
-    registration.car = car
-    registration.save()
+    [(car, registration)] = Car.objects.register_to_owners([owner])
 
     return (f"Successfully registered {car.model} to {owner.name} "
             f"with registration number {registration.registration_number}.")
@@ -7,6 +7,11 @@ from main_app.models import Car
 @admin.register(Car)
 class CarAdmin(admin.ModelAdmin):
     list_display = ('model', 'year', 'owner', 'car_details')
+    list_select_related = ('owner', 'registration')
+    # filtering on the owner itself would load every Owner for the sidebar;
+    # owners are found through the search box instead
+    list_filter = (('owner', admin.EmptyFieldListFilter), 'registration__registration_date')
+    search_fields = ('model', 'owner__name', 'registration__registration_number')
 
     @staticmethod
     def car_details(car: Car) -> str:
@@ -23,3 +28,4 @@ class CarAdmin(admin.ModelAdmin):
         return f"Owner: {owner}, Registration: {registration}"
 
     car_details.short_description = 'Car Details'
+    car_details.admin_order_field = 'registration__registration_number'
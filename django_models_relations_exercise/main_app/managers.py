@@ -0,0 +1,74 @@
+from datetime import date
+from itertools import groupby
+from operator import itemgetter
+
+from django.db import models, transaction
+
+
+class BookQuerySet(models.QuerySet):
+    def iter_titles_by_author(self, chunk_size=2000):
+        """
+        Yields (author name, [titles]) per author, in author id order, from one
+        query ordered by author. Rows are streamed in chunks and grouped in a
+        single pass, so only one author's titles are held in memory at a time.
+        """
+        rows = (
+            self
+            .order_by('author_id', 'id')
+            .values_list('author_id', 'author__name', 'title')
+            .iterator(chunk_size=chunk_size)
+        )
+
+        for (_, author_name), group in groupby(rows, key=itemgetter(0, 1)):
+            yield author_name, [title for _, _, title in group]
+
+
+class CarQuerySet(models.QuerySet):
+    def register_to_owners(self, owners):
+        """
+        Gives every owner a free car and a free registration in one transaction.
+
+        Free rows are claimed with SELECT ... FOR UPDATE SKIP LOCKED, so
+        concurrent callers never receive the same car or registration: rows
+        locked by another transaction are skipped rather than waited on. The
+        whole batch takes two locking SELECTs and two UPDATEs regardless of
+        how many owners it holds, and nothing is claimed unless every owner
+        can be served.
+        """
+        from main_app.models import Registration
+
+        owners = list(owners)
+        count = len(owners)
+
+        with transaction.atomic(using=self.db):
+            cars = list(
+                self
+                .filter(owner__isnull=True)
+                .order_by('id')
+                .select_for_update(skip_locked=True)[:count]
+            )
+            registrations = list(
+                Registration.objects
+                .using(self.db)
+                .filter(car__isnull=True)
+                .order_by('id')
+                .select_for_update(skip_locked=True)[:count]
+            )
+
+            if len(cars) < count:
+                raise self.model.DoesNotExist(f"Only {len(cars)} free cars for {count} owners.")
+
+            if len(registrations) < count:
+                raise Registration.DoesNotExist(f"Only {len(registrations)} free registrations for {count} owners.")
+
+            today = date.today()
+
+            for owner, car, registration in zip(owners, cars, registrations):
+                car.owner = owner
+                registration.car = car
+                registration.registration_date = today
+
+            self.model.objects.using(self.db).bulk_update(cars, ['owner'])
+            Registration.objects.using(self.db).bulk_update(registrations, ['car', 'registration_date'])
+
+        return list(zip(cars, registrations))
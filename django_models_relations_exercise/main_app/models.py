@@ -2,6 +2,8 @@ from datetime import timedelta
 
 from django.db import models
 
+from main_app.managers import BookQuerySet, CarQuerySet
+
 
 # Create your models here.
 
@@ -25,6 +27,8 @@ class Book(models.Model):
         Author, on_delete=models.CASCADE,
     )
 
+    objects = BookQuerySet.as_manager()
+
 
 class Song(models.Model):
     title = models.CharField(
@@ -119,6 +123,8 @@ class Car(models.Model):
         null=True,
     )
 
+    objects = CarQuerySet.as_manager()
+
 
 class Registration(models.Model):
     registration_number = models.CharField(
@@ -1,3 +1,203 @@
-from django.test import TestCase
+from concurrent.futures import ThreadPoolExecutor
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection, connections
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+
+from caller import iter_authors_with_their_books, register_car_by_owner, show_all_authors_with_their_books
+from main_app.models import Author, Book, Car, Owner, Registration
+from orm_skeleton.nplusone import NPlusOneError, NPlusOneMiddleware, detect_n_plus_one
+
 
 # Create your tests here.
+class CarAdminChangelistTests(TestCase):
+    url = reverse('admin:main_app_car_changelist')
+
+    # session, user, paginator count, unfiltered count, page of cars
+    QUERIES = 5
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = get_user_model().objects.create_superuser('admin', 'admin@example.com', 'password')
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def create_cars(self, count):
+        start = Car.objects.count()
+        owners = Owner.objects.bulk_create(Owner(name=f"Owner {i}") for i in range(count))
+        cars = Car.objects.bulk_create(
+            Car(model=f"Model {i}", year=2000 + i % 20, owner=owners[i] if i % 3 else None)
+            for i in range(count)
+        )
+        Registration.objects.bulk_create(
+            Registration(registration_number=f"REG{start + i:05}", car=car)
+            for i, car in enumerate(cars) if i % 2
+        )
+
+    def changelist_queries(self, **params):
+        with self.assertNumQueries(self.QUERIES):
+            response = self.client.get(self.url, params)
+
+        self.assertEqual(response.status_code, 200)
+
+        return response
+
+    def test_query_count_does_not_grow_with_the_page(self):
+        self.create_cars(5)
+        self.changelist_queries()
+
+        self.create_cars(95)
+        response = self.changelist_queries()
+
+        self.assertContains(response, "Registration: REG00001")
+        self.assertContains(response, "Owner: No owner")
+
+    def test_sorting_and_filtering_on_related_columns(self):
+        self.create_cars(100)
+
+        self.changelist_queries(o='4')
+        self.changelist_queries(o='-3')
+        self.changelist_queries(owner__isempty='1')
+        self.changelist_queries(q='REG')
+        response = self.changelist_queries(q='Owner 4')
+
+        self.assertContains(response, "Owner: Owner 4,")
+        self.assertNotContains(response, "Owner: Owner 5,")
+
+
+class AuthorsWithTheirBooksReportTests(TestCase):
+    def test_report_streams_from_a_single_query(self):
+        authors = Author.objects.bulk_create(Author(name=f"Author {i}") for i in range(20))
+        Book.objects.bulk_create(
+            Book(title=f"Book {i}", price=10, author=authors[i % 10])
+            for i in range(40)
+        )
+
+        with self.assertNumQueries(1):
+            lines = list(iter_authors_with_their_books())
+
+        self.assertEqual(len(lines), 10)
+        self.assertEqual(lines[0], "Author 0 has written - Book 0, Book 10, Book 20, Book 30!")
+        self.assertEqual(show_all_authors_with_their_books(), '\n'.join(lines))
+
+
+def books_author_by_author():
+    return [list(author.book_set.all()) for author in Author.objects.all()]
+
+
+class NPlusOneDetectionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Author.objects.bulk_create(Author(name=f"Author {i}") for i in range(5))
+
+    def test_repeats_above_the_threshold_are_logged(self):
+        with self.assertLogs('orm_skeleton.nplusone', 'WARNING') as logs:
+            with detect_n_plus_one(threshold=4):
+                books_author_by_author()
+
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn('N+1 queries: 5 identical queries from main_app/tests.py:', logs.output[0])
+
+    def test_repeats_up_to_the_threshold_are_not(self):
+        with self.assertNoLogs('orm_skeleton.nplusone'):
+            with detect_n_plus_one(threshold=5):
+                books_author_by_author()
+
+    @override_settings(N_PLUS_ONE_THRESHOLD=2, N_PLUS_ONE_RAISE=True)
+    def test_raises_from_settings(self):
+        with self.assertLogs('orm_skeleton.nplusone', 'WARNING'), self.assertRaises(NPlusOneError):
+            with detect_n_plus_one() as recorder:
+                books_author_by_author()
+
+        self.assertEqual(sum(recorder.repeated().values()), 3)
+
+    def test_single_query_report_passes(self):
+        with detect_n_plus_one(threshold=1, raise_error=True):
+            show_all_authors_with_their_books()
+
+    @override_settings(DEBUG=True, N_PLUS_ONE_THRESHOLD=4)
+    def test_middleware_reports_the_request_even_when_the_view_fails(self):
+        def view(request):
+            books_author_by_author()
+
+            if request.GET:
+                raise ValueError
+
+            return HttpResponse()
+
+        middleware = NPlusOneMiddleware(view)
+
+        with self.assertLogs('orm_skeleton.nplusone', 'WARNING') as logs:
+            middleware(RequestFactory().get('/authors/'))
+
+        self.assertTrue(logs.output[0].startswith('WARNING:orm_skeleton.nplusone:GET /authors/: 5 identical queries'))
+
+        with self.assertLogs('orm_skeleton.nplusone', 'WARNING'), self.assertRaises(ValueError):
+            middleware(RequestFactory().get('/authors/', {'fail': 1}))
+
+    @override_settings(DEBUG=False)
+    def test_middleware_is_not_used_without_debug(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            NPlusOneMiddleware(HttpResponse)
+
+
+class RegisterCarsToOwnersTests(TestCase):
+    def setUp(self):
+        self.owners = Owner.objects.bulk_create(Owner(name=f"Owner {i}") for i in range(3))
+        Car.objects.bulk_create(Car(model=f"Model {i}", year=2020) for i in range(3))
+        Registration.objects.bulk_create(Registration(registration_number=f"REG{i}") for i in range(3))
+
+    def test_batch_claims_distinct_rows_in_constant_queries(self):
+        # savepoint, two locking SELECTs, two UPDATEs, release
+        with self.assertNumQueries(6):
+            claimed = Car.objects.register_to_owners(self.owners)
+
+        self.assertEqual([car.owner for car, _ in claimed], self.owners)
+        self.assertFalse(Car.objects.filter(owner__isnull=True).exists())
+        self.assertFalse(Registration.objects.filter(car__isnull=True).exists())
+
+    def test_nothing_is_claimed_when_the_batch_cannot_be_served(self):
+        Registration.objects.filter(registration_number="REG2").delete()
+
+        with self.assertRaises(Registration.DoesNotExist):
+            Car.objects.register_to_owners(self.owners)
+
+        self.assertEqual(Car.objects.filter(owner__isnull=True).count(), 3)
+
+    def test_register_car_by_owner(self):
+        self.assertEqual(
+            register_car_by_owner(self.owners[0]),
+            "Successfully registered Model 0 to Owner 0 with registration number REG0.",
+        )
+
+
+@skipUnless(connection.features.has_select_for_update_skip_locked, "needs SELECT ... FOR UPDATE SKIP LOCKED")
+class ConcurrentRegistrationTests(TransactionTestCase):
+    WORKERS = 8
+    CALLS_PER_WORKER = 25
+
+    def test_concurrent_callers_never_share_a_car_or_registration(self):
+        total = self.WORKERS * self.CALLS_PER_WORKER
+        owners = Owner.objects.bulk_create(Owner(name=f"Owner {i}") for i in range(total))
+        Car.objects.bulk_create(Car(model=f"Model {i}", year=2020) for i in range(total))
+        Registration.objects.bulk_create(Registration(registration_number=f"REG{i}") for i in range(total))
+
+        def work(worker_owners):
+            try:
+                for owner in worker_owners:
+                    Car.objects.register_to_owners([owner])
+            finally:
+                connections.close_all()
+
+        with ThreadPoolExecutor(self.WORKERS) as pool:
+            list(pool.map(work, [owners[i::self.WORKERS] for i in range(self.WORKERS)]))
+
+        self.assertFalse(Car.objects.filter(owner__isnull=True).exists())
+        self.assertFalse(Registration.objects.filter(car__isnull=True).exists())
+        self.assertEqual(Car.objects.values('owner').distinct().count(), total)
+        self.assertEqual(Registration.objects.values('car').distinct().count(), total)
@@ -0,0 +1,65 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.postgresql import base, creation
+from django.db.backends.postgresql.psycopg_any import IsolationLevel
+
+from orm_skeleton.pooled_postgresql.pool import close_pools, get_pool
+
+
+class DatabaseCreation(creation.DatabaseCreation):
+    def _destroy_test_db(self, test_database_name, verbosity):
+        # PostgreSQL refuses to drop a database that still has connections,
+        # and the pool keeps them open on purpose.
+        close_pools(dbname=test_database_name)
+        super()._destroy_test_db(test_database_name, verbosity)
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    creation_class = DatabaseCreation
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pool = None
+
+        if self.settings_dict['CONN_MAX_AGE']:
+            # A connection kept by a thread stays checked out of the pool, so
+            # threads that end without closing it would use up the pool.
+            raise ImproperlyConfigured(
+                "orm_skeleton.pooled_postgresql keeps connections open in its pool; "
+                "set CONN_MAX_AGE to 0."
+            )
+
+    def get_connection_params(self):
+        conn_params = super().get_connection_params()
+        conn_params.pop('pool', None)
+
+        return conn_params
+
+    def get_new_connection(self, conn_params):
+        self.pool = get_pool(
+            conn_params,
+            self.settings_dict['OPTIONS'].get('pool', {}),
+            health_checks=self.settings_dict['CONN_HEALTH_CHECKS'],
+        )
+        connection = self.pool.getconn(lambda: super(DatabaseWrapper, self).get_new_connection(conn_params))
+        # Set by the parent class when it opens a connection, which a pooled
+        # checkout may not do.
+        self.isolation_level = IsolationLevel(
+            self.settings_dict['OPTIONS'].get('isolation_level', IsolationLevel.READ_COMMITTED)
+        )
+
+        return connection
+
+    def _close(self):
+        if self.connection is None:
+            return
+
+        with self.wrap_database_errors:
+            if self.in_atomic_block:
+                # Django keeps using this connection object until the atomic
+                # block exits, so it must not be handed to another thread.
+                self.pool.discard(self.connection)
+            else:
+                self.pool.putconn(self.connection)
+
+    def pool_stats(self):
+        return self.pool.stats() if self.pool is not None else None
@@ -1,6 +1,6 @@
 import os
 import django
-from django.db.models import Q, Count, F, Case, When, Value, BooleanField
+from django.db.models import Count
 
 # Set up Django
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "orm_skeleton.settings")
@@ -15,17 +15,15 @@ def get_profiles(search_string=None) -> str:
     if search_string is None:
         return ""
 
-    profiles = Profile.objects.filter(
-        Q(full_name__icontains=search_string) |
-        Q(email__icontains=search_string) |
-        Q(phone_number__icontains=search_string)
-    ).order_by('full_name')
+    profiles = Profile.objects.search(
+        search_string
+    ).with_order_count().order_by('full_name')
 
-    if not profiles.exists():
+    if not profiles:
         return ""
 
     return '\n'.join(
-        f"Profile: {p.full_name}, email: {p.email}, phone number: {p.phone_number}, orders: {p.orders.count()}"
+        f"Profile: {p.full_name}, email: {p.email}, phone number: {p.phone_number}, orders: {p.order_count}"
         for p in profiles
     )
 
@@ -33,11 +31,11 @@ def get_profiles(search_string=None) -> str:
 def get_loyal_profiles() -> str:
     profiles = Profile.objects.get_regular_customers()
 
-    if not profiles.exists():
+    if not profiles:
         return ""
 
     return "\n".join(
-        f"Profile: {p.full_name}, orders: {p.orders.count()}"
+        f"Profile: {p.full_name}, orders: {p.order_count}"
         for p in profiles
     )
 
@@ -70,38 +68,20 @@ def get_top_products() -> str:
 
 
 def apply_discounts() -> str:
-    updated_orders_count = Order.objects.annotate(
-        product_count=Count('products')
-    ).filter(
-        product_count__gt=2,
-        is_completed=False
-    ).update(
-        total_price=F('total_price') * 0.90
-    )
+    updated_orders_count = Order.objects.with_pricing().filter(
+        discount_percent__gt=0,
+    ).reprice()
 
     return f"Discount applied to {updated_orders_count} orders."
 
 
 def complete_order() -> str:
-    order = Order.objects.filter(
-        is_completed=False
-    ).order_by(
-        'creation_date'
-    ).first()
-
-    if not order:
-        return ""
-
-    order.products.update(
-        in_stock=F('in_stock') - 1,
-        is_available=Case(
-            When(in_stock=1, then=Value(False)),
-            default=F('is_available'),
-            output_field=BooleanField()
-        )
-    )
+    # An oversold order is backordered and skipped, so try the next oldest one.
+    while True:
+        completed, rejected = Order.objects.complete_pending(limit=1)
 
-    order.is_completed = True
-    order.save()
+        if completed:
+            return "Order has been completed!"
 
-    return "Order has been completed!"
+        if not rejected:
+            return ""
@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from main_app.models import Profile, Product, Order
+from main_app.models import Profile, Product, Order, StockMovement, DiscountRule
 
 
 @admin.register(Profile)
@@ -18,6 +18,24 @@ class ProductAdmin(admin.ModelAdmin):
 
 @admin.register(Order)
 class OrderAdmin(admin.ModelAdmin):
-    list_display = ['profile', 'total_price', 'creation_date', 'is_completed']
-    list_filter = ['is_completed',]
+    list_display = ['profile', 'total_price', 'creation_date', 'is_completed', 'needs_repricing']
+    list_filter = ['is_completed', 'needs_repricing',]
     search_fields = ['profile__full_name',]
+
+
+@admin.register(DiscountRule)
+class DiscountRuleAdmin(admin.ModelAdmin):
+    list_display = ['min_products', 'percent']
+
+
+@admin.register(StockMovement)
+class StockMovementAdmin(admin.ModelAdmin):
+    list_display = ['product', 'order', 'quantity', 'creation_date']
+    list_select_related = ['product', 'order']
+    search_fields = ['product__name',]
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
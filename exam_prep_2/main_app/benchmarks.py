@@ -0,0 +1,74 @@
+import time
+import tracemalloc
+from itertools import islice
+
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+
+def bulk_create_in_batches(model, objs, batch_size=5000):
+    """
+    bulk_create() over any iterable without materializing it, so seeding a
+    million rows keeps a single batch in memory.
+    """
+    objs = iter(objs)
+
+    while batch := list(islice(objs, batch_size)):
+        model.objects.bulk_create(batch, batch_size=batch_size)
+
+
+def measure(report, *args):
+    # time and query count come from one run and peak memory from another,
+    # each rolled back to a savepoint so reports that write see the same data
+    with transaction.atomic():
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            report(*args)
+            seconds = time.perf_counter() - start
+
+        transaction.set_rollback(True)
+
+    with transaction.atomic():
+        tracemalloc.start()
+
+        try:
+            report(*args)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        transaction.set_rollback(True)
+
+    return {
+        'report': report.__name__,
+        'args': [str(arg) for arg in args],
+        'seconds': round(seconds, 6),
+        'queries': len(queries),
+        'peak_memory_kib': round(peak / 1024, 1),
+    }
+
+
+def run_benchmark(project, seed, reports, scale):
+    """
+    Seeds a synthetic dataset of the given scale and measures every report.
+    Everything is rolled back afterwards.
+    """
+    with transaction.atomic():
+        start = time.perf_counter()
+        report_args = seed(scale)
+        seed_seconds = time.perf_counter() - start
+
+        results = [
+            measure(report, *report_args.get(report.__name__, ()))
+            for report in reports
+        ]
+
+        transaction.set_rollback(True)
+
+    return {
+        'project': project,
+        'database': connection.vendor,
+        'scale': scale,
+        'seed_seconds': round(seed_seconds, 3),
+        'results': results,
+    }
@@ -0,0 +1,62 @@
+import random
+from decimal import Decimal
+
+from main_app.benchmarks import bulk_create_in_batches
+from main_app.models import Order, Product, Profile
+
+PRODUCTS_PER_ORDER = 3
+
+
+def profile_factory(i):
+    return Profile(
+        full_name=f'Customer {i:07}',
+        email=f'customer{i}@example.com',
+        phone_number=f'0888{i:07}',
+        address=f'{i} Main Street',
+    )
+
+
+def product_factory(i, rng):
+    return Product(
+        name=f'Product {i:06}',
+        description='Synthetic product',
+        price=Decimal(rng.randint(100, 100_000)) / 100,
+        in_stock=rng.randint(0, 50),
+    )
+
+
+def order_factory(profile_id, rng):
+    return Order(
+        profile_id=profile_id,
+        total_price=Decimal(rng.randint(100, 1_000_000)) / 100,
+        is_completed=rng.random() < 0.5,
+    )
+
+
+def seed(scale):
+    """
+    scale profiles with two orders each on average, three products per order
+    and one product per ten profiles.
+    """
+    rng = random.Random(scale)
+
+    bulk_create_in_batches(Profile, (profile_factory(i) for i in range(scale)))
+    bulk_create_in_batches(Product, (product_factory(i, rng) for i in range(max(scale // 10, PRODUCTS_PER_ORDER))))
+
+    profile_ids = list(Profile.objects.values_list('pk', flat=True))
+    product_ids = list(Product.objects.values_list('pk', flat=True))
+
+    bulk_create_in_batches(Order, (order_factory(rng.choice(profile_ids), rng) for _ in range(scale * 2)))
+
+    bulk_create_in_batches(
+        Order.products.through,
+        (
+            Order.products.through(order_id=order_id, product_id=product_id)
+            for order_id in Order.objects.values_list('pk', flat=True).iterator()
+            for product_id in rng.sample(product_ids, PRODUCTS_PER_ORDER)
+        ),
+    )
+
+    return {
+        'get_profiles': ('Customer 00001',),
+    }
@@ -0,0 +1,139 @@
+import json
+import random
+import threading
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.test.utils import setup_databases, teardown_databases
+
+from main_app.benchmarks import bulk_create_in_batches
+from main_app.factories import PRODUCTS_PER_ORDER
+from main_app.models import Order, Product, Profile
+from orm_skeleton.pooled_postgresql.pool import DEFAULTS as POOL_DEFAULTS
+
+
+def seed_pending_orders(orders, products, rng):
+    profile = Profile.objects.create(
+        full_name='Benchmark Customer',
+        email='benchmark@example.com',
+        phone_number='0888000000',
+        address='1 Main Street',
+    )
+    bulk_create_in_batches(Product, (
+        Product(
+            name=f'Product {i:06}',
+            description='Synthetic product',
+            price=Decimal('9.99'),
+            in_stock=orders * PRODUCTS_PER_ORDER,
+        )
+        for i in range(products)
+    ))
+    product_ids = list(Product.objects.filter(in_stock__gt=0).values_list('pk', flat=True))
+
+    bulk_create_in_batches(Order, (Order(profile=profile, total_price=Decimal('29.97')) for _ in range(orders)))
+    bulk_create_in_batches(Order.products.through, (
+        Order.products.through(order_id=order_id, product_id=product_id)
+        for order_id in Order.objects.filter(is_completed=False).values_list('pk', flat=True).iterator()
+        for product_id in rng.sample(product_ids, PRODUCTS_PER_ORDER)
+    ))
+
+
+def size_pool(completers):
+    """
+    Raises the pool's max_size so every completer thread, plus the main
+    thread seeding the orders, has a connection of its own. Otherwise the
+    surplus threads queue on the pool, or fail with PoolTimeout, and the run
+    measures pool waits instead of SKIP LOCKED contention. Returns max_size,
+    or None when the database isn't pooled.
+    """
+    options = connections['default'].settings_dict['OPTIONS']
+
+    if 'pool' not in options:
+        return None
+
+    # OPTIONS is shared by the connections of every thread; the pool is
+    # created with these options on the first connection to the test database.
+    pool = options['pool'] = {**options['pool']}
+    pool['max_size'] = max(pool.get('max_size', POOL_DEFAULTS['max_size']), completers + 1)
+
+    return pool['max_size']
+
+
+def run_completers(completers, batch_size):
+    counts = []
+    errors = []
+
+    def work():
+        completed = 0
+
+        try:
+            while True:
+                done, rejected = Order.objects.complete_pending(limit=batch_size)
+
+                if not done and not rejected:
+                    break
+
+                completed += len(done)
+        except Exception as error:
+            errors.append(repr(error))
+        finally:
+            counts.append(completed)
+            connections.close_all()
+
+    threads = [threading.Thread(target=work) for _ in range(completers)]
+    start = time.perf_counter()
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    return sum(counts), time.perf_counter() - start, errors
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures Order.objects.complete_pending() throughput with 1, 8 and 32 concurrent completers "
+        "on a throwaway test database and prints the results as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--orders', type=int, default=10000, help="Pending orders seeded for every run.")
+        parser.add_argument('--products', type=int, default=100, help="Products the orders are spread over.")
+        parser.add_argument('--batch-size', type=int, default=100, help="Orders completed per transaction.")
+        parser.add_argument('--completers', type=int, nargs='+', default=[1, 8, 32])
+
+    def handle(self, *args, **options):
+        pool_size = size_pool(max(options['completers']))
+        old_config = setup_databases(verbosity=0, interactive=False)
+        rng = random.Random(options['orders'])
+        results = []
+
+        try:
+            for completers in options['completers']:
+                seed_pending_orders(options['orders'], options['products'], rng)
+                completed, seconds, errors = run_completers(completers, options['batch_size'])
+
+                results.append({
+                    'completers': completers,
+                    'completed_orders': completed,
+                    'seconds': round(seconds, 3),
+                    'orders_per_second': round(completed / seconds, 1) if seconds else None,
+                    'errors': errors,
+                })
+        finally:
+            connections.close_all()
+            teardown_databases(old_config, verbosity=0)
+
+        self.stdout.write(json.dumps({
+            'project': 'exam_prep_2',
+            'vendor': connections['default'].vendor,
+            'orders': options['orders'],
+            'products': options['products'],
+            'batch_size': options['batch_size'],
+            'pool_max_size': pool_size,
+            'runs': results,
+        }, indent=2))
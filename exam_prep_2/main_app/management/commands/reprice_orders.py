@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from main_app.models import Order
+
+
+class Command(BaseCommand):
+    help = "Recomputes the totals of open orders that need repricing."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help="Reprice every open order, not only the invalidated ones.")
+
+    def handle(self, *args, **options):
+        orders = Order.objects.all() if options['all'] else Order.objects.filter(needs_repricing=True)
+        repriced = orders.reprice()
+
+        self.stdout.write(self.style.SUCCESS(f"Repriced {repriced} orders."))
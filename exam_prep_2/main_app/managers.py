@@ -1,12 +1,183 @@
-from django.db import models
-from django.db.models import Count
+from django.db import models, transaction
+from django.db.models import Count, F
 
+from main_app.search import TrigramSearchMixin
 
-class GetRegularCustomersManager(models.Manager):
-    def get_regular_customers(self):
+
+class ProfileQuerySet(TrigramSearchMixin, models.QuerySet):
+    def search(self, search_string):
+        return self.search_any(search_string, 'full_name', 'email', 'phone_number')
+
+    def with_order_count(self):
         return self.annotate(
             order_count=Count('orders')
+        )
+
+    def get_regular_customers(self):
+        return self.with_order_count(
         ).filter(order_count__gt=2
                  ).order_by(
             '-order_count'
         )
+
+
+class StockMovementQuerySet(models.QuerySet):
+    def update(self, **kwargs):
+        raise TypeError("Stock movements are append-only.")
+
+    def delete(self):
+        raise TypeError("Stock movements are append-only.")
+
+
+class OrderQuerySet(models.QuerySet):
+    def complete_pending(self, limit=None):
+        """
+        Completes up to limit pending orders, oldest first, in one transaction
+        and returns (completed order ids, rejected order ids).
+
+        Pending orders are claimed with SKIP LOCKED so concurrent completers
+        work on different orders, and their products are locked in primary key
+        order so two completers can never deadlock on them. An order is
+        rejected when one of its products is out of stock: it stays pending but
+        is marked backordered, so later calls move on to newer orders instead
+        of claiming it again, until a restock releases it. Every unit taken is
+        written to the stock movement ledger. The batch runs a fixed number of
+        queries however many orders it holds.
+        """
+        from main_app.models import Product, StockMovement
+
+        with transaction.atomic(using=self.db):
+            order_ids = list(
+                self
+                .filter(is_completed=False, is_backordered=False)
+                .order_by('creation_date', 'id')
+                .select_for_update(skip_locked=True)
+                .values_list('id', flat=True)[:limit]
+            )
+
+            if not order_ids:
+                return [], []
+
+            lines = list(
+                self.model.products.through.objects
+                .using(self.db)
+                .filter(order_id__in=order_ids)
+                .values_list('order_id', 'product_id')
+            )
+            products_by_order = {order_id: [] for order_id in order_ids}
+
+            for order_id, product_id in lines:
+                products_by_order[order_id].append(product_id)
+
+            products = {
+                product.pk: product
+                for product in Product.objects
+                .using(self.db)
+                .filter(pk__in={product_id for _, product_id in lines})
+                .order_by('pk')
+                .select_for_update()
+                .only('in_stock', 'is_available')
+            }
+
+            completed, rejected, movements = [], [], []
+
+            for order_id in order_ids:
+                ordered = [products[product_id] for product_id in products_by_order[order_id]]
+
+                if any(product.in_stock < 1 for product in ordered):
+                    rejected.append(order_id)
+                    continue
+
+                for product in ordered:
+                    product.in_stock -= 1
+                    product.is_available = product.is_available and product.in_stock > 0
+                    movements.append(StockMovement(product=product, order_id=order_id, quantity=-1))
+
+                completed.append(order_id)
+
+            if rejected:
+                self.model.objects.using(self.db).filter(pk__in=rejected).update(is_backordered=True)
+
+            if completed:
+                moved = {movement.product_id for movement in movements}
+
+                Product.objects.using(self.db).bulk_update(
+                    [products[product_id] for product_id in sorted(moved)],
+                    ['in_stock', 'is_available'],
+                )
+                StockMovement.objects.using(self.db).bulk_create(movements)
+                self.model.objects.using(self.db).filter(pk__in=completed).update(is_completed=True)
+
+        return completed, rejected
+
+    def open(self):
+        return self.filter(is_completed=False)
+
+    def release_backorders(self):
+        """Makes backordered open orders claimable by complete_pending() again."""
+        return self.open().filter(is_backordered=True).update(is_backordered=False)
+
+    def containing(self, products):
+        """
+        Orders that hold any of the given products (ids or a Product queryset).
+        """
+        return self.filter(pk__in=self.model.products.through.objects.filter(
+            product_id__in=products,
+        ).values('order_id'))
+
+    def mark_for_repricing(self):
+        return self.open().update(needs_repricing=True)
+
+    def with_pricing(self):
+        from main_app.pricing import order_discount_percent, order_product_count, order_subtotal, order_total
+
+        return self.annotate(
+            product_count=order_product_count(),
+            subtotal=order_subtotal(),
+            discount_percent=order_discount_percent(),
+            computed_total=order_total(),
+        )
+
+    def reprice(self):
+        """
+        Recomputes total_price of the open orders in one UPDATE: the sum of
+        their product prices less the best matching discount rule.
+        """
+        from main_app.pricing import order_total
+
+        return self.open().update(total_price=order_total(), needs_repricing=False)
+
+    def reprice_dirty(self):
+        return self.filter(needs_repricing=True).reprice()
+
+
+class ProductQuerySet(models.QuerySet):
+    def restock(self, quantity):
+        """
+        Adds quantity units of every product, records them in the stock
+        movement ledger and releases the backordered orders holding them.
+        """
+        from main_app.models import Order, StockMovement
+
+        with transaction.atomic(using=self.db):
+            product_ids = list(self.values_list('pk', flat=True))
+            restocked = self.model.objects.using(self.db).filter(pk__in=product_ids)
+
+            restocked.update(in_stock=F('in_stock') + quantity, is_available=True)
+            StockMovement.objects.using(self.db).bulk_create(
+                StockMovement(product_id=product_id, quantity=quantity) for product_id in product_ids
+            )
+            Order.objects.using(self.db).containing(product_ids).release_backorders()
+
+        return len(product_ids)
+
+    def update(self, **kwargs):
+        if 'price' not in kwargs:
+            return super().update(**kwargs)
+
+        from main_app.models import Order
+
+        with transaction.atomic(using=self.db):
+            Order.objects.using(self.db).containing(self.values('pk')).mark_for_repricing()
+
+            return super().update(**kwargs)
@@ -0,0 +1,30 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+from main_app.search import AddTrigramIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_app', '0002_remove_order_product_order_products_and_more'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddTrigramIndex(
+            model_name='profile',
+            field_name='full_name',
+            name='profile_full_name_trgm',
+        ),
+        AddTrigramIndex(
+            model_name='profile',
+            field_name='email',
+            name='profile_email_trgm',
+        ),
+        AddTrigramIndex(
+            model_name='profile',
+            field_name='phone_number',
+            name='profile_phone_trgm',
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.0.4 on 2026-10-18 17:41
+
+import django.core.validators
+from django.db import migrations, models
+
+
+def add_default_rule(apps, schema_editor):
+    DiscountRule = apps.get_model('main_app', 'DiscountRule')
+    Order = apps.get_model('main_app', 'Order')
+
+    # the flat 10% that apply_discounts() gave orders with more than 2 products
+    DiscountRule.objects.create(min_products=3, percent=10)
+    Order.objects.filter(is_completed=True).update(needs_repricing=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_app', '0004_stockmovement'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DiscountRule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('min_products', models.PositiveIntegerField(unique=True)),
+                ('percent', models.PositiveIntegerField(validators=[django.core.validators.MaxValueValidator(100)])),
+            ],
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='needs_repricing',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(condition=models.Q(('is_completed', False), ('needs_repricing', True)), fields=['needs_repricing'], name='order_needs_repricing_idx'),
+        ),
+        migrations.RunPython(add_default_rule, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.4 on 2026-10-18 18:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_app', '0005_order_pricing'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='is_backordered',
+            field=models.BooleanField(default=False),
+        ),
+    ]
@@ -1,7 +1,7 @@
 from django.db import models
-from django.core.validators import MinLengthValidator, MinValueValidator
+from django.core.validators import MinLengthValidator, MinValueValidator, MaxValueValidator
 
-from main_app.managers import GetRegularCustomersManager
+from main_app.managers import OrderQuerySet, ProductQuerySet, ProfileQuerySet, StockMovementQuerySet
 
 
 class DateTime(models.Model):
@@ -32,7 +32,7 @@ class Profile(DateTime):
         default=True,
     )
 
-    objects = GetRegularCustomersManager()
+    objects = ProfileQuerySet.as_manager()
 
 
 class Product(DateTime):
@@ -55,6 +55,19 @@ class Product(DateTime):
         default=True,
     )
 
+    objects = ProductQuerySet.as_manager()
+
+
+class DiscountRule(models.Model):
+    min_products = models.PositiveIntegerField(
+        unique=True,
+    )
+
+    percent = models.PositiveIntegerField(
+        validators=[
+            MaxValueValidator(100),]
+    )
+
 
 class Order(DateTime):
     profile = models.ForeignKey(
@@ -77,3 +90,53 @@ class Order(DateTime):
     is_completed = models.BooleanField(
         default=False,
     )
+
+    # Set when completing the order found a product out of stock; such orders
+    # are skipped until one of their products is restocked.
+    is_backordered = models.BooleanField(
+        default=False,
+    )
+
+    needs_repricing = models.BooleanField(
+        default=True,
+    )
+
+    objects = OrderQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['needs_repricing'],
+                condition=models.Q(needs_repricing=True, is_completed=False),
+                name='order_needs_repricing_idx',
+            ),
+        ]
+
+
+class StockMovement(DateTime):
+    product = models.ForeignKey(
+        to=Product,
+        on_delete=models.PROTECT,
+        related_name="stock_movements",
+    )
+
+    order = models.ForeignKey(
+        to=Order,
+        on_delete=models.SET_NULL,
+        related_name="stock_movements",
+        null=True,
+        blank=True,
+    )
+
+    quantity = models.IntegerField()
+
+    objects = StockMovementQuerySet.as_manager()
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise TypeError("Stock movements are append-only.")
+
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        raise TypeError("Stock movements are append-only.")
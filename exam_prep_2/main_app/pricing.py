@@ -0,0 +1,48 @@
+from decimal import Decimal
+
+from django.db import models
+from django.db.models import Count, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce, Round
+
+from main_app.models import DiscountRule, Order
+
+OrderProduct = Order.products.through
+
+
+def _order_lines(order_ref):
+    return OrderProduct.objects.filter(order_id=order_ref).values('order_id')
+
+
+def order_product_count(order_ref=None):
+    return Coalesce(
+        Subquery(_order_lines(order_ref or OuterRef('pk')).annotate(count=Count('*')).values('count')),
+        0,
+    )
+
+
+def order_subtotal(order_ref=None):
+    return Coalesce(
+        Subquery(_order_lines(order_ref or OuterRef('pk')).annotate(subtotal=Sum('product__price')).values('subtotal')),
+        Value(Decimal('0.00')),
+        output_field=models.DecimalField(max_digits=10, decimal_places=2),
+    )
+
+
+def order_discount_percent():
+    # the best rule whose threshold the order reaches
+    return Coalesce(
+        Subquery(
+            DiscountRule.objects.filter(
+                min_products__lte=order_product_count(OuterRef(OuterRef('pk'))),
+            ).order_by('-percent').values('percent')[:1]
+        ),
+        0,
+    )
+
+
+def order_total():
+    return Round(
+        order_subtotal() * (100 - order_discount_percent()) * Value(Decimal('0.01')),
+        2,
+        output_field=models.DecimalField(max_digits=10, decimal_places=2),
+    )
@@ -0,0 +1,47 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from main_app.models import DiscountRule, Order, Product
+
+OrderProduct = Order.products.through
+
+
+@receiver(pre_save, sender=Product)
+def remember_product_price(sender, instance, **kwargs):
+    instance._previous_price, instance._previous_stock = (None, None) if instance._state.adding else (
+        Product.objects.filter(pk=instance.pk).values_list('price', 'in_stock').first() or (None, None)
+    )
+
+
+@receiver(post_save, sender=Product)
+def invalidate_orders_on_price_change(sender, instance, created, **kwargs):
+    previous_price = instance.__dict__.pop('_previous_price', None)
+
+    if not created and previous_price != instance.price:
+        Order.objects.containing([instance.pk]).mark_for_repricing()
+
+
+@receiver(post_save, sender=Product)
+def release_backorders_on_restock(sender, instance, created, **kwargs):
+    previous_stock = instance.__dict__.pop('_previous_stock', None)
+
+    if not created and previous_stock is not None and instance.in_stock > previous_stock:
+        Order.objects.containing([instance.pk]).release_backorders()
+
+
+@receiver(m2m_changed, sender=OrderProduct)
+def invalidate_orders_on_line_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            Order.objects.filter(pk=instance.pk).mark_for_repricing()
+
+    elif action in ('post_add', 'post_remove') and pk_set:
+        Order.objects.filter(pk__in=pk_set).mark_for_repricing()
+
+    elif action == 'pre_clear':
+        Order.objects.containing([instance.pk]).mark_for_repricing()
+
+
+@receiver([post_save, post_delete], sender=DiscountRule)
+def invalidate_orders_on_rule_change(sender, **kwargs):
+    Order.objects.mark_for_repricing()
@@ -1,3 +1,298 @@
-from django.test import TestCase
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from unittest import skipUnless
 
-# Create your tests here.
+from django.db import connection, connections
+from django.test import TestCase, TransactionTestCase
+
+from caller import apply_discounts, complete_order, get_profiles, get_loyal_profiles
+from main_app.models import Profile, Product, Order, StockMovement
+
+
+class ProfileReportQueriesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        product = Product.objects.create(
+            name='Laptop',
+            description='A laptop',
+            price=1000,
+            in_stock=10,
+        )
+
+        for i in range(10):
+            profile = Profile.objects.create(
+                full_name=f'Customer {i}',
+                email=f'customer{i}@example.com',
+                phone_number=f'0888{i:06}',
+                address='Sofia',
+            )
+
+            for _ in range(3 + i % 2):
+                order = Order.objects.create(profile=profile, total_price=1000)
+                order.products.add(product)
+
+    def test_get_profiles_runs_a_single_query(self):
+        with self.assertNumQueries(1):
+            result = get_profiles('Customer')
+
+        self.assertEqual(len(result.splitlines()), 10)
+        self.assertIn('Profile: Customer 1, email: customer1@example.com, '
+                      'phone number: 0888000001, orders: 4', result)
+
+    def test_get_loyal_profiles_runs_a_single_query(self):
+        with self.assertNumQueries(1):
+            result = get_loyal_profiles()
+
+        self.assertEqual(len(result.splitlines()), 10)
+        self.assertTrue(result.startswith('Profile: Customer 1, orders: 4'))
+
+    def test_query_count_does_not_grow_with_result_size(self):
+        with self.assertNumQueries(1):
+            get_profiles('Customer 1')
+
+        with self.assertNumQueries(1):
+            get_profiles('Customer')
+
+    def test_get_profiles_without_matches_returns_empty_string(self):
+        self.assertEqual(get_profiles('Nobody'), '')
+
+
+class ProfileSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for full_name, email, phone_number in (
+            ('Anna Smith', 'anna@example.com', '0888111111'),
+            ('Boris Jones', 'boris@mail.org', '0899222222'),
+        ):
+            Profile.objects.create(full_name=full_name, email=email, phone_number=phone_number, address='Sofia')
+
+    def found(self, search_string):
+        return [line.split(',')[0] for line in get_profiles(search_string).splitlines()]
+
+    def test_matches_each_field_case_insensitively(self):
+        self.assertEqual(self.found('SMITH'), ['Profile: Anna Smith'])
+        self.assertEqual(self.found('mail.org'), ['Profile: Boris Jones'])
+        self.assertEqual(self.found('0899'), ['Profile: Boris Jones'])
+
+    def test_no_match_returns_empty_string(self):
+        self.assertEqual(get_profiles('Nobody'), '')
+
+    def test_empty_string_matches_every_profile(self):
+        self.assertEqual(self.found(''), ['Profile: Anna Smith', 'Profile: Boris Jones'])
+
+    @skipUnless(connection.vendor == 'postgresql', "trigram indexes are only created on PostgreSQL")
+    def test_migrations_create_the_trigram_indexes(self):
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, Profile._meta.db_table)
+
+        for name in ('profile_full_name_trgm', 'profile_email_trgm', 'profile_phone_trgm'):
+            self.assertEqual(constraints[name]['type'], 'gin')
+
+
+class CompletePendingOrdersTests(TestCase):
+    def setUp(self):
+        self.profile = Profile.objects.create(
+            full_name='Customer',
+            email='customer@example.com',
+            phone_number='0888000000',
+            address='Sofia',
+        )
+        self.laptop = Product.objects.create(name='Laptop', description='A laptop', price=1000, in_stock=2)
+        self.mouse = Product.objects.create(name='Mouse', description='A mouse', price=20, in_stock=10)
+
+    def create_orders(self, count, *products):
+        orders = []
+
+        for _ in range(count):
+            order = Order.objects.create(profile=self.profile, total_price=1000)
+            order.products.add(*products)
+            orders.append(order)
+
+        return orders
+
+    def test_oversold_orders_are_rejected_and_left_pending(self):
+        orders = self.create_orders(3, self.laptop, self.mouse)
+
+        completed, rejected = Order.objects.complete_pending()
+
+        self.assertEqual(completed, [orders[0].pk, orders[1].pk])
+        self.assertEqual(rejected, [orders[2].pk])
+        self.assertFalse(Order.objects.get(pk=orders[2].pk).is_completed)
+        self.assertTrue(Order.objects.get(pk=orders[2].pk).is_backordered)
+        self.assertEqual(Order.objects.complete_pending(), ([], []))
+
+        self.laptop.refresh_from_db()
+        self.mouse.refresh_from_db()
+        self.assertEqual((self.laptop.in_stock, self.laptop.is_available), (0, False))
+        self.assertEqual((self.mouse.in_stock, self.mouse.is_available), (8, True))
+
+    def test_every_unit_is_written_to_the_ledger(self):
+        self.create_orders(2, self.laptop, self.mouse)
+
+        Order.objects.complete_pending()
+
+        self.assertEqual(StockMovement.objects.count(), 4)
+        self.assertEqual(
+            sum(self.laptop.stock_movements.values_list('quantity', flat=True)),
+            -2,
+        )
+
+        with self.assertRaises(TypeError):
+            StockMovement.objects.all().delete()
+
+        with self.assertRaises(TypeError):
+            StockMovement.objects.first().save()
+
+    def test_query_count_does_not_grow_with_the_batch(self):
+        self.mouse.in_stock = 100
+        self.mouse.save()
+        self.create_orders(2, self.mouse)
+
+        # savepoint, pending orders, order lines, products, stock, ledger, orders, release
+        with self.assertNumQueries(8):
+            Order.objects.complete_pending()
+
+        self.create_orders(20, self.mouse)
+
+        with self.assertNumQueries(8):
+            Order.objects.complete_pending()
+
+    def test_oversold_oldest_order_does_not_block_newer_ones(self):
+        self.laptop.in_stock = 0
+        self.laptop.save()
+        oversold = self.create_orders(1, self.laptop)[0]
+        first, second = self.create_orders(2, self.mouse)
+
+        self.assertEqual(complete_order(), "Order has been completed!")
+        self.assertEqual(complete_order(), "Order has been completed!")
+        self.assertEqual(complete_order(), "")
+
+        self.assertTrue(Order.objects.get(pk=first.pk).is_completed)
+        self.assertTrue(Order.objects.get(pk=second.pk).is_completed)
+        self.assertFalse(Order.objects.get(pk=oversold.pk).is_completed)
+
+    def test_restock_releases_backordered_orders(self):
+        self.laptop.in_stock = 0
+        self.laptop.save()
+        order = self.create_orders(1, self.laptop, self.mouse)[0]
+        Order.objects.complete_pending()
+
+        Product.objects.filter(pk=self.laptop.pk).restock(1)
+
+        self.assertFalse(Order.objects.get(pk=order.pk).is_backordered)
+        self.assertEqual(Order.objects.complete_pending(), ([order.pk], []))
+        self.assertEqual(self.laptop.stock_movements.count(), 2)
+
+    def test_complete_order_completes_the_oldest_pending_order(self):
+        first, second = self.create_orders(2, self.mouse)
+
+        self.assertEqual(complete_order(), "Order has been completed!")
+        self.assertTrue(Order.objects.get(pk=first.pk).is_completed)
+        self.assertFalse(Order.objects.get(pk=second.pk).is_completed)
+
+
+@skipUnless(connection.features.has_select_for_update_skip_locked, "needs SELECT ... FOR UPDATE SKIP LOCKED")
+class ConcurrentCompletersTests(TransactionTestCase):
+    def test_concurrent_completers_never_oversell_or_complete_twice(self):
+        profile = Profile.objects.create(
+            full_name='Customer', email='customer@example.com', phone_number='0888000000', address='Sofia',
+        )
+        product = Product.objects.create(name='Laptop', description='A laptop', price=1000, in_stock=30)
+
+        for _ in range(40):
+            Order.objects.create(profile=profile, total_price=1000).products.add(product)
+
+        def work(_):
+            completed = []
+
+            try:
+                while True:
+                    done, rejected = Order.objects.complete_pending(limit=3)
+
+                    if not done and not rejected:
+                        return completed
+
+                    completed.extend(done)
+            finally:
+                connections.close_all()
+
+        with ThreadPoolExecutor(2) as pool:
+            first, second = pool.map(work, range(2))
+
+        product.refresh_from_db()
+        self.assertFalse(set(first) & set(second))
+        self.assertEqual(len(first) + len(second), 30)
+        self.assertEqual(product.in_stock, 0)
+        self.assertEqual(Order.objects.filter(is_completed=True).count(), 30)
+        self.assertEqual(Order.objects.filter(is_backordered=True).count(), 10)
+
+
+class OrderPricingTests(TestCase):
+    def setUp(self):
+        profile = Profile.objects.create(
+            full_name='Customer',
+            email='customer@example.com',
+            phone_number='0888000000',
+            address='Sofia',
+        )
+        self.laptop, self.mouse, self.bag = (
+            Product.objects.create(name=name, description=name, price=price, in_stock=10)
+            for name, price in (('Laptop', Decimal('1000.00')), ('Mouse', Decimal('20.50')), ('Bag', Decimal('30.00')))
+        )
+
+        self.small = Order.objects.create(profile=profile, total_price=1)
+        self.small.products.add(self.laptop, self.mouse)
+
+        self.large = Order.objects.create(profile=profile, total_price=1)
+        self.large.products.add(self.laptop, self.mouse, self.bag)
+
+        self.completed = Order.objects.create(profile=profile, total_price=1, is_completed=True)
+        self.completed.products.add(self.bag)
+
+        self.unrelated = Order.objects.create(profile=profile, total_price=1)
+        self.unrelated.products.add(self.bag)
+
+    def totals(self):
+        return {
+            order.pk: order.total_price
+            for order in Order.objects.all()
+        }
+
+    def test_totals_are_derived_from_line_items_and_rules(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(Order.objects.reprice_dirty(), 3)
+
+        totals = self.totals()
+        self.assertEqual(totals[self.small.pk], Decimal('1020.50'))
+        self.assertEqual(totals[self.large.pk], Decimal('945.45'))
+        self.assertEqual(totals[self.unrelated.pk], Decimal('30.00'))
+        self.assertEqual(totals[self.completed.pk], Decimal('1.00'))
+        self.assertFalse(Order.objects.open().filter(needs_repricing=True).exists())
+
+    def test_price_change_only_invalidates_affected_open_orders(self):
+        Order.objects.reprice_dirty()
+
+        self.mouse.price = Decimal('10.50')
+        self.mouse.save()
+
+        self.assertEqual(
+            set(Order.objects.open().filter(needs_repricing=True).values_list('pk', flat=True)),
+            {self.small.pk, self.large.pk},
+        )
+        self.assertEqual(Order.objects.reprice_dirty(), 2)
+        self.assertEqual(self.totals()[self.large.pk], Decimal('936.45'))
+
+    def test_queryset_price_update_invalidates_orders(self):
+        Order.objects.reprice_dirty()
+
+        Product.objects.filter(pk=self.bag.pk).update(price=Decimal('40.00'))
+
+        self.assertEqual(
+            set(Order.objects.open().filter(needs_repricing=True).values_list('pk', flat=True)),
+            {self.large.pk, self.unrelated.pk},
+        )
+
+    def test_apply_discounts_is_idempotent(self):
+        self.assertEqual(apply_discounts(), "Discount applied to 1 orders.")
+        self.assertEqual(apply_discounts(), "Discount applied to 1 orders.")
+        self.assertEqual(self.totals()[self.large.pk], Decimal('945.45'))
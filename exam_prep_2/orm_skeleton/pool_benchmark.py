@@ -0,0 +1,131 @@
+"""
+Measures per-request database latency with and without connection pooling.
+
+Every simulated request does what a Django request does around its queries:
+close_if_unusable_or_obsolete() on request start and finish, with one
+SELECT 1 in between. Each mode uses its own copy of the "default" database
+settings:
+
+    direct      django.db.backends.postgresql, CONN_MAX_AGE = 0: connect and
+                authenticate on every request
+    persistent  django.db.backends.postgresql, CONN_MAX_AGE = 60: one
+                connection kept per worker thread
+    pooled      orm_skeleton.pooled_postgresql as configured in settings.py
+
+Run it against a local PostgreSQL from the project directory:
+
+    python -m orm_skeleton.pool_benchmark --requests 2000 --threads 1 8 32
+"""
+import argparse
+import json
+import os
+import statistics
+import threading
+import time
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "orm_skeleton.settings")
+django.setup()
+
+from django.db import connections  # noqa: E402
+from django.db.utils import load_backend  # noqa: E402
+
+from orm_skeleton.pooled_postgresql import pool  # noqa: E402
+
+POOLED_ENGINE = 'orm_skeleton.pooled_postgresql'
+PLAIN_ENGINE = 'django.db.backends.postgresql'
+
+
+def settings_for(mode):
+    default = connections['default'].settings_dict
+    settings_dict = {**default, 'OPTIONS': dict(default['OPTIONS'])}
+
+    if mode == 'pooled':
+        return {**settings_dict, 'ENGINE': POOLED_ENGINE, 'CONN_MAX_AGE': 0}
+
+    settings_dict['OPTIONS'].pop('pool', None)
+
+    return {**settings_dict, 'ENGINE': PLAIN_ENGINE, 'CONN_MAX_AGE': 60 if mode == 'persistent' else 0}
+
+
+def run(mode, requests, threads):
+    settings_dict = settings_for(mode)
+    backend = load_backend(settings_dict['ENGINE'])
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+    per_thread = [requests // threads + (i < requests % threads) for i in range(threads)]
+
+    def work(count):
+        connection = backend.DatabaseWrapper(dict(settings_dict), alias=f'benchmark_{mode}')
+        timings = []
+
+        try:
+            for _ in range(count):
+                start = time.perf_counter()
+                connection.close_if_unusable_or_obsolete()
+
+                with connection.cursor() as cursor:
+                    cursor.execute('SELECT 1')
+                    cursor.fetchone()
+
+                connection.close_if_unusable_or_obsolete()
+                timings.append(time.perf_counter() - start)
+        except Exception as error:
+            errors.append(repr(error))
+        finally:
+            connection.close()
+
+            with lock:
+                latencies.extend(timings)
+
+    workers = [threading.Thread(target=work, args=(count,)) for count in per_thread]
+    start = time.perf_counter()
+
+    for worker in workers:
+        worker.start()
+
+    for worker in workers:
+        worker.join()
+
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+
+    def percentile(p):
+        return round(latencies[min(int(len(latencies) * p), len(latencies) - 1)] * 1000, 3) if latencies else None
+
+    return {
+        'mode': mode,
+        'threads': threads,
+        'requests': len(latencies),
+        'seconds': round(elapsed, 3),
+        'requests_per_second': round(len(latencies) / elapsed, 1) if elapsed else None,
+        'mean_ms': round(statistics.fmean(latencies) * 1000, 3) if latencies else None,
+        'p50_ms': percentile(0.50),
+        'p95_ms': percentile(0.95),
+        'p99_ms': percentile(0.99),
+        'errors': errors,
+        'pool': pool.stats() if mode == 'pooled' else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--requests', type=int, default=1000, help="Requests per run, spread over the threads.")
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 8])
+    parser.add_argument('--modes', nargs='+', choices=('direct', 'persistent', 'pooled'), default=['direct', 'persistent', 'pooled'])
+    args = parser.parse_args()
+
+    results = []
+
+    for threads in args.threads:
+        for mode in args.modes:
+            results.append(run(mode, args.requests, threads))
+            pool.close_pools()
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,7 @@
 import os
 import django
 from django.core.exceptions import ObjectDoesNotExist
-from django.db.models import Q, Count, Avg
+from django.db.models import Count
 
 # Set up Django
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "orm_skeleton.settings")
@@ -9,24 +9,19 @@ django.setup()
 
 # Import your models here
 from main_app.models import *
+from main_app.report_cache import cached_report
 
 
 # Create queries within functions
+@cached_report(Author)
 def get_authors(search_name=None, search_email=None) -> str:
     if search_name is None and search_email is None:
         return ""
 
-    query_name = Q(full_name__icontains=search_name) if search_name else None
-    query_email = Q(email__icontains=search_email) if search_email else None
-
-    if query_name and query_email:
-        query = query_name & query_email
-    elif query_name:
-        query = query_name
-    else:
-        query = query_email
-
-    authors = Author.objects.filter(query).order_by('-full_name')
+    authors = Author.objects.search(
+        full_name=search_name,
+        email=search_email,
+    ).order_by('-full_name')
 
     if not authors.exists():
         return ""
@@ -42,6 +37,7 @@ def get_authors(search_name=None, search_email=None) -> str:
     return result
 
 
+@cached_report(Author, Article)
 def get_top_publisher() -> str:
     author = Author.objects.get_authors_by_article_count().first()
 
@@ -51,6 +47,7 @@ def get_top_publisher() -> str:
     return f"Top Author: {author.full_name} with {author.article_count} published articles."
 
 
+@cached_report(Author, Review)
 def get_top_reviewer() -> str:
     authors = Author.objects.annotate(
         review_count=Count('reviews')
@@ -59,25 +56,24 @@ def get_top_reviewer() -> str:
     return f"Top Reviewer: {authors.full_name} with {authors.review_count} published reviews."
 
 
+@cached_report(Article, Author, Review)
 def get_latest_article():
-    latest_article = Article.objects.prefetch_related('authors', 'reviews').order_by('-published_on').first()
+    latest_article = Article.objects.order_by('-published_on').first()
 
     if latest_article is None:
         return ""
 
     authors_names = ', '.join(author.full_name for author in latest_article.authors.all().order_by('full_name'))
-    num_reviews = latest_article.reviews.count()
-    avg_rating = sum([r.rating for r in latest_article.reviews.all()]) / num_reviews if num_reviews else 0.0
+    num_reviews = latest_article.review_count
+    avg_rating = latest_article.rating_sum / num_reviews if num_reviews else 0.0
 
     return f"The latest article is: {latest_article.title}. Authors: {authors_names}. Reviewed: {num_reviews} times." \
            f" Average Rating: {avg_rating:.2f}."
 
 
+@cached_report(Article, Review)
 def get_top_rated_article() -> str:
-    top_rated_article = Article.objects.annotate(
-        avg_rating=Avg('reviews__rating'),
-        review_count=Count('reviews')
-    ).order_by('-avg_rating', 'title').first()
+    top_rated_article = Article.objects.get_top_rated_articles().first()
 
     if top_rated_article is None:
         return ""
@@ -0,0 +1,69 @@
+import random
+
+from main_app.benchmarks import bulk_create_in_batches
+from main_app.models import Article, Author, Review
+
+AUTHORS_PER_ARTICLE = 2
+REVIEWS_PER_ARTICLE = 3
+
+
+def author_factory(i):
+    return Author(
+        full_name=f'Author {i:07}',
+        email=f'author{i}@example.com',
+        birth_year=1900 + i % 100,
+    )
+
+
+def article_factory(i, rng):
+    return Article(
+        title=f'Article {i:07}',
+        content='Synthetic article content',
+        category=rng.choice(Article.CategoryChoices.values),
+    )
+
+
+def review_factory(article_id, author_id, rng):
+    return Review(
+        content='Synthetic review content',
+        rating=rng.randint(10, 50) / 10,
+        article_id=article_id,
+        author_id=author_id,
+    )
+
+
+def seed(scale):
+    """
+    scale authors and scale articles, each article written by two authors
+    and reviewed three times.
+    """
+    rng = random.Random(scale)
+
+    bulk_create_in_batches(Author, (author_factory(i) for i in range(scale)))
+    bulk_create_in_batches(Article, (article_factory(i, rng) for i in range(scale)))
+
+    author_ids = list(Author.objects.values_list('pk', flat=True))
+    article_ids = Article.objects.values_list('pk', flat=True)
+
+    bulk_create_in_batches(
+        Article.authors.through,
+        (
+            Article.authors.through(article_id=article_id, author_id=author_id)
+            for article_id in article_ids.iterator()
+            for author_id in rng.sample(author_ids, min(AUTHORS_PER_ARTICLE, len(author_ids)))
+        ),
+    )
+
+    bulk_create_in_batches(
+        Review,
+        (
+            review_factory(article_id, rng.choice(author_ids), rng)
+            for article_id in article_ids.iterator()
+            for _ in range(REVIEWS_PER_ARTICLE)
+        ),
+    )
+
+    return {
+        'get_authors': ('Author 00001', 'example.com'),
+        'ban_author': ('author1@example.com',),
+    }
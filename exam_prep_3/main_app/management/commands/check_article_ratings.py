@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from main_app.models import Article
+
+
+class Command(BaseCommand):
+    help = "Finds articles whose review_count/rating_sum drifted from their reviews."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repair', action='store_true', help="Recompute the drifted counters.")
+
+    def handle(self, *args, **options):
+        drifted = Article.objects.drifted().order_by('pk')
+
+        for article in drifted:
+            self.stdout.write(
+                f"Article {article.pk} ({article.title}): "
+                f"{article.review_count} reviews / {article.rating_sum} rating sum stored, "
+                f"{article.actual_review_count} / {article.actual_rating_sum} actual"
+            )
+
+        if not options['repair']:
+            self.stdout.write(f"{len(drifted)} articles drifted.")
+            return
+
+        repaired = Article.objects.repair_ratings()
+        self.stdout.write(self.style.SUCCESS(f"{repaired} articles repaired."))
@@ -1,11 +1,102 @@
-from django.db import models
-from django.db.models import Count
+from django.db import models, transaction
+from django.db.models import Count, ExpressionWrapper, F, FloatField, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce, NullIf
 
+from main_app.report_cache import invalidate_on_commit
+from main_app.search import TrigramSearchMixin
 
-class AuthorManager(models.Manager):
+
+class AuthorManager(TrigramSearchMixin, models.Manager):
     def get_authors_by_article_count(self):
         authors = self.annotate(
             article_count=Count('article')
         ).order_by('-article_count', 'email')
 
         return authors
+
+    def search(self, full_name=None, email=None):
+        return self.search_all(full_name=full_name, email=email)
+
+
+def average_rating():
+    return ExpressionWrapper(
+        F('rating_sum') / NullIf(F('review_count'), 0),
+        output_field=FloatField(),
+    )
+
+
+def actual_ratings(reviews):
+    """
+    Subqueries recomputing review_count and rating_sum of the outer Article
+    from the given Review queryset.
+    """
+    reviews = reviews.filter(article=OuterRef('pk')).order_by().values('article')
+
+    return {
+        'review_count': Coalesce(
+            Subquery(reviews.annotate(total=Count('pk')).values('total')),
+            Value(0),
+        ),
+        'rating_sum': Coalesce(
+            Subquery(reviews.annotate(total=Sum('rating')).values('total')),
+            Value(0.0),
+        ),
+    }
+
+
+class ArticleQuerySet(models.QuerySet):
+    def get_top_rated_articles(self):
+        return self.annotate(
+            avg_rating=average_rating()
+        ).order_by('-avg_rating', 'title')
+
+    def drifted(self):
+        actual = actual_ratings(self.model.reviews.field.model.objects.all())
+
+        return self.annotate(
+            actual_review_count=actual['review_count'],
+            actual_rating_sum=actual['rating_sum'],
+        ).filter(
+            ~Q(review_count=F('actual_review_count')) |
+            Q(rating_sum__gt=F('actual_rating_sum') + 1e-6) |
+            Q(rating_sum__lt=F('actual_rating_sum') - 1e-6)
+        )
+
+    def repair_ratings(self):
+        repaired = self.filter(
+            pk__in=self.drifted().values('pk')
+        ).update(**actual_ratings(self.model.reviews.field.model.objects.all()))
+        invalidate_on_commit(self.model, using=self.db)
+
+        return repaired
+
+
+class ReviewQuerySet(models.QuerySet):
+    def shift_article_ratings(self, sign):
+        """
+        Adds (sign=1) or removes (sign=-1) the reviews in this queryset from
+        the counters of their articles with a single UPDATE.
+        """
+        article_model = self.model._meta.get_field('article').related_model
+        counts = actual_ratings(self)
+
+        article_model.objects.filter(
+            pk__in=self.values('article')
+        ).update(
+            review_count=F('review_count') + sign * counts['review_count'],
+            rating_sum=F('rating_sum') + sign * counts['rating_sum'],
+        )
+        invalidate_on_commit(article_model, self.model, using=self.db)
+
+    def bulk_create(self, objs, *args, **kwargs):
+        with transaction.atomic(using=self.db):
+            objs = super().bulk_create(objs, *args, **kwargs)
+            self.filter(pk__in=[obj.pk for obj in objs]).shift_article_ratings(1)
+
+        return objs
+
+    def delete(self):
+        with transaction.atomic(using=self.db):
+            self.shift_article_ratings(-1)
+
+            return super().delete()
@@ -0,0 +1,25 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+from main_app.search import AddTrigramIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_app', '0005_alter_review_article'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddTrigramIndex(
+            model_name='author',
+            field_name='full_name',
+            name='author_full_name_trgm',
+        ),
+        AddTrigramIndex(
+            model_name='author',
+            field_name='email',
+            name='author_email_trgm',
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.0.4 on 2026-10-18 17:34
+
+import django.db.models.expressions
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+from main_app.managers import actual_ratings
+
+
+def fill_rating_counters(apps, schema_editor):
+    article_model = apps.get_model('main_app', 'Article')
+    review_model = apps.get_model('main_app', 'Review')
+
+    article_model.objects.update(**actual_ratings(review_model.objects.all()))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_app', '0006_author_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='rating_sum',
+            field=models.FloatField(default=0.0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='review_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(models.OrderBy(models.ExpressionWrapper(django.db.models.expressions.CombinedExpression(models.F('rating_sum'), '/', django.db.models.functions.comparison.NullIf(models.F('review_count'), 0)), output_field=models.FloatField()), descending=True), models.F('title'), name='article_top_rated_idx'),
+        ),
+        migrations.RunPython(fill_rating_counters, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,8 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F
 from django.core.validators import MinLengthValidator, MaxLengthValidator, MinValueValidator, MaxValueValidator
 
-from main_app.managers import AuthorManager
+from main_app.managers import AuthorManager, ArticleQuerySet, ReviewQuerySet, average_rating
 
 
 class Author(models.Model):
@@ -58,6 +59,23 @@ class Article(models.Model):
         editable=False,
     )
 
+    review_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+    )
+
+    rating_sum = models.FloatField(
+        default=0.0,
+        editable=False,
+    )
+
+    objects = ArticleQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(average_rating().desc(), F('title'), name='article_top_rated_idx'),
+        ]
+
 
 class Review(models.Model):
     content = models.TextField(
@@ -84,3 +102,20 @@ class Review(models.Model):
         auto_now_add=True,
         editable=False,
     )
+
+    objects = ReviewQuerySet.as_manager()
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            if not self._state.adding:
+                Review.objects.filter(pk=self.pk).shift_article_ratings(-1)
+
+            super().save(*args, **kwargs)
+
+            Review.objects.filter(pk=self.pk).shift_article_ratings(1)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            Review.objects.filter(pk=self.pk).shift_article_ratings(-1)
+
+            return super().delete(*args, **kwargs)
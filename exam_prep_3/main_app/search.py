@@ -0,0 +1,79 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db.migrations.operations.base import Operation
+from django.db.models import Q
+from django.db.models.functions import Upper
+
+
+def trigram_index(field_name, name):
+    # icontains is compiled to UPPER("col"::text) LIKE UPPER(%s) on PostgreSQL,
+    # so the index is built over the same expression for the planner to use it.
+    return GinIndex(
+        OpClass(Upper(field_name), name='gin_trgm_ops'),
+        name=name,
+    )
+
+
+class AddTrigramIndex(Operation):
+    """
+    Creates a pg_trgm GIN index on PostgreSQL and does nothing on other
+    backends, so the SQLite test database migrates cleanly.
+    """
+
+    reversible = True
+
+    def __init__(self, model_name, field_name, name):
+        self.model_name = model_name
+        self.field_name = field_name
+        self.name = name
+
+    def deconstruct(self):
+        kwargs = {
+            'model_name': self.model_name,
+            'field_name': self.field_name,
+            'name': self.name,
+        }
+
+        return self.__class__.__name__, [], kwargs
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+
+        model = to_state.apps.get_model(app_label, self.model_name)
+        schema_editor.add_index(model, trigram_index(self.field_name, self.name))
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+
+        model = to_state.apps.get_model(app_label, self.model_name)
+        schema_editor.remove_index(model, trigram_index(self.field_name, self.name))
+
+    def describe(self):
+        return f"Create trigram index {self.name} on {self.model_name}.{self.field_name}"
+
+    @property
+    def migration_name_fragment(self):
+        return self.name.lower()
+
+
+class TrigramSearchMixin:
+    def search_any(self, search_string, *fields):
+        query = Q()
+
+        for field in fields:
+            query |= Q(**{f'{field}__icontains': search_string})
+
+        return self.filter(query)
+
+    def search_all(self, **lookups):
+        query = Q()
+
+        for field, value in lookups.items():
+            if value:
+                query &= Q(**{f'{field}__icontains': value})
+
+        return self.filter(query)
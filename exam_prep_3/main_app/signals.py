@@ -0,0 +1,10 @@
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from main_app.models import Author, Review
+
+
+@receiver(pre_delete, sender=Author)
+def release_author_reviews(sender, instance, **kwargs):
+    # the cascade removes the reviews with a raw DELETE, bypassing ReviewQuerySet.delete()
+    Review.objects.filter(author=instance).shift_article_ratings(-1)
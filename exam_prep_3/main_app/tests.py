@@ -1,3 +1,119 @@
+from unittest import skipUnless
+
+from django.db import connection
 from django.test import TestCase
 
+from caller import get_authors
+from main_app.models import Article, Author, Review
+
+
 # Create your tests here.
+class ReviewCounterTests(TestCase):
+    def setUp(self):
+        self.alice, self.bob = (
+            Author.objects.create(full_name=name, email=f'{name.lower()}@example.com', birth_year=1990)
+            for name in ('Alice', 'Bob')
+        )
+        self.first, self.second = (
+            Article.objects.create(title=title, content='Some article content')
+            for title in ('First article', 'Second article')
+        )
+
+    def review(self, author, article, rating):
+        return Review(content='A fair review', author=author, article=article, rating=rating)
+
+    def assertCounters(self, *expected):
+        self.assertEqual(
+            list(Article.objects.order_by('pk').values_list('review_count', 'rating_sum')),
+            list(expected),
+        )
+        self.assertFalse(Article.objects.drifted().exists())
+
+    def test_bulk_create_counts_every_article(self):
+        Review.objects.bulk_create([
+            self.review(self.alice, self.first, 5),
+            self.review(self.bob, self.first, 3),
+            self.review(self.bob, self.second, 4),
+        ])
+
+        self.assertCounters((2, 8.0), (1, 4.0))
+
+    def test_save_counts_new_changed_and_moved_reviews(self):
+        review = self.review(self.alice, self.first, 5)
+        review.save()
+        self.review(self.bob, self.first, 2).save()
+        self.assertCounters((2, 7.0), (0, 0.0))
+
+        review.rating = 1
+        review.save()
+        self.assertCounters((2, 3.0), (0, 0.0))
+
+        review.article = self.second
+        review.save()
+        self.assertCounters((1, 2.0), (1, 1.0))
+
+    def test_deletes_uncount_the_reviews(self):
+        reviews = Review.objects.bulk_create([
+            self.review(self.alice, self.first, 5),
+            self.review(self.bob, self.first, 3),
+            self.review(self.alice, self.second, 4),
+            self.review(self.bob, self.second, 2),
+        ])
+
+        reviews[0].delete()
+        self.assertCounters((1, 3.0), (2, 6.0))
+
+        Review.objects.filter(rating__lte=3).delete()
+        self.assertCounters((0, 0.0), (1, 4.0))
+
+    def test_deleting_an_author_uncounts_their_reviews(self):
+        Review.objects.bulk_create([
+            self.review(self.alice, self.first, 5),
+            self.review(self.bob, self.first, 3),
+            self.review(self.alice, self.second, 4),
+        ])
+
+        self.alice.delete()
+
+        self.assertCounters((1, 3.0), (0, 0.0))
+
+    def test_repair_ratings_fixes_drifted_articles_only(self):
+        self.review(self.alice, self.first, 5).save()
+        Article.objects.filter(pk=self.second.pk).update(review_count=3, rating_sum=9)
+
+        self.assertEqual(list(Article.objects.drifted()), [self.second])
+        self.assertEqual(Article.objects.repair_ratings(), 1)
+        self.assertCounters((1, 5.0), (0, 0.0))
+
+
+class AuthorSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for full_name, email in (('Anna Smith', 'anna@example.com'), ('Boris Jones', 'boris@mail.org')):
+            Author.objects.create(full_name=full_name, email=email, birth_year=1990)
+
+    def found(self, **search):
+        return [line.split(',')[0] for line in get_authors(**search).splitlines()]
+
+    def test_matches_each_field_case_insensitively(self):
+        self.assertEqual(self.found(search_name='SMITH'), ['Author: Anna Smith'])
+        self.assertEqual(self.found(search_email='mail.org'), ['Author: Boris Jones'])
+
+    def test_both_fields_must_match(self):
+        self.assertEqual(self.found(search_name='smith', search_email='anna'), ['Author: Anna Smith'])
+        self.assertEqual(self.found(search_name='smith', search_email='mail.org'), [])
+
+    def test_no_match_returns_empty_string(self):
+        self.assertEqual(get_authors(search_name='Nobody'), '')
+
+    def test_empty_string_is_not_a_filter(self):
+        self.assertEqual(self.found(search_name=''), ['Author: Boris Jones', 'Author: Anna Smith'])
+        self.assertEqual(self.found(search_name='', search_email='mail.org'), ['Author: Boris Jones'])
+
+    @skipUnless(connection.vendor == 'postgresql', "trigram indexes are only created on PostgreSQL")
+    def test_migrations_create_the_trigram_indexes(self):
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, Author._meta.db_table)
+
+        for name in ('author_full_name_trgm', 'author_email_trgm'):
+            self.assertEqual(constraints[name]['type'], 'gin')
@@ -1,6 +1,6 @@
 import os
 import django
-from django.db.models import Q, Count
+from django.db.models import Count
 
 # Set up Django
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "orm_skeleton.settings")
@@ -8,19 +8,18 @@ django.setup()
 
 # Import your models here
 from main_app.models import *
+from main_app.report_cache import cached_report
 
 
+@cached_report(TennisPlayer)
 def get_tennis_players(search_name=None, search_country=None) -> str:
     if search_name is None and search_country is None:
         return ""
 
-    query = Q()
-    if search_name:
-        query &= Q(full_name__icontains=search_name)
-    if search_country:
-        query &= Q(country__icontains=search_country)
-
-    players = TennisPlayer.objects.filter(query).order_by('ranking')
+    players = TennisPlayer.objects.search(
+        full_name=search_name,
+        country=search_country,
+    ).order_by('ranking')
 
     if not players:
         return ""
@@ -33,6 +32,7 @@ def get_tennis_players(search_name=None, search_country=None) -> str:
     return '\n'.join(result)
 
 
+@cached_report(TennisPlayer, Match)
 def get_top_tennis_player() -> str:
     player = TennisPlayer.objects.get_tennis_players_by_wins_count().first()
 
@@ -42,6 +42,7 @@ def get_top_tennis_player() -> str:
     return f"Top Tennis Player: {player.full_name} with {player.win_count} wins."
 
 
+@cached_report(TennisPlayer, Match)
 def get_tennis_player_by_matches_count() -> str:
     player = TennisPlayer.objects.annotate(
         match_count=Count('player_matches')
@@ -53,6 +54,7 @@ def get_tennis_player_by_matches_count() -> str:
     return f"Tennis Player: {player.full_name} with {player.match_count} matches played."
 
 
+@cached_report(Tournament, Match)
 def get_tournaments_by_surface_type(surface=None) -> str:
     if surface is None:
         return ""
@@ -74,6 +76,7 @@ def get_tournaments_by_surface_type(surface=None) -> str:
     return '\n'.join(result)
 
 
+@cached_report(Match, TennisPlayer, Tournament)
 def get_latest_match_info() -> str:
     latest_match = Match.objects.order_by('-date_played', '-id').first()
 
@@ -94,6 +97,7 @@ def get_latest_match_info() -> str:
     return result
 
 
+@cached_report(Tournament, Match, TennisPlayer)
 def get_matches_by_tournament(tournament_name=None) -> str:
     if tournament_name is None:
         return "No matches found."
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class MainAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'main_app'
+
+    def ready(self):
+        from main_app.report_cache import connect_signals
+
+        connect_signals(self)
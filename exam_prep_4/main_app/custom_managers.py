@@ -1,6 +1,11 @@
 from django.db import models
 
+from main_app.search import TrigramSearchMixin
 
-class CustomManagerTennisPlayer(models.Manager):
+
+class CustomManagerTennisPlayer(TrigramSearchMixin, models.Manager):
     def get_tennis_players_by_wins_count(self):
         return self.annotate(win_count=models.Count('won_match')).order_by('-win_count', 'full_name')
+
+    def search(self, full_name=None, country=None):
+        return self.search_all(full_name=full_name, country=country)
@@ -0,0 +1,69 @@
+import random
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from main_app.benchmarks import bulk_create_in_batches
+from main_app.models import Match, TennisPlayer, Tournament
+
+COUNTRIES = ['Bulgaria', 'Spain', 'Serbia', 'Switzerland', 'United States', 'Australia']
+
+
+def player_factory(i, rng):
+    return TennisPlayer(
+        full_name=f'Player {i:07}',
+        birth_date=date(1980, 1, 1) + timedelta(days=i % 9000),
+        country=rng.choice(COUNTRIES),
+        ranking=i % 300 + 1,
+        is_active=i % 7 != 0,
+    )
+
+
+def tournament_factory(i, rng):
+    return Tournament(
+        name=f'Tournament {i:05}',
+        location=rng.choice(COUNTRIES),
+        prize_money=Decimal(rng.randint(10_000, 5_000_000)),
+        start_date=date(2000, 1, 1) + timedelta(days=i),
+        surface_type=rng.choice(Tournament.SurfaceTypeChoices.values),
+    )
+
+
+def match_factory(i, tournament_ids, player_ids, rng):
+    return Match(
+        score='6-4, 6-4',
+        summary='Synthetic match summary',
+        date_played=datetime(2000, 1, 1, tzinfo=timezone.utc) + timedelta(hours=i),
+        tournament_id=rng.choice(tournament_ids),
+        winner_id=rng.choice(player_ids) if i % 10 else None,
+    )
+
+
+def seed(scale):
+    """
+    scale players and scale matches with two players each, spread over one
+    tournament per hundred players.
+    """
+    rng = random.Random(scale)
+
+    bulk_create_in_batches(TennisPlayer, (player_factory(i, rng) for i in range(scale)))
+    bulk_create_in_batches(Tournament, (tournament_factory(i, rng) for i in range(max(scale // 100, 1))))
+
+    player_ids = list(TennisPlayer.objects.values_list('pk', flat=True))
+    tournament_ids = list(Tournament.objects.values_list('pk', flat=True))
+
+    bulk_create_in_batches(Match, (match_factory(i, tournament_ids, player_ids, rng) for i in range(scale)))
+
+    bulk_create_in_batches(
+        Match.players.through,
+        (
+            Match.players.through(match_id=match_id, tennisplayer_id=player_id)
+            for match_id in Match.objects.values_list('pk', flat=True).iterator()
+            for player_id in rng.sample(player_ids, min(2, len(player_ids)))
+        ),
+    )
+
+    return {
+        'get_tennis_players': ('Player 00001', 'Spain'),
+        'get_tournaments_by_surface_type': (Tournament.SurfaceTypeChoices.CLAY,),
+        'get_matches_by_tournament': ('Tournament 00000',),
+    }
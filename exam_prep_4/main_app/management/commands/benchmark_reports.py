@@ -0,0 +1,33 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+import caller
+from main_app.benchmarks import run_benchmark
+from main_app.factories import seed
+
+REPORTS = [
+    caller.get_tennis_players,
+    caller.get_top_tennis_player,
+    caller.get_tennis_player_by_matches_count,
+    caller.get_tournaments_by_surface_type,
+    caller.get_latest_match_info,
+    caller.get_matches_by_tournament,
+]
+
+
+class Command(BaseCommand):
+    help = "Seeds synthetic data and records time, query count and peak memory of the caller.py reports as JSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', type=int, default=1000, help="Number of players and matches; tournaments scale with it.")
+        parser.add_argument('--output', help="Write the JSON results to this file instead of stdout.")
+
+    def handle(self, *args, **options):
+        results = json.dumps(run_benchmark('exam_prep_4', seed, REPORTS, options['scale']), indent=2)
+
+        if options['output']:
+            with open(options['output'], 'w') as output:
+                output.write(results + '\n')
+        else:
+            self.stdout.write(results)
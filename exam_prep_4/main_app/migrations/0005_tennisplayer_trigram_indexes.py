@@ -0,0 +1,25 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+from main_app.search import AddTrigramIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_app', '0004_alter_match_players_alter_match_tournament'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddTrigramIndex(
+            model_name='tennisplayer',
+            field_name='full_name',
+            name='player_full_name_trgm',
+        ),
+        AddTrigramIndex(
+            model_name='tennisplayer',
+            field_name='country',
+            name='player_country_trgm',
+        ),
+    ]
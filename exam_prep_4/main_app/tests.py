@@ -1,3 +1,42 @@
+from datetime import date
+from unittest import skipUnless
+
+from django.db import connection
 from django.test import TestCase
 
+from caller import get_tennis_players
+from main_app.models import TennisPlayer
+
+
 # Create your tests here.
+class TennisPlayerSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for ranking, full_name, country in ((1, 'Anna Smith', 'Bulgaria'), (2, 'Boris Jones', 'Spain')):
+            TennisPlayer.objects.create(full_name=full_name, country=country, ranking=ranking, birth_date=date(1995, 1, 1))
+
+    def found(self, **search):
+        return [line.split(',')[0] for line in get_tennis_players(**search).splitlines()]
+
+    def test_matches_each_field_case_insensitively(self):
+        self.assertEqual(self.found(search_name='SMITH'), ['Tennis Player: Anna Smith'])
+        self.assertEqual(self.found(search_country='spa'), ['Tennis Player: Boris Jones'])
+
+    def test_both_fields_must_match(self):
+        self.assertEqual(self.found(search_name='smith', search_country='bulg'), ['Tennis Player: Anna Smith'])
+        self.assertEqual(self.found(search_name='smith', search_country='spain'), [])
+
+    def test_no_match_returns_empty_string(self):
+        self.assertEqual(get_tennis_players(search_name='Nobody'), '')
+
+    def test_empty_string_is_not_a_filter(self):
+        self.assertEqual(self.found(search_name=''), ['Tennis Player: Anna Smith', 'Tennis Player: Boris Jones'])
+        self.assertEqual(self.found(search_name='', search_country='spain'), ['Tennis Player: Boris Jones'])
+
+    @skipUnless(connection.vendor == 'postgresql', "trigram indexes are only created on PostgreSQL")
+    def test_migrations_create_the_trigram_indexes(self):
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, TennisPlayer._meta.db_table)
+
+        for name in ('player_full_name_trgm', 'player_country_trgm'):
+            self.assertEqual(constraints[name]['type'], 'gin')
@@ -0,0 +1,6 @@
+"""
+PostgreSQL backend that keeps connections in a bounded in-process pool.
+
+Point a database's ENGINE at "orm_skeleton.pooled_postgresql" and configure the
+pool under OPTIONS["pool"]; see orm_skeleton/settings.py and pool.py.
+"""
@@ -1,6 +1,6 @@
 import os
 import django
-from django.db.models import Q, Count, Sum, Avg, F
+from django.db.models import Sum, Avg, F
 
 # Set up Django
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "orm_skeleton.settings")
@@ -8,16 +8,16 @@ django.setup()
 
 # Import your models here
 from main_app.models import Astronaut, Mission, Spacecraft
+from main_app.report_cache import cached_report, invalidate_on_commit
 
 
 # Create queries within functions
+@cached_report(Astronaut)
 def get_astronauts(search_string=None) -> str:
     if search_string is None:
         return ""
 
-    astronauts = Astronaut.objects.filter(
-        Q(name__icontains=search_string) | Q(phone_number__icontains=search_string)
-    ).order_by('name')
+    astronauts = Astronaut.objects.search(search_string).order_by('name')
 
     if not astronauts.exists():
         return ""
@@ -30,26 +30,27 @@ def get_astronauts(search_string=None) -> str:
     return '\n'.join(result)
 
 
+@cached_report(Astronaut, Mission)
 def get_top_astronaut() -> str:
     astronaut = Astronaut.objects.get_astronauts_by_missions_count().first()
 
-    if not astronaut or astronaut.mission_count == 0:
+    if not astronaut or astronaut.missions_count == 0:
         return "No data."
 
-    return f"Top Astronaut: {astronaut.name} with {astronaut.mission_count} missions."
+    return f"Top Astronaut: {astronaut.name} with {astronaut.missions_count} missions."
 
 
+@cached_report(Astronaut, Mission)
 def get_top_commander() -> str:
-    commanders = Astronaut.objects.annotate(
-        commanded_mission_count=Count('commanders')
-    ).order_by('-commanded_mission_count', 'phone_number').first()
+    commanders = Astronaut.objects.get_astronauts_by_commanded_missions_count().first()
 
-    if not commanders or commanders.commanded_mission_count == 0:
+    if not commanders or commanders.commanded_missions_count == 0:
         return "No data."
 
-    return f"Top Commander: {commanders.name} with {commanders.commanded_mission_count} commanded missions."
+    return f"Top Commander: {commanders.name} with {commanders.commanded_missions_count} commanded missions."
 
 
+@cached_report(Mission, Astronaut, Spacecraft)
 def get_last_completed_mission() -> str:
     mission = (Mission.objects.filter(status=Mission.SatusChoices.COMPLETED)
                .select_related('commander', 'spacecraft')
@@ -71,18 +72,18 @@ def get_last_completed_mission() -> str:
             f"Total spacewalks: {total_spacewalks}.")
 
 
+@cached_report(Spacecraft, Mission)
 def get_most_used_spacecraft():
-    most_used_spacecraft = (Spacecraft.objects.annotate(num_missions=Count('missions'))
-                            .order_by('-num_missions', 'name').first())
+    most_used_spacecraft = Spacecraft.objects.order_by('-missions_count', 'name').first()
 
-    if not most_used_spacecraft or most_used_spacecraft.num_missions == 0:
+    if not most_used_spacecraft or most_used_spacecraft.missions_count == 0:
         return "No data."
 
     num_astronauts = Mission.objects.filter(spacecraft=most_used_spacecraft).values('astronauts').distinct().count()
 
     return (f"The most used spacecraft is: {most_used_spacecraft.name}, "
             f"manufactured by {most_used_spacecraft.manufacturer}, "
-            f"used in {most_used_spacecraft.num_missions} missions, "
+            f"used in {most_used_spacecraft.missions_count} missions, "
             f"astronauts on missions: {num_astronauts}.")
 
 
@@ -96,6 +97,7 @@ def decrease_spacecrafts_weight() -> str:
         return "No changes in weight."
 
     num_affected = affected_spacecrafts.update(weight=F('weight') - 200.0)
+    invalidate_on_commit(Spacecraft)
     avg_weight = Spacecraft.objects.aggregate(Avg('weight'))['weight__avg'] or 0.0
 
     return (f"The weight of {num_affected} spacecrafts has been decreased. "
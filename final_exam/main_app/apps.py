@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class MainAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'main_app'
+
+    def ready(self):
+        import main_app.signals  # noqa: F401
+        from main_app.report_cache import connect_signals
+
+        connect_signals(self)
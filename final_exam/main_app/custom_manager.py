@@ -1,7 +1,14 @@
 from django.db import models
-from django.db.models import Count
 
+from main_app.search import TrigramSearchMixin
 
-class AstronautManager(models.Manager):
+
+class AstronautManager(TrigramSearchMixin, models.Manager):
     def get_astronauts_by_missions_count(self):
-        return self.annotate(mission_count=Count('missions')).order_by('-mission_count', 'phone_number')
+        return self.order_by('-missions_count', 'phone_number')
+
+    def get_astronauts_by_commanded_missions_count(self):
+        return self.order_by('-commanded_missions_count', 'phone_number')
+
+    def search(self, search_string):
+        return self.search_any(search_string, 'name', 'phone_number')
@@ -0,0 +1,72 @@
+import random
+from datetime import date, timedelta
+
+from main_app.benchmarks import bulk_create_in_batches
+from main_app.leaderboard import rebuild_leaderboard
+from main_app.models import Astronaut, Mission, Spacecraft
+
+ASTRONAUTS_PER_MISSION = 3
+
+
+def astronaut_factory(i):
+    return Astronaut(
+        name=f'Astronaut {i:07}',
+        phone_number=f'{i:09}',
+        is_active=i % 5 != 0,
+        spacewalks=i % 12,
+    )
+
+
+def spacecraft_factory(i):
+    return Spacecraft(
+        name=f'Spacecraft {i:05}',
+        manufacturer=f'Manufacturer {i % 20}',
+        capacity=5,
+        weight=150.0 + i * 37 % 300,
+        launch_date=date(2000, 1, 1) + timedelta(days=i),
+    )
+
+
+def mission_factory(i, spacecraft_ids, astronaut_ids, rng):
+    return Mission(
+        name=f'Mission {i:07}',
+        status=rng.choice(Mission.SatusChoices.values),
+        spacecraft_id=rng.choice(spacecraft_ids),
+        commander_id=rng.choice(astronaut_ids),
+        launch_date=date(2000, 1, 1) + timedelta(days=i % 9000),
+    )
+
+
+def seed(scale):
+    """
+    scale astronauts, scale // 2 missions with three crew members each and
+    one spacecraft per hundred astronauts.
+    """
+    rng = random.Random(scale)
+
+    bulk_create_in_batches(Astronaut, (astronaut_factory(i) for i in range(scale)))
+    bulk_create_in_batches(Spacecraft, (spacecraft_factory(i) for i in range(max(scale // 100, 1))))
+
+    astronaut_ids = list(Astronaut.objects.values_list('pk', flat=True))
+    spacecraft_ids = list(Spacecraft.objects.values_list('pk', flat=True))
+
+    bulk_create_in_batches(
+        Mission,
+        (mission_factory(i, spacecraft_ids, astronaut_ids, rng) for i in range(max(scale // 2, 1))),
+    )
+
+    bulk_create_in_batches(
+        Mission.astronauts.through,
+        (
+            Mission.astronauts.through(mission_id=mission_id, astronaut_id=astronaut_id)
+            for mission_id in Mission.objects.values_list('pk', flat=True).iterator()
+            for astronaut_id in rng.sample(astronaut_ids, min(ASTRONAUTS_PER_MISSION, len(astronaut_ids)))
+        ),
+    )
+
+    # bulk_create skips the signals that keep the counters in sync
+    rebuild_leaderboard()
+
+    return {
+        'get_astronauts': ('Astronaut 00001',),
+    }
@@ -0,0 +1,65 @@
+from collections import defaultdict
+
+from django.apps import apps as global_apps
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from main_app.report_cache import invalidate_on_commit
+
+
+def shift_counters(model, field_name, counts):
+    """
+    Applies {pk: delta} to a counter column, one UPDATE per distinct delta.
+    """
+    pks_by_delta = defaultdict(list)
+
+    for pk, delta in counts.items():
+        if pk is not None and delta:
+            pks_by_delta[delta].append(pk)
+
+    for delta, pks in pks_by_delta.items():
+        model.objects.filter(pk__in=pks).update(**{field_name: F(field_name) + delta})
+
+    if pks_by_delta:
+        invalidate_on_commit(model)
+
+
+def _count(queryset, group_by):
+    return Coalesce(
+        Subquery(
+            queryset.order_by().values(group_by).annotate(total=Count('*')).values('total')
+        ),
+        Value(0),
+    )
+
+
+def rebuild_leaderboard(apps=global_apps):
+    """
+    Recomputes every leaderboard counter from the Mission tables.
+    """
+    Astronaut = apps.get_model('main_app', 'Astronaut')
+    Spacecraft = apps.get_model('main_app', 'Spacecraft')
+    Mission = apps.get_model('main_app', 'Mission')
+    MissionAstronaut = Mission._meta.get_field('astronauts').remote_field.through
+
+    with transaction.atomic():
+        Astronaut.objects.update(
+            missions_count=_count(
+                MissionAstronaut.objects.filter(astronaut_id=OuterRef('pk')),
+                'astronaut_id',
+            ),
+            commanded_missions_count=_count(
+                Mission.objects.filter(commander_id=OuterRef('pk')),
+                'commander_id',
+            ),
+        )
+
+        Spacecraft.objects.update(
+            missions_count=_count(
+                Mission.objects.filter(spacecraft_id=OuterRef('pk')),
+                'spacecraft_id',
+            ),
+        )
+
+        invalidate_on_commit(Astronaut, Spacecraft)
@@ -0,0 +1,33 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+import caller
+from main_app.benchmarks import run_benchmark
+from main_app.factories import seed
+
+REPORTS = [
+    caller.get_astronauts,
+    caller.get_top_astronaut,
+    caller.get_top_commander,
+    caller.get_last_completed_mission,
+    caller.get_most_used_spacecraft,
+    caller.decrease_spacecrafts_weight,
+]
+
+
+class Command(BaseCommand):
+    help = "Seeds synthetic data and records time, query count and peak memory of the caller.py reports as JSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', type=int, default=1000, help="Number of astronauts; missions and spacecraft scale with it.")
+        parser.add_argument('--output', help="Write the JSON results to this file instead of stdout.")
+
+    def handle(self, *args, **options):
+        results = json.dumps(run_benchmark('final_exam', seed, REPORTS, options['scale']), indent=2)
+
+        if options['output']:
+            with open(options['output'], 'w') as output:
+                output.write(results + '\n')
+        else:
+            self.stdout.write(results)
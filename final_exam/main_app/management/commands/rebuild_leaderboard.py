@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from main_app.leaderboard import rebuild_leaderboard
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the astronaut and spacecraft mission counters from scratch."
+
+    def handle(self, *args, **options):
+        rebuild_leaderboard()
+        self.stdout.write(self.style.SUCCESS("Leaderboard rebuilt."))
@@ -0,0 +1,25 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+from main_app.search import AddTrigramIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_app', '0002_alter_mission_status'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddTrigramIndex(
+            model_name='astronaut',
+            field_name='name',
+            name='astronaut_name_trgm',
+        ),
+        AddTrigramIndex(
+            model_name='astronaut',
+            field_name='phone_number',
+            name='astronaut_phone_trgm',
+        ),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 5.0.4 on 2026-10-18 17:27
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def count(queryset, group_by):
+    return Coalesce(
+        Subquery(
+            queryset.order_by().values(group_by).annotate(total=Count('*')).values('total')
+        ),
+        Value(0),
+    )
+
+
+def fill_leaderboard(apps, schema_editor):
+    # main_app.leaderboard.rebuild_leaderboard() as of this migration
+    alias = schema_editor.connection.alias
+    Astronaut = apps.get_model('main_app', 'Astronaut')
+    Spacecraft = apps.get_model('main_app', 'Spacecraft')
+    Mission = apps.get_model('main_app', 'Mission')
+    MissionAstronaut = Mission._meta.get_field('astronauts').remote_field.through
+
+    Astronaut.objects.using(alias).update(
+        missions_count=count(
+            MissionAstronaut.objects.using(alias).filter(astronaut_id=OuterRef('pk')),
+            'astronaut_id',
+        ),
+        commanded_missions_count=count(
+            Mission.objects.using(alias).filter(commander_id=OuterRef('pk')),
+            'commander_id',
+        ),
+    )
+
+    Spacecraft.objects.using(alias).update(
+        missions_count=count(
+            Mission.objects.using(alias).filter(spacecraft_id=OuterRef('pk')),
+            'spacecraft_id',
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_app', '0003_astronaut_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='astronaut',
+            name='commanded_missions_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='astronaut',
+            name='missions_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='spacecraft',
+            name='missions_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='astronaut',
+            index=models.Index(fields=['-missions_count', 'phone_number'], name='astronaut_missions_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='astronaut',
+            index=models.Index(fields=['-commanded_missions_count', 'phone_number'], name='astronaut_commanded_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='spacecraft',
+            index=models.Index(fields=['-missions_count', 'name'], name='spacecraft_missions_idx'),
+        ),
+        migrations.RunPython(fill_leaderboard, migrations.RunPython.noop),
+    ]
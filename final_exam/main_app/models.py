@@ -26,8 +26,24 @@ class Astronaut(NameMixin, UpdateAtMixin):
         validators=[MinValueValidator(0)]
     )
 
+    missions_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+    )
+
+    commanded_missions_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+    )
+
     objects = AstronautManager()
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['-missions_count', 'phone_number'], name='astronaut_missions_idx'),
+            models.Index(fields=['-commanded_missions_count', 'phone_number'], name='astronaut_commanded_idx'),
+        ]
+
 
 class Spacecraft(NameMixin, UpdateAtMixin, LaunchDateMixin):
     manufacturer = models.CharField(
@@ -42,6 +58,16 @@ class Spacecraft(NameMixin, UpdateAtMixin, LaunchDateMixin):
         validators=[MinValueValidator(0.0)]
     )
 
+    missions_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-missions_count', 'name'], name='spacecraft_missions_idx'),
+        ]
+
 
 class Mission(NameMixin, UpdateAtMixin, LaunchDateMixin):
     class SatusChoices(models.TextChoices):
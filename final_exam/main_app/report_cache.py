@@ -0,0 +1,216 @@
+"""
+Read-through cache for the caller.py reports.
+
+    @cached_report(Spacecraft, Mission)
+    def get_most_used_spacecraft():
+        ...
+
+Results are stored in the Django cache named by REPORT_CACHE_ALIAS under a
+key built from the report, its arguments and a generation token for every
+table the report reads. Saving, deleting or re-linking a row of a table
+replaces that table's token, so exactly the reports that depend on it miss
+on their next call. Tokens change when the writing transaction commits.
+
+When the Django cache is not configured or fails, an in-process LRU of
+REPORT_CACHE_MAX_ENTRIES entries takes over. Inside a transaction reports
+bypass the cache, since they may see writes that are not committed yet.
+QuerySet.update() and bulk operations send no signals; code that uses them
+on a cached table calls invalidate_on_commit(Model) itself.
+"""
+import hashlib
+import threading
+import uuid
+from collections import Counter, OrderedDict
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import InvalidCacheBackendError, caches
+from django.db import connections, transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+MISSING = object()
+
+
+class LRUCache:
+    def __init__(self, max_entries, on_evict):
+        self.max_entries = max_entries
+        self.on_evict = on_evict
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get_many(self, keys):
+        with self.lock:
+            found = {}
+
+            for key in keys:
+                if key in self.entries:
+                    self.entries.move_to_end(key)
+                    found[key] = self.entries[key]
+
+            return found
+
+    def set(self, key, value, timeout=None):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.on_evict()
+
+    def add(self, key, value, timeout=None):
+        with self.lock:
+            if key in self.entries:
+                return False
+
+        self.set(key, value)
+
+        return True
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+class ReportCache:
+    def __init__(self):
+        self.stats = Counter()
+        self.local = LRUCache(getattr(settings, 'REPORT_CACHE_MAX_ENTRIES', 1024), self._count_eviction)
+
+    def _count_eviction(self):
+        self.stats['evictions'] += 1
+
+    @property
+    def timeout(self):
+        return getattr(settings, 'REPORT_CACHE_TIMEOUT', 300)
+
+    def _backends(self):
+        alias = getattr(settings, 'REPORT_CACHE_ALIAS', 'default')
+
+        if alias is not None:
+            try:
+                yield caches[alias]
+            except InvalidCacheBackendError:
+                pass
+
+        yield self.local
+
+    def _call(self, method, *args, **kwargs):
+        # the first backend that answers wins; the local LRU never fails
+        for backend in self._backends():
+            try:
+                return getattr(backend, method)(*args, **kwargs)
+            except Exception:
+                if backend is self.local:
+                    raise
+
+                self.stats['backend_errors'] += 1
+
+    def _generations(self, tables):
+        keys = [f'report-table:{table}' for table in tables]
+        found = self._call('get_many', keys)
+
+        for key in keys:
+            if key not in found:
+                self._call('add', key, uuid.uuid4().hex, timeout=None)
+
+        if len(found) < len(keys):
+            found = self._call('get_many', keys)
+
+        return [found.get(key, '') for key in keys]
+
+    def key(self, name, tables, args, kwargs):
+        arguments = hashlib.sha1(repr((args, sorted(kwargs.items()))).encode()).hexdigest()
+
+        return f"report:{name}:{':'.join(self._generations(tables))}:{arguments}"
+
+    def fetch(self, name, tables, args, kwargs, compute):
+        if any(connection.in_atomic_block for connection in connections.all(initialized_only=True)):
+            self.stats['bypasses'] += 1
+            return compute()
+
+        key = self.key(name, tables, args, kwargs)
+        value = self._call('get_many', [key]).get(key, MISSING)
+
+        if value is not MISSING:
+            self.stats['hits'] += 1
+            return value
+
+        self.stats['misses'] += 1
+        value = compute()
+        self._call('set', key, value, timeout=self.timeout)
+
+        return value
+
+    def invalidate(self, *models):
+        for model in models:
+            key = f'report-table:{model._meta.label_lower}'
+            token = uuid.uuid4().hex
+
+            self._call('set', key, token, timeout=None)
+            # keep the fallback coherent for when the shared cache goes away
+            self.local.set(key, token)
+
+            self.stats['invalidations'] += 1
+
+    def snapshot(self):
+        return {
+            counter: self.stats[counter]
+            for counter in ('hits', 'misses', 'evictions', 'invalidations', 'bypasses', 'backend_errors')
+        }
+
+    def clear(self):
+        for backend in self._backends():
+            backend.clear()
+
+        self.stats.clear()
+
+
+report_cache = ReportCache()
+
+
+def cached_report(*models):
+    """
+    Caches the decorated report's result until a row of one of models changes.
+    """
+    tables = sorted(model._meta.label_lower for model in models)
+
+    def decorator(report):
+        name = f'{report.__module__}.{report.__qualname__}'
+
+        @wraps(report)
+        def wrapper(*args, **kwargs):
+            return report_cache.fetch(name, tables, args, kwargs, lambda: report(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate_on_commit(*models, using=None):
+    transaction.on_commit(lambda: report_cache.invalidate(*models), using=using)
+
+
+def connect_signals(app_config):
+    """
+    Invalidates a table's reports whenever one of app_config's models is
+    saved, deleted or has its many-to-many links changed.
+    """
+    def model_changed(sender, using, **kwargs):
+        invalidate_on_commit(sender, using=using)
+
+    def links_changed(sender, instance, action, model, using, **kwargs):
+        if action.startswith('post_'):
+            invalidate_on_commit(type(instance), model, using=using)
+
+    for model in app_config.get_models():
+        post_save.connect(model_changed, sender=model, weak=False, dispatch_uid=f'report_cache_save_{model._meta.label}')
+        post_delete.connect(model_changed, sender=model, weak=False, dispatch_uid=f'report_cache_delete_{model._meta.label}')
+
+        for field in model._meta.local_many_to_many:
+            m2m_changed.connect(
+                links_changed,
+                sender=field.remote_field.through,
+                weak=False,
+                dispatch_uid=f'report_cache_links_{model._meta.label}_{field.name}',
+            )
@@ -0,0 +1,82 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from main_app.leaderboard import shift_counters
+from main_app.models import Astronaut, Mission, Spacecraft
+
+MissionAstronaut = Mission.astronauts.through
+
+TRACKED_FIELDS = {'commander', 'commander_id', 'spacecraft', 'spacecraft_id'}
+
+
+def _linked_astronaut_ids(instance, reverse, pk_set=None):
+    if reverse:
+        links = MissionAstronaut.objects.filter(astronaut_id=instance.pk)
+
+        if pk_set is not None:
+            links = links.filter(mission_id__in=pk_set)
+    else:
+        links = MissionAstronaut.objects.filter(mission_id=instance.pk)
+
+        if pk_set is not None:
+            links = links.filter(astronaut_id__in=pk_set)
+
+    return list(links.values_list('astronaut_id', flat=True))
+
+
+@receiver(m2m_changed, sender=MissionAstronaut)
+def update_astronaut_missions_count(sender, instance, action, reverse, pk_set, **kwargs):
+    if action in ('pre_remove', 'pre_clear'):
+        # pk_set may contain rows that are not linked, so count what is actually removed
+        instance._removed_astronaut_ids = _linked_astronaut_ids(instance, reverse, pk_set)
+
+    elif action in ('post_remove', 'post_clear'):
+        removed = instance.__dict__.pop('_removed_astronaut_ids', [])
+        removed = {instance.pk: -len(removed)} if reverse else {pk: -1 for pk in removed}
+        shift_counters(Astronaut, 'missions_count', removed)
+
+    elif action == 'post_add' and pk_set:
+        added = {instance.pk: len(pk_set)} if reverse else {pk: 1 for pk in pk_set}
+        shift_counters(Astronaut, 'missions_count', added)
+
+
+@receiver(pre_save, sender=Mission)
+def remember_mission_relations(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not TRACKED_FIELDS.intersection(update_fields):
+        instance._previous_relations = (instance.commander_id, instance.spacecraft_id)
+        return
+
+    instance._previous_relations = Mission.objects.filter(
+        pk=instance.pk
+    ).values_list('commander_id', 'spacecraft_id').first() if instance.pk else None
+
+
+@receiver(post_save, sender=Mission)
+def update_mission_relation_counts(sender, instance, **kwargs):
+    previous_commander_id, previous_spacecraft_id = instance.__dict__.pop('_previous_relations', None) or (None, None)
+
+    if previous_commander_id != instance.commander_id:
+        shift_counters(Astronaut, 'commanded_missions_count', {
+            previous_commander_id: -1,
+            instance.commander_id: 1,
+        })
+
+    if previous_spacecraft_id != instance.spacecraft_id:
+        shift_counters(Spacecraft, 'missions_count', {
+            previous_spacecraft_id: -1,
+            instance.spacecraft_id: 1,
+        })
+
+
+@receiver(pre_delete, sender=Mission)
+def release_mission_astronauts(sender, instance, **kwargs):
+    # the join rows are removed without m2m_changed, so count them while they exist
+    shift_counters(Astronaut, 'missions_count', {
+        pk: -1 for pk in _linked_astronaut_ids(instance, reverse=False)
+    })
+
+
+@receiver(post_delete, sender=Mission)
+def release_mission_relations(sender, instance, **kwargs):
+    shift_counters(Astronaut, 'commanded_missions_count', {instance.commander_id: -1})
+    shift_counters(Spacecraft, 'missions_count', {instance.spacecraft_id: -1})
@@ -1,3 +1,224 @@
-from django.test import TestCase
+from datetime import date
+from importlib import import_module
+from types import SimpleNamespace
+from unittest import skipUnless
+
+from django.apps import apps
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from caller import get_astronauts, get_most_used_spacecraft, get_top_astronaut
+from main_app.leaderboard import rebuild_leaderboard
+from main_app.models import Astronaut, Mission, Spacecraft
+from main_app.report_cache import LRUCache, report_cache
+
 
 # Create your tests here.
+class ReportCacheTests(TransactionTestCase):
+    def setUp(self):
+        cache.clear()
+        report_cache.clear()
+
+        self.spacecraft = Spacecraft.objects.create(
+            name='Apollo', manufacturer='NASA', capacity=3, weight=1000, launch_date=date(1969, 7, 16),
+        )
+        self.astronaut = Astronaut.objects.create(name='Neil Armstrong', phone_number='111')
+        self.create_mission()
+
+    def create_mission(self):
+        mission = Mission.objects.create(name='Apollo 11', spacecraft=self.spacecraft, launch_date=date(1969, 7, 16))
+        mission.astronauts.add(self.astronaut)
+
+    def test_repeated_calls_are_served_from_the_cache(self):
+        report = get_most_used_spacecraft()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_most_used_spacecraft(), report)
+
+        self.assertEqual(report_cache.snapshot()['hits'], 1)
+        self.assertEqual(report_cache.snapshot()['misses'], 1)
+
+    def test_writes_invalidate_dependent_reports(self):
+        self.assertIn('used in 1 missions', get_most_used_spacecraft())
+
+        self.create_mission()
+
+        self.assertIn('used in 2 missions', get_most_used_spacecraft())
+        self.assertIn('with 2 missions', get_top_astronaut())
+
+    def test_writes_leave_unrelated_reports_cached(self):
+        get_most_used_spacecraft()
+
+        Astronaut.objects.create(name='Buzz Aldrin', phone_number='222')
+
+        with self.assertNumQueries(0):
+            get_most_used_spacecraft()
+
+    @override_settings(REPORT_CACHE_ALIAS=None)
+    def test_local_lru_is_used_without_a_django_cache(self):
+        get_top_astronaut()
+
+        with self.assertNumQueries(0):
+            get_top_astronaut()
+
+        self.astronaut.spacewalks = 1
+        self.astronaut.save()
+
+        with self.assertNumQueries(1):
+            get_top_astronaut()
+
+    def test_lru_evicts_the_least_recently_used_entry(self):
+        evictions = []
+        lru = LRUCache(2, lambda: evictions.append(1))
+
+        lru.set('a', 1)
+        lru.set('b', 2)
+        lru.get_many(['a'])
+        lru.set('c', 3)
+
+        self.assertEqual(lru.get_many(['a', 'b', 'c']), {'a': 1, 'c': 3})
+        self.assertEqual(len(evictions), 1)
+
+
+class LeaderboardCounterTests(TestCase):
+    def setUp(self):
+        self.apollo, self.gemini = (
+            Spacecraft.objects.create(name=name, manufacturer='NASA', capacity=3, weight=1000, launch_date=date(1965, 1, 1))
+            for name in ('Apollo', 'Gemini')
+        )
+        self.astronauts = [Astronaut.objects.create(name=f'Astronaut {i}', phone_number=str(i)) for i in range(4)]
+        self.mission = self.create_mission('Mission 1', self.apollo, commander=self.astronauts[0])
+
+    def create_mission(self, name, spacecraft, commander=None):
+        return Mission.objects.create(name=name, spacecraft=spacecraft, commander=commander, launch_date=date(1969, 1, 1))
+
+    def counters(self):
+        return (
+            list(Astronaut.objects.order_by('pk').values_list('missions_count', 'commanded_missions_count')),
+            list(Spacecraft.objects.order_by('pk').values_list('missions_count', flat=True)),
+        )
+
+    def assertCounters(self, missions, commanded, spacecraft):
+        counters = self.counters()
+
+        self.assertEqual(counters, (list(zip(missions, commanded)), spacecraft))
+        # the signal-maintained counters agree with a full recount
+        rebuild_leaderboard()
+        self.assertEqual(self.counters(), counters)
+
+    def test_add_and_remove_count_only_real_changes(self):
+        first, second, third, fourth = self.astronauts
+
+        self.mission.astronauts.add(first, second)
+        self.mission.astronauts.add(first, third)
+        self.assertCounters([1, 1, 1, 0], [1, 0, 0, 0], [1, 0])
+
+        fourth.missions.add(self.mission)
+        self.mission.astronauts.remove(second, fourth, fourth)
+        self.mission.astronauts.remove(second)
+        self.assertCounters([1, 0, 1, 0], [1, 0, 0, 0], [1, 0])
+
+    def test_set_and_clear(self):
+        first, second, third, fourth = self.astronauts
+        other = self.create_mission('Mission 2', self.gemini)
+        self.mission.astronauts.add(first, second)
+        other.astronauts.add(first, third)
+
+        self.mission.astronauts.set([second, fourth])
+        self.assertCounters([1, 1, 1, 1], [1, 0, 0, 0], [1, 1])
+
+        first.missions.clear()
+        self.assertCounters([0, 1, 1, 1], [1, 0, 0, 0], [1, 1])
+
+        self.mission.astronauts.clear()
+        self.assertCounters([0, 0, 1, 0], [1, 0, 0, 0], [1, 1])
+
+    def test_reassigning_commander_and_spacecraft(self):
+        first, second = self.astronauts[:2]
+
+        self.mission.commander = second
+        self.mission.spacecraft = self.gemini
+        self.mission.save()
+        self.assertCounters([0, 0, 0, 0], [0, 1, 0, 0], [0, 1])
+
+        self.mission.name = 'Renamed'
+        self.mission.save(update_fields=['name'])
+        self.mission.commander = None
+        self.mission.save()
+        self.assertCounters([0, 0, 0, 0], [0, 0, 0, 0], [0, 1])
+
+    def test_cascade_deletes(self):
+        first, second, third, fourth = self.astronauts
+        other = self.create_mission('Mission 2', self.gemini, commander=second)
+        self.mission.astronauts.add(first, second)
+        other.astronauts.add(*self.astronauts)
+
+        # the commander is set to NULL and the astronaut's join rows go with it
+        second.delete()
+        self.assertEqual(
+            list(Astronaut.objects.order_by('pk').values_list('missions_count', flat=True)),
+            [2, 1, 1],
+        )
+
+        # the spacecraft takes its missions and their join rows along
+        self.gemini.delete()
+        self.assertEqual(
+            list(Astronaut.objects.order_by('pk').values_list('missions_count', 'commanded_missions_count')),
+            [(1, 1), (0, 0), (0, 0)],
+        )
+
+        self.mission.delete()
+        self.assertEqual(Astronaut.objects.filter(missions_count=0, commanded_missions_count=0).count(), 3)
+        self.assertEqual(Spacecraft.objects.get().missions_count, 0)
+
+    def test_rebuild_leaderboard_repairs_drifted_counters(self):
+        self.mission.astronauts.add(*self.astronauts[:2])
+        expected = self.counters()
+        Astronaut.objects.update(missions_count=7, commanded_missions_count=7)
+        Spacecraft.objects.update(missions_count=7)
+
+        rebuild_leaderboard()
+
+        self.assertEqual(self.counters(), expected)
+
+    def test_migration_fills_the_counters_like_rebuild_leaderboard(self):
+        migration = import_module('main_app.migrations.0004_leaderboard_counters')
+        self.mission.astronauts.add(*self.astronauts[:3])
+        self.create_mission('Mission 2', self.gemini, commander=self.astronauts[0]).astronauts.add(self.astronauts[0])
+        expected = self.counters()
+        Astronaut.objects.update(missions_count=0, commanded_missions_count=0)
+        Spacecraft.objects.update(missions_count=0)
+
+        migration.fill_leaderboard(apps, SimpleNamespace(connection=connection))
+
+        self.assertEqual(self.counters(), expected)
+        self.assertEqual(expected, ([(2, 2), (1, 0), (1, 0), (0, 0)], [1, 1]))
+
+
+class AstronautSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Astronaut.objects.create(name='Neil Armstrong', phone_number='111222')
+        Astronaut.objects.create(name='Buzz Aldrin', phone_number='333444')
+
+    def found(self, search_string):
+        return [line.split(',')[0] for line in get_astronauts(search_string).splitlines()]
+
+    def test_matches_each_field_case_insensitively(self):
+        self.assertEqual(self.found('ARMSTRONG'), ['Astronaut: Neil Armstrong'])
+        self.assertEqual(self.found('334'), ['Astronaut: Buzz Aldrin'])
+
+    def test_no_match_returns_empty_string(self):
+        self.assertEqual(get_astronauts('Nobody'), '')
+
+    def test_empty_string_matches_every_astronaut(self):
+        self.assertEqual(self.found(''), ['Astronaut: Buzz Aldrin', 'Astronaut: Neil Armstrong'])
+
+    @skipUnless(connection.vendor == 'postgresql', "trigram indexes are only created on PostgreSQL")
+    def test_migrations_create_the_trigram_indexes(self):
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, Astronaut._meta.db_table)
+
+        for name in ('astronaut_name_trgm', 'astronaut_phone_trgm'):
+            self.assertEqual(constraints[name]['type'], 'gin')
@@ -0,0 +1,102 @@
+"""
+bulk_update() that ships the new values as a VALUES list and applies them with
+one UPDATE ... FROM join per batch:
+
+    UPDATE table SET f1 = v.column2, f2 = v.column3
+    FROM (VALUES (%s, %s, %s), (%s, %s, %s), ...) AS v
+    WHERE table.id = v.column1
+
+Stock bulk_update() compiles every batch into one CASE WHEN pk = ... THEN ...
+expression per field, which the database has to plan and evaluate row by row
+against every branch, so it gets quadratically slower as batches grow. A VALUES
+join is planned as an ordinary hash or merge join, whatever the batch size.
+
+PostgreSQL and SQLite 3.33+ support UPDATE ... FROM; anything else, and objects
+carrying expressions instead of plain values, falls back to bulk_update().
+"""
+from django.db import connections, transaction
+from django.db.models import QuerySet
+
+# Rows per statement on PostgreSQL, which has no bind parameter limit; SQLite
+# batches are capped by its parameter limit instead.
+DEFAULT_BATCH_SIZE = 5000
+
+
+def supports_update_from(connection):
+    if connection.vendor == 'postgresql':
+        return True
+
+    return connection.vendor == 'sqlite' and connection.Database.sqlite_version_info >= (3, 33)
+
+
+def _placeholder(field, connection):
+    if connection.vendor == 'postgresql':
+        # A VALUES list has no column types of its own; without the cast
+        # PostgreSQL would read string parameters as text and refuse to
+        # assign them to e.g. a date column.
+        return f'%s::{field.cast_db_type(connection)}'
+
+    return '%s'
+
+
+def bulk_update_values(queryset, objs, fields, batch_size=None):
+    """
+    Saves fields of objs, which must already exist, and returns the number of
+    rows matched, like QuerySet.bulk_update(). queryset may be a manager; only
+    its model and database are used.
+    """
+    queryset = queryset.all() if not isinstance(queryset, QuerySet) else queryset
+    model = queryset.model
+    meta = model._meta
+    connection = connections[queryset.db]
+    objs = list(objs)
+    fields = [meta.get_field(name) for name in fields]
+
+    if not objs:
+        return 0
+
+    if any(field.primary_key or not field.concrete or field.many_to_many for field in fields):
+        raise ValueError('bulk_update_values() can only update concrete, non primary key fields.')
+
+    if any(obj.pk is None for obj in objs):
+        raise ValueError('All bulk_update_values() objects must have a primary key set.')
+
+    if not supports_update_from(connection) or any(
+        hasattr(getattr(obj, field.attname), 'resolve_expression') for obj in objs for field in fields
+    ):
+        return queryset.bulk_update(objs, [field.name for field in fields], batch_size=batch_size)
+
+    columns = [meta.pk, *fields]
+    max_batch_size = connection.ops.bulk_batch_size(columns, objs)
+    batch_size = min(batch_size or DEFAULT_BATCH_SIZE, max_batch_size)
+
+    quote = connection.ops.quote_name
+    table = quote(meta.db_table)
+    row = '(%s)' % ', '.join(_placeholder(field, connection) for field in columns)
+    # PostgreSQL and SQLite both name the columns of a VALUES list column1, column2, ...
+    assignments = ', '.join(f'{quote(field.column)} = v.column{i}' for i, field in enumerate(fields, start=2))
+
+    updated = 0
+
+    with transaction.atomic(using=queryset.db, savepoint=False), connection.cursor() as cursor:
+        for start in range(0, len(objs), batch_size):
+            batch = objs[start:start + batch_size]
+            params = [
+                field.get_db_prep_save(getattr(obj, field.attname), connection)
+                for obj in batch
+                for field in columns
+            ]
+            cursor.execute(
+                f'UPDATE {table} SET {assignments} '
+                f'FROM (VALUES {", ".join([row] * len(batch))}) AS v '
+                f'WHERE {table}.{quote(meta.pk.column)} = v.column1',
+                params,
+            )
+            updated += cursor.rowcount
+
+    return updated
+
+
+class BulkUpdateQuerySet(QuerySet):
+    def bulk_update_values(self, objs, fields, batch_size=None):
+        return bulk_update_values(self, objs, fields, batch_size=batch_size)
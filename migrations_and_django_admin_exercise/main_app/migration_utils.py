@@ -0,0 +1,109 @@
+import logging
+
+from django.db import transaction
+from django.db.models import Case, Value, When
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_TABLE = 'main_app_batch_checkpoint'
+
+
+class BatchCheckpoint:
+    """
+    Remembers the last primary key a batched data migration has committed, so
+    a non-atomic migration that was interrupted resumes where it stopped.
+
+    The table is created on demand, outside the migration state, and dropped
+    again once no interrupted run has a checkpoint left in it.
+    """
+
+    def __init__(self, schema_editor, name):
+        self.connection = schema_editor.connection
+        self.name = name
+        self.table = schema_editor.quote_name(CHECKPOINT_TABLE)
+
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} "
+                f"(name varchar(255) PRIMARY KEY, last_pk bigint NOT NULL)"
+            )
+
+    def load(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"SELECT last_pk FROM {self.table} WHERE name = %s", [self.name])
+            row = cursor.fetchone()
+
+        return row[0] if row else None
+
+    def save(self, last_pk):
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table} WHERE name = %s", [self.name])
+            cursor.execute(f"INSERT INTO {self.table} (name, last_pk) VALUES (%s, %s)", [self.name, last_pk])
+
+    def clear(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table} WHERE name = %s", [self.name])
+            cursor.execute(f"SELECT 1 FROM {self.table}")
+
+            if cursor.fetchone() is None:
+                cursor.execute(f"DROP TABLE {self.table}")
+
+
+def for_each_batch(schema_editor, queryset, handler, name, batch_size=1000):
+    """
+    Calls handler(batch) for consecutive primary-key ranges of queryset, each
+    holding at most batch_size rows, without ever loading the whole table.
+
+    Every batch runs in its own transaction together with its checkpoint, so
+    in a migration declared with atomic = False each batch is committed on its
+    own and a rerun continues after the last committed batch. Progress is
+    logged at INFO level to main_app.migration_utils.
+    """
+    alias = schema_editor.connection.alias
+    queryset = queryset.using(alias).order_by('pk')
+    checkpoint = BatchCheckpoint(schema_editor, name)
+
+    last_pk = checkpoint.load()
+    remaining = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+    total = remaining.count()
+    done = 0
+
+    while True:
+        pks = remaining.values_list('pk', flat=True)
+        upper_pk = pks[batch_size - 1:batch_size].first() or pks.last()
+
+        if upper_pk is None:
+            break
+
+        with transaction.atomic(using=alias):
+            handler(remaining.filter(pk__lte=upper_pk))
+            checkpoint.save(upper_pk)
+
+        done = min(done + batch_size, total)
+        remaining = queryset.filter(pk__gt=upper_pk)
+
+        logger.info("%s: %s/%s rows", name, done, total)
+
+    checkpoint.clear()
+
+
+def bucket_case(rules, default, output_field=None):
+    """
+    Compiles ordered (condition, value) rules into a single CASE expression;
+    the first matching condition wins, as in an if/elif chain.
+    """
+    return Case(
+        *[When(condition, then=Value(value)) for condition, value in rules],
+        default=Value(default),
+        output_field=output_field,
+    )
+
+
+def assign_buckets(queryset, field_name, rules, default):
+    """
+    Sets field_name on every row of queryset with one
+    UPDATE ... SET field_name = CASE WHEN ... END statement.
+    """
+    output_field = queryset.model._meta.get_field(field_name)
+
+    return queryset.update(**{field_name: bucket_case(rules, default, output_field)})
@@ -1,30 +1,31 @@
 # Generated by Django 5.0.6 on 2024-06-25 17:48
 
 from django.db import migrations
+from django.db.models import Q
+
+from main_app.migration_utils import assign_buckets
+
+AGE_GROUPS = [
+    (Q(age__lte=12), "Child"),
+    (Q(age__lte=17), "Teen"),
+]
 
 
 def set_age_group(apps, schema_editor):
     person_model = apps.get_model('main_app', 'Person')
-    people = person_model.objects.all()
 
-    for person in people:
-        if person.age <= 12:
-            person.age_group = "Child"
-        elif person.age <= 17:
-            person.age_group = "Teen"
-        else:
-            person.age_group = "Adult"
-
-    person_model.objects.bulk_update(people, ['age_group'])
+    assign_buckets(person_model.objects.all(), 'age_group', AGE_GROUPS, default="Adult")
 
 
 def set_age_group_default(apps, schema_editor):
     person_model = apps.get_model('main_app', 'Person')
 
-    for person in person_model.objects.all():
-        person.age_group = person_model._meta.get_field("age_group").default
-
-    person_model.objects.bulk_update(person_model.objects.all(), ['age_group'])
+    assign_buckets(
+        person_model.objects.all(),
+        'age_group',
+        [],
+        default=person_model._meta.get_field("age_group").default,
+    )
 
 
 class Migration(migrations.Migration):
@@ -1,32 +1,32 @@
 # Generated by Django 5.0.6 on 2024-06-25 18:07
 
 from django.db import migrations
+from django.db.models import Q
+
+from main_app.migration_utils import assign_buckets
+
+RARITIES = [
+    (Q(price__lte=10), "Rare"),
+    (Q(price__lte=20), "Very Rare"),
+    (Q(price__lte=30), "Extremely Rare"),
+]
 
 
 def set_item_rarity(apps, schema_editor):
     item_module = apps.get_model('main_app', 'Item')
-    items_price = item_module.objects.all()
 
-    for item in items_price:
-        if item.price <= 10:
-            item.rarity = "Rare"
-        elif item.price <= 20:
-            item.rarity = "Very Rare"
-        elif item.price <= 30:
-            item.rarity = "Extremely Rare"
-        else:
-            item.rarity = "Mega Rare"
-
-    item_module.objects.bulk_update(items_price, ['rarity'])
+    assign_buckets(item_module.objects.all(), 'rarity', RARITIES, default="Mega Rare")
 
 
 def set_item_rarity_default(apps, schema_editor):
     item_module = apps.get_model('main_app', 'Item')
 
-    for item in item_module.objects.all():
-        item.rarity = item_module._meta.get_field("rarity").default
-
-    item_module.objects.bulk_update(item_module, ['rarity'])
+    assign_buckets(
+        item_module.objects.all(),
+        'rarity',
+        [],
+        default=item_module._meta.get_field("rarity").default,
+    )
 
 
 class Migration(migrations.Migration):
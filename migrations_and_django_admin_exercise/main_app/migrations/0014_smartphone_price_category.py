@@ -1,42 +1,53 @@
 # Generated by Django 5.0.4 on 2024-06-24 17:38
 
 from django.db import migrations
+from django.db.models import Q
+from django.db.models.functions import Length
+
+from main_app.migration_utils import assign_buckets, for_each_batch
+
+CATEGORIES = [
+    (Q(price__gte=750), "Expensive"),
+]
 
 
 def set_price(apps, schema_editor):
     MULTIPLIER = 120
 
     smartphone_model = apps.get_model("main_app", "SmartPhone")
-    smartphone_price = smartphone_model.objects.all()
 
-    for smartphone in smartphone_price:  # smartphone = ("apple", 0, "No category")
-        smartphone.price = MULTIPLIER * len(smartphone.brand)  # apple => 5 * 120 => 600
-
-    smartphone_model.objects.bulk_update(smartphone_price, ['price'])
+    for_each_batch(
+        schema_editor,
+        smartphone_model.objects.all(),
+        lambda smartphones: smartphones.update(price=Length('brand') * MULTIPLIER),  # apple => 5 * 120 => 600
+        name='0014_set_price',
+    )
 
 
 def set_category(apps, schema_editor):
     smartphone_model = apps.get_model("main_app", "SmartPhone")
-    smartphone_category = smartphone_model.objects.all()
-
-    for smartphone in smartphone_category:
-        if smartphone.price >= 750:
-            smartphone.category = "Expensive"
-        else:
-            smartphone.category = "Cheap"
 
-    smartphone_model.objects.bulk_update(smartphone_category, ['category'])
+    assign_buckets(smartphone_model.objects.all(), 'category', CATEGORIES, default="Cheap")
 
 
 def reverse_fulling_of_columns_category_and_price(apps, schema_editor):
     smartphone_model = apps.get_model("main_app", "SmartPhone")
-    smartphones = smartphone_model.objects.all()
 
-    for smartphone in smartphones:
-        smartphone.category = smartphone_model._meta.get_field('category').default
-        smartphone.price = smartphone_model._meta.get_field('price').default
+    for_each_batch(
+        schema_editor,
+        smartphone_model.objects.all(),
+        lambda smartphones: smartphones.update(
+            price=smartphone_model._meta.get_field('price').default,
+        ),
+        name='0014_reverse_price',
+    )
 
-    smartphone_model.objects.bulk_update(smartphones, ['category', 'price'])
+    assign_buckets(
+        smartphone_model.objects.all(),
+        'category',
+        [],
+        default=smartphone_model._meta.get_field('category').default,
+    )
 
 
 def set_all_columns(apps, schema_editor):
@@ -45,6 +56,7 @@ def set_all_columns(apps, schema_editor):
 
 
 class Migration(migrations.Migration):
+    atomic = False
 
     dependencies = [
         ('main_app', '0013_smartphone'),
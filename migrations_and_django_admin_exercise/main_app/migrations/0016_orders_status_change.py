@@ -3,34 +3,39 @@
 from django.db import migrations
 from django.utils import timezone
 
+from main_app.bulk_update import bulk_update_values
+from main_app.migration_utils import for_each_batch
+
 
 def update_delivery_and_warranty(apps, schema_editor):
     order_model = apps.get_model('main_app', 'Order')
 
-    for order in order_model.objects.all():
-        if order.status == "Pending":
+    def update_orders(orders):
+        pending = list(orders.filter(status="Pending").only('order_date'))
+
+        for order in pending:
             order.delivery = order.order_date + timezone.timedelta(days=3)
-            order.save()
-        elif order.status == "Completed":
-            order.warranty = "24 months"
-            order.save()
-        elif order.status == "Canceled":
-            order.delete()
+
+        bulk_update_values(orders, pending, ['delivery'])
+
+        orders.filter(status="Completed").update(warranty="24 months")
+        orders.filter(status="Canceled").delete()
+
+    for_each_batch(schema_editor, order_model.objects.all(), update_orders, name='0016_update_orders')
 
 
 def reverse_delivery_and_warranty(apps, schema_editor):
     order_model = apps.get_model('main_app', 'Order')
 
-    for order in order_model.objects.all():
-        if order.status == "Pending":
-            order.delivery = None
-        elif order.status == "Completed":
-            order.warranty = order_model._meta.get_field('warranty').default
+    def reverse_orders(orders):
+        orders.filter(status="Pending").update(delivery=None)
+        orders.filter(status="Completed").update(warranty=order_model._meta.get_field('warranty').default)
 
-        order.save()
+    for_each_batch(schema_editor, order_model.objects.all(), reverse_orders, name='0016_reverse_orders')
 
 
 class Migration(migrations.Migration):
+    atomic = False
 
     dependencies = [
         ('main_app', '0015_order'),
@@ -1,3 +1,116 @@
-from django.test import TestCase
+from datetime import date, timedelta
+from importlib import import_module
 
-# Create your tests here.
+from django.apps import apps
+from django.db import connection
+from django.db.models import Q
+from django.test import TestCase, TransactionTestCase
+
+from main_app.migration_utils import CHECKPOINT_TABLE, assign_buckets, for_each_batch
+from main_app.models import Order, Person
+
+AGE_GROUPS = [
+    (Q(age__lte=12), "Child"),
+    (Q(age__lte=17), "Teen"),
+]
+
+
+class AssignBucketsTests(TestCase):
+    def test_first_matching_rule_wins(self):
+        Person.objects.bulk_create(Person(name=str(age), age=age) for age in (5, 12, 13, 17, 18, 70))
+
+        assign_buckets(Person.objects.all(), 'age_group', AGE_GROUPS, default="Adult")
+
+        self.assertEqual(
+            list(Person.objects.order_by('age').values_list('age_group', flat=True)),
+            ["Child", "Child", "Teen", "Teen", "Adult", "Adult"],
+        )
+
+    def test_runs_a_single_statement_regardless_of_table_size(self):
+        for size in (10, 1_000, 10_000):
+            Person.objects.bulk_create(Person(name=str(i), age=i % 100) for i in range(size))
+
+            with self.assertNumQueries(1):
+                assign_buckets(Person.objects.all(), 'age_group', AGE_GROUPS, default="Adult")
+
+    def test_without_rules_every_row_gets_the_default(self):
+        Person.objects.bulk_create(Person(name=str(age), age=age, age_group="Teen") for age in (13, 14))
+
+        assign_buckets(Person.objects.all(), 'age_group', [], default="No age group")
+
+        self.assertFalse(Person.objects.exclude(age_group="No age group").exists())
+
+
+class Interrupted(Exception):
+    pass
+
+
+# for_each_batch() commits every batch and creates and drops its checkpoint table
+class ForEachBatchTests(TransactionTestCase):
+    def setUp(self):
+        self.people = Person.objects.bulk_create(Person(name=str(i), age=i) for i in range(25))
+
+    def run_batches(self, handler):
+        # as in a migration declared with atomic = False
+        with connection.schema_editor(atomic=False) as schema_editor:
+            for_each_batch(schema_editor, Person.objects.all(), handler, name='test_batches', batch_size=10)
+
+    def test_batches_cover_every_row_once_and_log_progress(self):
+        batches = []
+
+        with self.assertLogs('main_app.migration_utils', 'INFO') as logs:
+            self.run_batches(lambda batch: batches.append(list(batch.values_list('pk', flat=True))))
+
+        self.assertEqual([len(batch) for batch in batches], [10, 10, 5])
+        self.assertEqual(sum(batches, []), [person.pk for person in self.people])
+        self.assertEqual(logs.output[-1], 'INFO:main_app.migration_utils:test_batches: 25/25 rows')
+        self.assertNotIn(CHECKPOINT_TABLE, connection.introspection.table_names())
+
+    def test_interrupted_run_resumes_after_the_last_committed_batch(self):
+        def fail_on_second_batch(batch):
+            if batch.filter(pk=self.people[10].pk).exists():
+                raise Interrupted
+
+            batch.update(age_group='Done')
+
+        with self.assertRaises(Interrupted):
+            self.run_batches(fail_on_second_batch)
+
+        self.assertIn(CHECKPOINT_TABLE, connection.introspection.table_names())
+        self.assertEqual(Person.objects.filter(age_group='Done').count(), 10)
+
+        batches = []
+        self.run_batches(lambda batch: batches.append(batch.count()))
+
+        self.assertEqual(batches, [10, 5])
+        self.assertNotIn(CHECKPOINT_TABLE, connection.introspection.table_names())
+
+
+# The migration is not atomic and runs each batch in its own transaction
+class OrderStatusMigrationTests(TransactionTestCase):
+    migration = import_module('main_app.migrations.0016_orders_status_change')
+
+    def test_update_delivery_and_warranty(self):
+        Order.objects.bulk_create(
+            Order(
+                product_name='Product',
+                customer_name=f'Customer {i}',
+                order_date=date(2024, 1, 1) + timedelta(days=i),
+                status=('Pending', 'Completed', 'Canceled')[i % 3],
+                product_price=10,
+            )
+            for i in range(30)
+        )
+
+        with connection.schema_editor(atomic=False) as schema_editor:
+            self.migration.update_delivery_and_warranty(apps, schema_editor)
+
+        self.assertFalse(Order.objects.filter(status='Canceled').exists())
+        self.assertEqual(set(Order.objects.filter(status='Completed').values_list('warranty', flat=True)), {'24 months'})
+
+        pending = Order.objects.filter(status='Pending')
+        self.assertEqual(pending.count(), 10)
+
+        for order in pending:
+            self.assertEqual(order.delivery, order.order_date + timedelta(days=3))
+            self.assertEqual(order.warranty, 'No warranty')
@@ -0,0 +1,114 @@
+"""
+N+1 query detection.
+
+Every SQL statement is recorded through connection.execute_wrapper() and
+grouped by its template (Django keeps the parameters out of the SQL text)
+and by the innermost project frame that issued it. A template that runs
+more than N_PLUS_ONE_THRESHOLD times from the same call site is reported.
+
+In caller.py scripts and tests:
+
+    with detect_n_plus_one():
+        show_all_authors_with_their_books()
+
+Admin and other views are covered by NPlusOneMiddleware while DEBUG is on.
+"""
+import logging
+import os
+import sys
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+
+
+class NPlusOneError(Exception):
+    pass
+
+
+def _call_site():
+    frame = sys._getframe(2)
+
+    while frame is not None:
+        filename = frame.f_code.co_filename
+
+        if filename.startswith(PROJECT_ROOT) and filename != __file__ and 'site-packages' not in filename:
+            return f"{os.path.relpath(filename, PROJECT_ROOT)}:{frame.f_lineno} in {frame.f_code.co_name}"
+
+        frame = frame.f_back
+
+    return "<unknown>"
+
+
+class QueryRecorder:
+    def __init__(self, threshold, raise_error, label):
+        self.threshold = threshold
+        self.raise_error = raise_error
+        self.label = label
+        self.counts = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        key = (sql, _call_site())
+        self.counts[key] += 1
+
+        if self.raise_error and self.counts[key] > self.threshold:
+            raise NPlusOneError(self.describe(key, self.counts[key]))
+
+        return execute(sql, params, many, context)
+
+    def describe(self, key, count):
+        sql, call_site = key
+
+        return f"{self.label}: {count} identical queries from {call_site}: {sql}"
+
+    def repeated(self):
+        return {key: count for key, count in self.counts.items() if count > self.threshold}
+
+    def report(self):
+        for key, count in self.repeated().items():
+            logger.warning(self.describe(key, count))
+
+
+@contextmanager
+def detect_n_plus_one(threshold=None, raise_error=None, label="N+1 queries"):
+    """
+    Records every query run on any database connection inside the block and
+    raises NPlusOneError (or logs a warning) when one statement template runs
+    more than threshold times from the same call site.
+    """
+    if threshold is None:
+        threshold = getattr(settings, 'N_PLUS_ONE_THRESHOLD', 10)
+
+    if raise_error is None:
+        raise_error = getattr(settings, 'N_PLUS_ONE_RAISE', False)
+
+    recorder = QueryRecorder(threshold, raise_error, label)
+
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+
+            yield recorder
+    finally:
+        # a block that fails, e.g. a view raising, is still reported
+        recorder.report()
+
+
+class NPlusOneMiddleware:
+    def __init__(self, get_response):
+        if not settings.DEBUG:
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with detect_n_plus_one(label=f"{request.method} {request.path}"):
+            return self.get_response(request)
@@ -17,4 +17,5 @@ class ProductAdmin(admin.ModelAdmin):
             {'fields': ('category', 'supplier')}
         ),
     )
+    readonly_fields = ('barcode',)
     date_hierarchy = 'created_on'
@@ -0,0 +1,76 @@
+"""
+Barcode allocation.
+
+A product's barcode is a keyed permutation of its primary key: the key comes
+from the table's own sequence, so it is never handed out twice, and the
+permutation scatters consecutive keys over the whole code range, so codes are
+not sequential and do not reveal how many products exist. Because the
+permutation is a bijection, distinct keys always give distinct codes and no
+collision check is needed.
+
+The permutation is built from rounds of two steps that are each invertible
+on BARCODE_BITS bits - multiply by an odd constant and add, modulo
+2 ** BARCODE_BITS, then xor the value with its own high half - and uses only
+integer arithmetic and bit operators, so it can run either in Python
+(barcode_for) or inside an UPDATE statement (barcode_expression) with the same
+result.
+"""
+import random
+
+from django.conf import settings
+from django.db.models import F, Value
+
+BARCODE_BITS = 28
+BARCODE_MASK = (1 << BARCODE_BITS) - 1
+FIRST_BARCODE = 100_000_000
+LAST_BARCODE = FIRST_BARCODE + BARCODE_MASK
+ROUNDS = 3
+SHIFT = BARCODE_BITS // 2
+
+
+def _constants(key):
+    """
+    Derives the (multiplier, increment) pair of each round from the key.
+    Multipliers are odd, so the step is a bijection, and below 2 ** 20, so
+    intermediate values stay well inside a signed 64-bit integer.
+    """
+    rng = random.Random(key)
+
+    return [
+        (rng.randrange(1 << 19, 1 << 20) | 1, rng.randrange(1 << BARCODE_BITS))
+        for _ in range(ROUNDS)
+    ]
+
+
+def _key(key):
+    return settings.BARCODE_KEY if key is None else key
+
+
+def _check_index(index):
+    if not 0 <= index <= BARCODE_MASK:
+        raise ValueError(f'Cannot derive a barcode from index {index}, it must be between 0 and {BARCODE_MASK}.')
+
+
+def barcode_for(index, key=None):
+    """Returns the barcode of the given index (a product primary key)."""
+    _check_index(index)
+    value = index
+
+    for multiplier, increment in _constants(_key(key)):
+        value = (value * multiplier + increment) & BARCODE_MASK
+        value ^= value >> SHIFT
+
+    return FIRST_BARCODE + value
+
+
+def barcode_expression(index=F('pk'), key=None):
+    """Returns a database expression computing barcode_for(index) for every row."""
+    value = index
+
+    for multiplier, increment in _constants(_key(key)):
+        value = (value * Value(multiplier) + Value(increment)).bitand(BARCODE_MASK)
+        # a ^ b written as (a | b) - (a & b), since SQLite has no xor operator.
+        high = value.bitrightshift(SHIFT)
+        value = value.bitor(high) - value.bitand(high)
+
+    return Value(FIRST_BARCODE) + value
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from main_app.models import Product
+
+
+class Command(BaseCommand):
+    help = "Gives products without a barcode the code derived from their id."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help="Reassign every product, e.g. after BARCODE_KEY changed.")
+        parser.add_argument('--batch-size', type=int, default=100_000, help="Width of the id range updated per statement.")
+
+    def handle(self, *args, **options):
+        products = Product.objects.all() if options['all'] else Product.objects.without_barcode()
+        updated = products.assign_barcodes(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Assigned {updated} barcodes."))
@@ -0,0 +1,66 @@
+import json
+import time
+import tracemalloc
+from decimal import Decimal
+from itertools import islice
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.test.utils import setup_databases, teardown_databases
+
+from main_app.models import Product
+
+
+def seed_products(count, batch_size=5000):
+    products = (
+        Product(
+            name=f'Product {i:07}',
+            price=Decimal('9.99'),
+            category='Synthetic',
+            supplier='Benchmark Ltd.',
+        )
+        for i in range(count)
+    )
+
+    while batch := list(islice(products, batch_size)):
+        Product.objects.bulk_create(batch)
+
+
+class Command(BaseCommand):
+    help = (
+        "Seeds products without barcodes on a throwaway test database, times "
+        "Product.objects.assign_barcodes() and prints the results as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--count', type=int, default=1_000_000, help="Products seeded before assigning.")
+        parser.add_argument('--batch-size', type=int, default=100_000, help="Width of the id range updated per statement.")
+
+    def handle(self, *args, **options):
+        old_config = setup_databases(verbosity=0, interactive=False)
+
+        try:
+            seed_products(options['count'])
+
+            tracemalloc.start()
+            start = time.perf_counter()
+            assigned = Product.objects.without_barcode().assign_barcodes(batch_size=options['batch_size'])
+            seconds = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            distinct = Product.objects.values('barcode').distinct().count()
+        finally:
+            connections.close_all()
+            teardown_databases(old_config, verbosity=0)
+
+        self.stdout.write(json.dumps({
+            'project': 'migrations_and_django_admin_lab',
+            'vendor': connections['default'].vendor,
+            'products': options['count'],
+            'batch_size': options['batch_size'],
+            'assigned': assigned,
+            'distinct_barcodes': distinct,
+            'seconds': round(seconds, 3),
+            'peak_python_memory_kib': round(peak / 1024, 1),
+        }, indent=2))
@@ -0,0 +1,38 @@
+from django.db import models, transaction
+from django.db.models import Max, Min
+
+from main_app.barcodes import BARCODE_MASK, barcode_expression
+
+
+class ProductQuerySet(models.QuerySet):
+    def without_barcode(self):
+        return self.filter(barcode__isnull=True)
+
+    def assign_barcodes(self, batch_size=None, key=None):
+        """
+        Gives every product in the queryset the barcode derived from its
+        primary key and returns how many were updated. The codes are computed
+        by the database, so this is one UPDATE statement, or one per
+        batch_size wide primary key range when batch_size is given, which keeps
+        each transaction small on large tables. Nothing is loaded into Python.
+        """
+        bounds = self.aggregate(first=Min('pk'), last=Max('pk'))
+
+        if bounds['last'] is None:
+            return 0
+
+        if bounds['last'] > BARCODE_MASK:
+            raise ValueError(f'Product ids above {BARCODE_MASK} have no barcode.')
+
+        barcode = barcode_expression(key=key)
+
+        if batch_size is None:
+            return self.update(barcode=barcode)
+
+        updated = 0
+
+        for start in range(bounds['first'], bounds['last'] + 1, batch_size):
+            with transaction.atomic(using=self.db):
+                updated += self.filter(pk__gte=start, pk__lt=start + batch_size).update(barcode=barcode)
+
+        return updated
@@ -0,0 +1,53 @@
+from django.db import migrations, models
+from django.db.models import F, Value
+
+# main_app.barcodes as of this migration, with the round constants its
+# _constants() derives from BARCODE_KEY = 0x5D2A7C31, so that changing either
+# later doesn't change the codes this migration assigns.
+BARCODE_MASK = (1 << 28) - 1
+FIRST_BARCODE = 100_000_000
+SHIFT = 14
+ROUNDS = [
+    (882099, 194705753),
+    (631025, 198370295),
+    (1031299, 56825784),
+]
+
+
+def barcode_expression():
+    value = F('pk')
+
+    for multiplier, increment in ROUNDS:
+        value = (value * Value(multiplier) + Value(increment)).bitand(BARCODE_MASK)
+        # a ^ b written as (a | b) - (a & b), since SQLite has no xor operator.
+        high = value.bitrightshift(SHIFT)
+        value = value.bitor(high) - value.bitand(high)
+
+    return Value(FIRST_BARCODE) + value
+
+
+class Migration(migrations.Migration):
+
+    def assign_barcodes(apps, schema_editor):
+        # Replaces the random codes of 0005, which could repeat, with the
+        # codes derived from each product's primary key in one UPDATE.
+        Product = apps.get_model('main_app', 'Product')
+        Product.objects.using(schema_editor.connection.alias).update(barcode=barcode_expression())
+
+    dependencies = [
+        ('main_app', '0005_auto_20240623_1919'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='product',
+            name='barcode',
+            field=models.IntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(assign_barcodes, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='product',
+            name='barcode',
+            field=models.IntegerField(blank=True, editable=False, null=True, unique=True),
+        ),
+    ]
@@ -1,4 +1,7 @@
-from django.db import models
+from django.db import models, transaction
+
+from main_app.barcodes import barcode_for
+from main_app.managers import ProductQuerySet
 
 
 class Product(models.Model):
@@ -31,7 +34,26 @@ class Product(models.Model):
         auto_now=True,
         editable=False,
     )
-    barcode = models.IntegerField()
+    barcode = models.IntegerField(
+        unique=True,
+        null=True,
+        blank=True,
+        editable=False,
+    )
+
+    objects = ProductQuerySet.as_manager()
+
+    def save(self, *args, **kwargs):
+        # The INSERT and the barcode UPDATE are one unit: a product is never
+        # left without its barcode.
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+            if self.barcode is None:
+                # The barcode is derived from the primary key, which only
+                # exists once the row has been inserted.
+                self.barcode = barcode_for(self.pk)
+                type(self).objects.filter(pk=self.pk).update(barcode=self.barcode)
 
     def __str__(self):
         return self.name
\ No newline at end of file
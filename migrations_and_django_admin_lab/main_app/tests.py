@@ -0,0 +1,61 @@
+from decimal import Decimal
+from importlib import import_module
+
+from django.db import IntegrityError
+from django.test import TestCase
+
+from main_app.barcodes import FIRST_BARCODE, LAST_BARCODE, barcode_for
+from main_app.models import Product
+
+
+def make_product(i):
+    return Product(name=f'Product {i}', price=Decimal('1.00'), category='Test', supplier='Test Ltd.')
+
+
+class BarcodeTests(TestCase):
+    def test_barcode_for_is_keyed_and_not_sequential(self):
+        codes = [barcode_for(i, key=1) for i in range(1, 10001)]
+
+        self.assertEqual(len(set(codes)), len(codes))
+        self.assertTrue(all(FIRST_BARCODE <= code <= LAST_BARCODE for code in codes))
+        self.assertNotEqual(sorted(codes), codes)
+        self.assertNotEqual(codes[:10], [barcode_for(i, key=2) for i in range(1, 11)])
+
+    def test_save_assigns_barcode_from_pk(self):
+        product = make_product(1)
+        product.save()
+
+        product.refresh_from_db()
+        self.assertEqual(product.barcode, barcode_for(product.pk))
+
+    def test_assign_barcodes_matches_python_in_one_update_per_batch(self):
+        Product.objects.bulk_create(make_product(i) for i in range(1000))
+
+        with self.assertNumQueries(1 + 4 * 3):
+            assigned = Product.objects.without_barcode().assign_barcodes(batch_size=250)
+
+        self.assertEqual(assigned, 1000)
+        self.assertFalse(Product.objects.without_barcode().exists())
+
+        for pk, barcode in Product.objects.values_list('pk', 'barcode'):
+            self.assertEqual(barcode, barcode_for(pk))
+
+    def test_save_rolls_back_the_insert_when_the_barcode_cannot_be_set(self):
+        first = make_product(1)
+        first.save()
+        # take the barcode the next product will be given
+        Product.objects.filter(pk=first.pk).update(barcode=barcode_for(first.pk + 1))
+
+        with self.assertRaises(IntegrityError):
+            make_product(2).save()
+
+        self.assertEqual(Product.objects.count(), 1)
+
+    def test_migration_assigns_the_codes_of_the_key_it_was_written_with(self):
+        migration = import_module('main_app.migrations.0006_product_barcode_unique')
+        Product.objects.bulk_create(make_product(i) for i in range(100))
+
+        Product.objects.update(barcode=migration.barcode_expression())
+
+        for pk, barcode in Product.objects.values_list('pk', 'barcode'):
+            self.assertEqual(barcode, barcode_for(pk, key=0x5D2A7C31))
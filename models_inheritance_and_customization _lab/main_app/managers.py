@@ -0,0 +1,92 @@
+from django.db import models
+from django.db.models import Prefetch
+from django.db.models.query import ModelIterable
+
+
+def subclass_paths(model, prefix=''):
+    """
+    select_related() paths to every multi-table subclass of model, children
+    before their own subclasses.
+    """
+    paths = []
+
+    for relation in model._meta.related_objects:
+        if relation.one_to_one and relation.parent_link:
+            path = f'{prefix}{relation.get_accessor_name()}'
+            paths.append(path)
+            paths.extend(subclass_paths(relation.related_model, f'{path}__'))
+
+    return paths
+
+
+def most_specific(obj, paths):
+    # select_related() cached every child, or None when the row has none
+    for path in reversed(paths):
+        child = obj
+
+        for name in path.split('__'):
+            child = child._state.fields_cache.get(name)
+
+            if child is None:
+                break
+        else:
+            return child
+
+    return obj
+
+
+class SubclassIterable(ModelIterable):
+    def __iter__(self):
+        query = self.queryset.query
+        paths = self.queryset._subclass_paths
+        # annotations and extra selects, which prefetch_related() relies on,
+        # are set on the base instance only
+        attnames = [*query.extra_select, *query.annotation_select]
+
+        for obj in super().__iter__():
+            child = most_specific(obj, paths)
+
+            if child is not obj:
+                for attname in attnames:
+                    setattr(child, attname, getattr(obj, attname))
+
+            yield child
+
+
+class PolymorphicQuerySet(models.QuerySet):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._subclass_paths = []
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._subclass_paths = self._subclass_paths
+
+        return clone
+
+    def select_subclasses(self):
+        """
+        Yields every row as an instance of its most specific subclass, read
+        in the same query through LEFT JOINs on the child tables.
+        """
+        paths = subclass_paths(self.model)
+        clone = self.select_related(*paths)
+        clone._subclass_paths = paths
+
+        if clone._iterable_class is ModelIterable:
+            clone._iterable_class = SubclassIterable
+
+        return clone
+
+
+class ZooKeeperQuerySet(models.QuerySet):
+    def with_managed_animals(self):
+        """
+        Prefetches every keeper's animals as Mammal, Bird, Reptile or Animal
+        instances: two queries however many keepers and animals there are.
+        """
+        animal_model = self.model._meta.get_field('managed_animals').related_model
+
+        return self.prefetch_related(
+            Prefetch('managed_animals', queryset=animal_model.objects.select_subclasses()),
+        )
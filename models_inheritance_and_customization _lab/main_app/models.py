@@ -3,6 +3,8 @@ from datetime import date
 from django.core.exceptions import ValidationError
 from django.db import models
 
+from main_app.managers import PolymorphicQuerySet, ZooKeeperQuerySet
+
 
 class BooleanChoiceField(models.BooleanField):
     def __init__(self, *args, **kwargs):
@@ -26,6 +28,8 @@ class Animal(models.Model):
         max_length=100,
     )
 
+    objects = PolymorphicQuerySet.as_manager()
+
     @property
     def age(self):
         age = date.today() - self.birth_date
@@ -85,6 +89,8 @@ class ZooKeeper(Employee):
         to=Animal,
     )
 
+    objects = ZooKeeperQuerySet.as_manager()
+
     def clean(self):
         if self.specialty not in ZooKeeper.SpecialtyChoices:
             raise ValidationError('Specialty must be a valid choice.')
@@ -1,3 +1,71 @@
+from decimal import Decimal
+
 from django.test import TestCase
 
+from main_app.models import Animal, Bird, Mammal, Reptile, ZooKeeper
+
+
 # Create your tests here.
+class PolymorphicAnimalTests(TestCase):
+    def create_keeper(self, number, animals_per_kind):
+        keeper = ZooKeeper.objects.create(
+            first_name=f"Keeper {number}",
+            last_name="Smith",
+            phone_number="0899524265",
+            specialty=ZooKeeper.SpecialtyChoices.OTHERS,
+        )
+        common = {'species': 'Species', 'birth_date': '2020-01-01', 'sound': 'Sound'}
+
+        for i in range(animals_per_kind):
+            keeper.managed_animals.add(
+                Animal.objects.create(name=f"Animal {number}-{i}", **common),
+                Mammal.objects.create(name=f"Mammal {number}-{i}", fur_color="Brown", **common),
+                Bird.objects.create(name=f"Bird {number}-{i}", wing_span=Decimal('28.50'), **common),
+                Reptile.objects.create(name=f"Reptile {number}-{i}", scale_type="Smooth", **common),
+            )
+
+    def describe_keepers(self):
+        return [
+            (
+                keeper.first_name,
+                [
+                    (type(animal).__name__, getattr(animal, 'fur_color', None) or
+                     getattr(animal, 'wing_span', None) or getattr(animal, 'scale_type', None))
+                    for animal in keeper.managed_animals.all()
+                ],
+            )
+            for keeper in ZooKeeper.objects.with_managed_animals().order_by('pk')
+        ]
+
+    def test_animals_are_downcast_in_one_query(self):
+        self.create_keeper(1, 1)
+
+        with self.assertNumQueries(1):
+            animals = list(Animal.objects.select_subclasses().order_by('pk'))
+
+        self.assertEqual(
+            [type(animal) for animal in animals],
+            [Animal, Mammal, Bird, Reptile],
+        )
+        self.assertEqual(animals[1].fur_color, "Brown")
+        self.assertEqual(animals[2].wing_span, Decimal('28.50'))
+
+    def test_keepers_with_animals_take_two_queries_at_any_size(self):
+        self.create_keeper(1, 1)
+
+        with self.assertNumQueries(2):
+            keepers = self.describe_keepers()
+
+        self.assertEqual(
+            sorted(keepers[0][1]),
+            [('Animal', None), ('Bird', Decimal('28.50')), ('Mammal', 'Brown'), ('Reptile', 'Smooth')],
+        )
+
+        for number in range(2, 6):
+            self.create_keeper(number, 5)
+
+        with self.assertNumQueries(2):
+            keepers = self.describe_keepers()
+
+        self.assertEqual(len(keepers), 5)
+        self.assertEqual(len(keepers[-1][1]), 20)
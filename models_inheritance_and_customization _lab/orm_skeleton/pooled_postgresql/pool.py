@@ -0,0 +1,239 @@
+"""
+Bounded, thread-safe pool of raw database connections.
+
+A checkout returns an idle connection if one is usable, opens a new one while
+fewer than max_size are open, and otherwise waits up to timeout seconds for
+one to be returned before raising PoolTimeout. Returned connections are
+rolled back if a transaction was left open and closed instead of pooled once
+they are older than max_lifetime or the pool is closed.
+
+There is one pool per process and set of connection parameters, so a forked
+worker never reuses its parent's sockets. stats() reports the counters of
+every pool in the process.
+"""
+import logging
+import os
+import threading
+import time
+
+from django.db.utils import OperationalError
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'max_size': 10,
+    'timeout': 5.0,
+    'max_lifetime': 3600.0,
+}
+
+
+class PoolTimeout(OperationalError):
+    pass
+
+
+class ConnectionPool:
+    def __init__(self, name, max_size, timeout, max_lifetime, health_checks):
+        self.name = name
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.health_checks = health_checks
+        self.closed = False
+
+        self._condition = threading.Condition()
+        self._idle = []
+        self._opened_at = {}
+        self._open = 0
+        self._counters = dict.fromkeys(
+            ('checkouts', 'waits', 'timeouts', 'connects', 'discards'), 0
+        )
+        self._wait_seconds = 0.0
+
+    def getconn(self, connect):
+        """Checks out a connection, opening it with connect() when needed."""
+        deadline = time.monotonic() + self.timeout
+
+        while True:
+            with self._condition:
+                wait_started = None
+
+                while not self._idle and self._open >= self.max_size:
+                    remaining = deadline - time.monotonic()
+
+                    if remaining <= 0:
+                        if wait_started is not None:
+                            self._wait_seconds += time.monotonic() - wait_started
+
+                        self._counters['timeouts'] += 1
+                        logger.warning("%s: no connection was returned within %ss", self.name, self.timeout)
+                        raise PoolTimeout(
+                            f"Connection pool {self.name} is exhausted: all {self.max_size} connections "
+                            f"stayed in use for {self.timeout}s."
+                        )
+
+                    if wait_started is None:
+                        wait_started = time.monotonic()
+                        self._counters['waits'] += 1
+
+                    self._condition.wait(remaining)
+
+                if wait_started is not None:
+                    self._wait_seconds += time.monotonic() - wait_started
+
+                connection = self._idle.pop() if self._idle else None
+
+                if connection is None:
+                    self._open += 1
+
+            if connection is None:
+                return self._connect(connect)
+
+            # The health check runs outside the lock, so a slow round trip
+            # doesn't hold up other checkouts.
+            if self._usable(connection):
+                with self._condition:
+                    self._counters['checkouts'] += 1
+
+                return connection
+
+            self.discard(connection)
+
+    def putconn(self, connection):
+        """Returns a checked out connection, closing it if it can't be reused."""
+        keep = not self.closed and not connection.closed and not self._expired(connection)
+
+        if keep and connection.get_transaction_status() != TRANSACTION_STATUS_IDLE:
+            try:
+                connection.rollback()
+            except Exception:
+                keep = False
+
+        with self._condition:
+            if keep:
+                self._idle.append(connection)
+            else:
+                self._discard(connection)
+
+            self._condition.notify()
+
+    def discard(self, connection):
+        """Closes a checked out connection instead of returning it."""
+        with self._condition:
+            self._discard(connection)
+            self._condition.notify()
+
+    def close(self):
+        """Closes idle connections now and every other one when returned."""
+        with self._condition:
+            self.closed = True
+
+            while self._idle:
+                self._discard(self._idle.pop())
+
+    def stats(self):
+        with self._condition:
+            return {
+                'max_size': self.max_size,
+                'open': self._open,
+                'idle': len(self._idle),
+                'in_use': self._open - len(self._idle),
+                **self._counters,
+                'wait_seconds': round(self._wait_seconds, 6),
+            }
+
+    def _connect(self, connect):
+        # A slot in self._open is already reserved for the new connection.
+        try:
+            connection = connect()
+        except BaseException:
+            with self._condition:
+                self._open -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._opened_at[id(connection)] = time.monotonic()
+            self._counters['connects'] += 1
+            self._counters['checkouts'] += 1
+
+        return connection
+
+    def _expired(self, connection):
+        opened_at = self._opened_at.get(id(connection))
+
+        return opened_at is None or time.monotonic() - opened_at > self.max_lifetime
+
+    def _usable(self, connection):
+        if connection.closed or self._expired(connection):
+            return False
+
+        if not self.health_checks:
+            return True
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+        except Exception:
+            return False
+
+        return True
+
+    def _discard(self, connection):
+        # Called with the condition held.
+        self._opened_at.pop(id(connection), None)
+        self._open -= 1
+        self._counters['discards'] += 1
+
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+_pools = {}
+_pools_pid = None
+_pools_lock = threading.Lock()
+
+
+def get_pool(conn_params, options, health_checks):
+    """Returns this process's pool for conn_params, creating it on first use."""
+    global _pools_pid
+
+    key = tuple(sorted((name, repr(value)) for name, value in conn_params.items()))
+
+    with _pools_lock:
+        if _pools_pid != os.getpid():
+            # Connections inherited from a parent process belong to it.
+            _pools.clear()
+            _pools_pid = os.getpid()
+
+        pool = _pools.get(key)
+
+        if pool is None or pool.closed:
+            name = '{user}@{host}:{port}/{dbname}'.format_map({
+                'user': conn_params.get('user', ''),
+                'host': conn_params.get('host', ''),
+                'port': conn_params.get('port', ''),
+                'dbname': conn_params.get('dbname', ''),
+            })
+            pool = _pools[key] = ConnectionPool(name, health_checks=health_checks, **{**DEFAULTS, **options})
+
+        return pool
+
+
+def close_pools(dbname=None):
+    """Closes every pool, or those connected to database dbname."""
+    with _pools_lock:
+        for key, pool in list(_pools.items()):
+            if dbname is None or dict(key).get('dbname') == repr(dbname):
+                pool.close()
+                del _pools[key]
+
+
+def stats():
+    """Counters of every pool in this process, keyed by user@host:port/dbname."""
+    with _pools_lock:
+        pools = list(_pools.values())
+
+    return {pool.name: pool.stats() for pool in pools}
@@ -0,0 +1,31 @@
+from django.contrib.postgres.constraints import ExclusionConstraint
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+class PostgreSQLExclusionConstraint(ExclusionConstraint):
+    """
+    ExclusionConstraint that is only created on PostgreSQL, the one database
+    that has them, so the app still migrates and tests elsewhere. Code that
+    relies on it checks for conflicts itself on other databases.
+    """
+    def constraint_sql(self, model, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return None
+
+        return super().constraint_sql(model, schema_editor)
+
+    def create_sql(self, model, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return None
+
+        return super().create_sql(model, schema_editor)
+
+    def remove_sql(self, model, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return None
+
+        return super().remove_sql(model, schema_editor)
+
+    def validate(self, model, instance, exclude=None, using=DEFAULT_DB_ALIAS):
+        if connections[using].vendor == 'postgresql':
+            super().validate(model, instance, exclude=exclude, using=using)
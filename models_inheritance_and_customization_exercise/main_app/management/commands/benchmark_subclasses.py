@@ -0,0 +1,111 @@
+import json
+import time
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from main_app.managers import subclass_paths
+from main_app.models import (
+    Assassin, DemonHunter, FelbladeDemonHunter, Mage, Necromancer, ShadowbladeAssassin, TimeMage,
+    VengeanceDemonHunter, ViperAssassin,
+)
+
+HIERARCHIES = {
+    Mage: {
+        Mage: {'elemental_power': 'Fire', 'spellbook_type': 'Grimoire'},
+        TimeMage: {'time_magic_mastery': 'High', 'temporal_shift_ability': 'Rewind'},
+        Necromancer: {'raise_dead_ability': 'Raise Undead Army'},
+    },
+    Assassin: {
+        Assassin: {'weapon_type': 'Dagger', 'assassination_technique': 'Stealth'},
+        ViperAssassin: {'venomous_strikes_mastery': 'High', 'venomous_bite_ability': 'Paralyze'},
+        ShadowbladeAssassin: {'shadowstep_ability': 'Blink'},
+    },
+    DemonHunter: {
+        DemonHunter: {'weapon_type': 'Glaives', 'demon_slaying_ability': 'Banish'},
+        VengeanceDemonHunter: {'vengeance_mastery': 'High', 'retribution_ability': 'Spite'},
+        FelbladeDemonHunter: {'felblade_ability': 'Fel Rush'},
+    },
+}
+
+
+def seed(size):
+    for hierarchy in HIERARCHIES.values():
+        base_fields = hierarchy[next(iter(hierarchy))]
+
+        for model, fields in hierarchy.items():
+            for i in range(size):
+                model.objects.create(
+                    name=f'{model.__name__} {i}',
+                    description='Synthetic character',
+                    **{**base_fields, **fields},
+                )
+
+
+def naive(base):
+    # probe every child accessor of every row, as the exercise code would
+    paths = subclass_paths(base)
+    result = []
+
+    for character in base.objects.all():
+        concrete = character
+
+        for path in paths:
+            try:
+                concrete = getattr(character, path)
+                break
+            except ObjectDoesNotExist:
+                continue
+
+        result.append(concrete)
+
+    return result
+
+
+def polymorphic(base):
+    return list(base.objects.select_subclasses())
+
+
+def measure(strategy, base):
+    queries = []
+
+    def count(execute, sql, params, many, context):
+        queries.append(sql)
+
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(count):
+        start = time.perf_counter()
+        characters = strategy(base)
+        seconds = time.perf_counter() - start
+
+    return {
+        'hierarchy': base.__name__,
+        'strategy': strategy.__name__,
+        'rows': len(characters),
+        'seconds': round(seconds, 6),
+        'queries': len(queries),
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares loading the character hierarchies as concrete subclasses with select_subclasses() "
+        "against probing child accessors per row. Prints JSON; seeded rows are rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--size', type=int, default=1000, help="Characters seeded per concrete class.")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            seed(options['size'])
+            results = [
+                measure(strategy, base)
+                for base in HIERARCHIES
+                for strategy in (naive, polymorphic)
+            ]
+            transaction.set_rollback(True)
+
+        self.stdout.write(json.dumps({'size': options['size'], 'results': results}, indent=2))
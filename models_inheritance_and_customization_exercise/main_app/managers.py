@@ -0,0 +1,166 @@
+from django.contrib.postgres.fields import DateRangeField
+from django.db import models
+from django.db.models import Count, Exists, OuterRef, Q
+from django.db.models.query import ModelIterable
+
+
+class Stay(models.Func):
+    """
+    The inclusive daterange between two date expressions. Both ends are
+    occupied, as in the original overlap check.
+    """
+    function = 'DATERANGE'
+    template = "%(function)s(%(expressions)s, '[]')"
+    output_field = DateRangeField()
+
+
+def subclass_paths(model, prefix=''):
+    """
+    select_related() paths to every multi-table subclass of model, children
+    before their own subclasses.
+    """
+    paths = []
+
+    for relation in model._meta.related_objects:
+        if relation.one_to_one and relation.parent_link:
+            path = f'{prefix}{relation.get_accessor_name()}'
+            paths.append(path)
+            paths.extend(subclass_paths(relation.related_model, f'{path}__'))
+
+    return paths
+
+
+def most_specific(obj, paths):
+    # select_related() cached every child, or None when the row has none
+    for path in reversed(paths):
+        child = obj
+
+        for name in path.split('__'):
+            child = child._state.fields_cache.get(name)
+
+            if child is None:
+                break
+        else:
+            return child
+
+    return obj
+
+
+class SubclassIterable(ModelIterable):
+    def __iter__(self):
+        query = self.queryset.query
+        paths = self.queryset._subclass_paths
+        # annotations and extra selects, which prefetch_related() relies on,
+        # are set on the base instance only
+        attnames = [*query.extra_select, *query.annotation_select]
+
+        for obj in super().__iter__():
+            child = most_specific(obj, paths)
+
+            if child is not obj:
+                for attname in attnames:
+                    setattr(child, attname, getattr(obj, attname))
+
+            yield child
+
+
+class PolymorphicQuerySet(models.QuerySet):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._subclass_paths = []
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._subclass_paths = self._subclass_paths
+
+        return clone
+
+    def select_subclasses(self):
+        """
+        Yields every row as an instance of its most specific subclass, read
+        in the same query through LEFT JOINs on the child tables.
+        """
+        paths = subclass_paths(self.model)
+        clone = self.select_related(*paths)
+        clone._subclass_paths = paths
+
+        if clone._iterable_class is ModelIterable:
+            clone._iterable_class = SubclassIterable
+
+        return clone
+
+
+class MessageQuerySet(models.QuerySet):
+    def inbox(self, user):
+        return self.filter(receiver=user).order_by('-timestamp', '-id')
+
+    def outbox(self, user):
+        return self.filter(sender=user).order_by('-timestamp', '-id')
+
+    def thread(self, user, other):
+        return self.filter(
+            Q(sender=user, receiver=other) | Q(sender=other, receiver=user)
+        ).order_by('-timestamp', '-id')
+
+    def page(self, after=None, size=20):
+        """
+        One page of an inbox, outbox or thread, newest first, and the cursor of
+        the next page (None on the last one). The cursor is the (timestamp, id)
+        of the last message shown, so a page reads size rows from the
+        (receiver|sender, timestamp, id) index however deep it is.
+        """
+        messages = self
+
+        if after is not None:
+            timestamp, pk = after
+            messages = messages.filter(timestamp__lte=timestamp).filter(
+                Q(timestamp__lt=timestamp) | Q(pk__lt=pk)
+            )
+
+        messages = list(messages[:size + 1])
+        has_next = len(messages) > size
+        messages = messages[:size]
+
+        return messages, (messages[-1].timestamp, messages[-1].pk) if has_next else None
+
+    def unread(self):
+        return self.filter(is_read=False)
+
+    def unread_count(self, user):
+        return self.unread().filter(receiver=user).count()
+
+    def unread_counts(self, users):
+        """
+        {user id: unread messages} for the given users, in one query.
+        """
+        counts = dict(
+            self.unread()
+            .filter(receiver__in=users)
+            .order_by()
+            .values_list('receiver')
+            .annotate(count=Count('pk'))
+        )
+
+        return {user.pk: counts.get(user.pk, 0) for user in users}
+
+    def mark_as_read(self):
+        return self.unread().update(is_read=True)
+
+
+class RoomOccupancyQuerySet(models.QuerySet):
+    def overlapping(self, start_date, end_date):
+        # both ends are inclusive, like Stay
+        return self.filter(start_date__lte=end_date, end_date__gte=start_date)
+
+
+class RoomQuerySet(models.QuerySet):
+    def free_between(self, start_date, end_date):
+        """
+        Rooms with no reservation of any type between the two dates, found with
+        one anti-join against the occupancies.
+        """
+        occupancies = self.model.occupancies.field.model.objects
+
+        return self.filter(~Exists(
+            occupancies.overlapping(start_date, end_date).filter(room=OuterRef('pk'))
+        ))
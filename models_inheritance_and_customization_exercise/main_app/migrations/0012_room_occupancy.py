@@ -0,0 +1,102 @@
+# Generated by Django 5.0.4 on 2026-10-18 17:46
+
+import django.db.models.deletion
+import main_app.constraints
+import main_app.managers
+from django.contrib.postgres.operations import BtreeGistExtension
+from django.db import IntegrityError, migrations, models
+
+RESERVATION_MODELS = ('RegularReservation', 'SpecialReservation')
+
+
+def overlapping_reservations(apps):
+    """
+    Pairs of reservations, of any type, that hold the same room on the same
+    day. Both ends of a stay are occupied.
+    """
+    stays = sorted(
+        (room_id, start_date, end_date, f'{model_name} {pk}')
+        for model_name in RESERVATION_MODELS
+        for pk, room_id, start_date, end_date in apps.get_model('main_app', model_name).objects.values_list(
+            'pk', 'room_id', 'start_date', 'end_date',
+        ).iterator()
+    )
+
+    conflicts = []
+    latest = None
+
+    for stay in stays:
+        if latest is not None and latest[0] == stay[0] and stay[1] <= latest[2]:
+            conflicts.append((latest[3], stay[3]))
+
+        if latest is None or latest[0] != stay[0] or stay[2] > latest[2]:
+            latest = stay
+
+    return conflicts
+
+
+def add_occupancies(apps, schema_editor):
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    RoomOccupancy = apps.get_model('main_app', 'RoomOccupancy')
+
+    # reservations of different types could overlap before; they have to be
+    # moved or cancelled by hand, as room_occupancy_no_overlap would reject
+    # them on PostgreSQL and SQLite would keep a double-booked room
+    conflicts = overlapping_reservations(apps)
+
+    if conflicts:
+        raise IntegrityError(
+            "Resolve the overlapping reservations before migrating: "
+            + ', '.join(f'{first} and {second}' for first, second in conflicts)
+        )
+
+    for model_name in RESERVATION_MODELS:
+        content_type, _ = ContentType.objects.get_or_create(app_label='main_app', model=model_name.lower())
+        reservations = apps.get_model('main_app', model_name).objects.order_by('pk')
+
+        RoomOccupancy.objects.bulk_create(
+            (
+                RoomOccupancy(
+                    room_id=reservation.room_id,
+                    start_date=reservation.start_date,
+                    end_date=reservation.end_date,
+                    content_type=content_type,
+                    object_id=reservation.pk,
+                )
+                for reservation in reservations.iterator()
+            ),
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('main_app', '0011_regularreservation_specialreservation'),
+    ]
+
+    operations = [
+        # CREATE EXTENSION only runs on PostgreSQL
+        BtreeGistExtension(),
+        migrations.CreateModel(
+            name='RoomOccupancy',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start_date', models.DateField()),
+                ('end_date', models.DateField()),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+                ('room', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='occupancies', to='main_app.room')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='roomoccupancy',
+            constraint=main_app.constraints.PostgreSQLExclusionConstraint(expressions=[('room', '='), (main_app.managers.Stay('start_date', 'end_date'), '&&')], name='room_occupancy_no_overlap'),
+        ),
+        migrations.AddConstraint(
+            model_name='roomoccupancy',
+            constraint=models.UniqueConstraint(fields=('content_type', 'object_id'), name='room_occupancy_reservation_unique'),
+        ),
+        migrations.RunPython(add_occupancies, migrations.RunPython.noop),
+    ]
@@ -1,8 +1,14 @@
 from datetime import timedelta
 from decimal import Decimal
 
+from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.fields import RangeOperators
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import IntegrityError, connection, models, transaction
+
+from main_app.constraints import PostgreSQLExclusionConstraint
+from main_app.managers import MessageQuerySet, PolymorphicQuerySet, RoomOccupancyQuerySet, RoomQuerySet, Stay
 
 
 class BaseCharacter(models.Model):
@@ -25,6 +31,8 @@ class Mage(BaseCharacter):
         max_length=100,
     )
 
+    objects = PolymorphicQuerySet.as_manager()
+
 
 class Assassin(BaseCharacter):
     weapon_type = models.CharField(
@@ -35,6 +43,8 @@ class Assassin(BaseCharacter):
         max_length=100,
     )
 
+    objects = PolymorphicQuerySet.as_manager()
+
 
 class DemonHunter(BaseCharacter):
     weapon_type = models.CharField(
@@ -45,6 +55,8 @@ class DemonHunter(BaseCharacter):
         max_length=100,
     )
 
+    objects = PolymorphicQuerySet.as_manager()
+
 
 class TimeMage(Mage):
     time_magic_mastery = models.CharField(
@@ -133,8 +145,18 @@ class Message(models.Model):
         default=False,
     )
 
+    objects = MessageQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['receiver', 'timestamp', 'id'], name='message_inbox_idx'),
+            models.Index(fields=['sender', 'timestamp', 'id'], name='message_outbox_idx'),
+            models.Index(fields=['receiver'], condition=models.Q(is_read=False), name='message_unread_idx'),
+        ]
+
     def mark_as_read(self) -> None:
         self.is_read = True
+        self.save(update_fields=['is_read'])
 
     def reply_to_message(self, reply_content: str) -> "Message":
         reply = Message(
@@ -237,6 +259,8 @@ class Room(models.Model):
         decimal_places=2,
     )
 
+    objects = RoomQuerySet.as_manager()
+
     def clean(self) -> None:
         if self.capacity < self.total_guests:
             raise ValidationError("Total guests are more than the capacity of the room")
@@ -249,6 +273,50 @@ class Room(models.Model):
         return f"Room {self.number} created successfully"
 
 
+class RoomOccupancy(models.Model):
+    """
+    The period a reservation of any type holds its room. On PostgreSQL the
+    exclusion constraint lets the database reject overlapping stays
+    atomically; elsewhere reservations check for them before saving.
+    """
+    room = models.ForeignKey(
+        to=Room,
+        on_delete=models.CASCADE,
+        related_name='occupancies',
+    )
+
+    start_date = models.DateField()
+
+    end_date = models.DateField()
+
+    content_type = models.ForeignKey(
+        to=ContentType,
+        on_delete=models.CASCADE,
+    )
+
+    object_id = models.PositiveBigIntegerField()
+
+    reservation = GenericForeignKey('content_type', 'object_id')
+
+    objects = RoomOccupancyQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            PostgreSQLExclusionConstraint(
+                name='room_occupancy_no_overlap',
+                expressions=[
+                    ('room', RangeOperators.EQUAL),
+                    (Stay('start_date', 'end_date'), RangeOperators.OVERLAPS),
+                ],
+                index_type='gist',
+            ),
+            models.UniqueConstraint(
+                fields=['content_type', 'object_id'],
+                name='room_occupancy_reservation_unique',
+            ),
+        ]
+
+
 class BaseReservation(models.Model):
     class Meta:
         abstract = True
@@ -262,6 +330,10 @@ class BaseReservation(models.Model):
 
     end_date = models.DateField()
 
+    occupancy = GenericRelation(
+        to=RoomOccupancy,
+    )
+
     def reservation_period(self) -> int:
         return (self.end_date - self.start_date).days
 
@@ -272,26 +344,69 @@ class BaseReservation(models.Model):
 
     @property
     def is_available(self) -> bool:
-
-        reservations = self.__class__.objects.filter(
-            room=self.room,
-            end_date__gte=self.start_date,
-            start_date__lte=self.end_date,
+        reservations = RoomOccupancy.objects.overlapping(
+            self.start_date,
+            self.end_date,
+        ).filter(
+            room=self.room_id,
         )
 
+        if self.pk is not None:
+            reservations = reservations.exclude(
+                content_type=ContentType.objects.get_for_model(self),
+                object_id=self.pk,
+            )
+
         return not reservations.exists()
 
-    def clean(self) -> None:
+    def clean_period(self) -> None:
         if self.start_date >= self.end_date:
             raise ValidationError("Start date cannot be after or in the same end date")
 
+    def clean(self) -> None:
+        self.clean_period()
+
         if not self.is_available:
             raise ValidationError(f"Room {self.room.number} cannot be reserved")
 
+    def save(self, *args, **kwargs) -> None:
+        # on PostgreSQL availability is enforced by room_occupancy_no_overlap
+        # when the occupancy is written, so no separate overlap query is needed
+        self.clean_period()
+
+        try:
+            with transaction.atomic():
+                if connection.vendor != 'postgresql' and not self.is_available:
+                    raise ValidationError(f"Room {self.room.number} cannot be reserved")
+
+                super().save(*args, **kwargs)
+                self._save_occupancy()
+        except IntegrityError as error:
+            if getattr(getattr(error.__cause__, 'diag', None), 'constraint_name', None) == 'room_occupancy_no_overlap':
+                raise ValidationError(f"Room {self.room.number} cannot be reserved")
+
+            raise
+
+    def _save_occupancy(self) -> None:
+        content_type = ContentType.objects.get_for_model(self)
+
+        updated = RoomOccupancy.objects.filter(
+            content_type=content_type,
+            object_id=self.pk,
+        ).update(room=self.room_id, start_date=self.start_date, end_date=self.end_date)
+
+        if not updated:
+            RoomOccupancy.objects.create(
+                room_id=self.room_id,
+                start_date=self.start_date,
+                end_date=self.end_date,
+                content_type=content_type,
+                object_id=self.pk,
+            )
+
 
 class RegularReservation(BaseReservation):
     def save(self, *args, **kwargs) -> str:
-        super().clean()
         super().save(*args, **kwargs)
 
         return f"Regular reservation for room {self.room.number}"
@@ -299,7 +414,6 @@ class RegularReservation(BaseReservation):
 
 class SpecialReservation(BaseReservation):
     def save(self, *args, **kwargs) -> str:
-        super().clean()
         super().save(*args, **kwargs)
 
         return f"Special reservation for room {self.room.number}"
@@ -307,9 +421,9 @@ class SpecialReservation(BaseReservation):
     def extend_reservation(self, days: int) -> str:
         self.end_date += timedelta(days=days)
 
-        if not self.is_available:
+        try:
+            self.save()
+        except ValidationError:
             raise ValidationError("Error during extending reservation")
 
-        self.save()
-
         return f"Extended reservation for room {self.room.number} with {days} days"
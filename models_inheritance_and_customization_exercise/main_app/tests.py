@@ -1,3 +1,196 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from importlib import import_module
+
+from django.apps import apps
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError
+from django.db.models import Value
+from django.db.models.functions import Length
 from django.test import TestCase
+from django.utils import timezone
+
+from main_app.models import (
+    Hotel, Mage, Message, Necromancer, RegularReservation, Room, RoomOccupancy, SpecialReservation, TimeMage,
+    UserProfile,
+)
+
 
 # Create your tests here.
+class SelectSubclassesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.mage = Mage.objects.create(name='Mage', description='-', elemental_power='Fire', spellbook_type='Red')
+        cls.time_mage = TimeMage.objects.create(
+            name='Time Mage', description='-', elemental_power='Time', spellbook_type='Blue',
+            time_magic_mastery='High', temporal_shift_ability='Rewind',
+        )
+        cls.necromancer = Necromancer.objects.create(
+            name='Necromancer', description='-', elemental_power='Death', spellbook_type='Black',
+            raise_dead_ability='Skeletons',
+        )
+
+    def test_rows_come_back_as_their_concrete_class_in_one_query(self):
+        with self.assertNumQueries(1):
+            mages = list(Mage.objects.select_subclasses().order_by('pk'))
+
+        self.assertEqual([type(mage) for mage in mages], [Mage, TimeMage, Necromancer])
+        self.assertEqual(mages, [self.mage, self.time_mage, self.necromancer])
+        self.assertEqual(mages[1].temporal_shift_ability, 'Rewind')
+        self.assertEqual(mages[2].raise_dead_ability, 'Skeletons')
+
+    def test_filters_and_plain_querysets_are_unaffected(self):
+        self.assertEqual(type(Mage.objects.select_subclasses().get(name='Time Mage')), TimeMage)
+        self.assertEqual({type(mage) for mage in Mage.objects.all()}, {Mage})
+        self.assertEqual(list(Mage.objects.select_subclasses().values_list('name', flat=True).order_by('pk')), [
+            'Mage', 'Time Mage', 'Necromancer',
+        ])
+
+    def test_annotations_are_kept_on_the_child(self):
+        mages = Mage.objects.select_subclasses().annotate(
+            name_length=Length('name'),
+            kind=Value('caster'),
+        ).order_by('pk')
+
+        self.assertEqual([(type(mage), mage.name_length, mage.kind) for mage in mages], [
+            (Mage, 4, 'caster'),
+            (TimeMage, 9, 'caster'),
+            (Necromancer, 11, 'caster'),
+        ])
+
+    def test_prefetch_related_through_it(self):
+        with self.assertNumQueries(2):
+            mages = list(Mage.objects.select_subclasses().prefetch_related('necromancer').order_by('pk'))
+
+            self.assertEqual(mages[2].necromancer, self.necromancer)
+            self.assertFalse(hasattr(mages[0], 'necromancer'))
+
+
+class MessageQuerySetTests(TestCase):
+    def setUp(self):
+        self.john, self.jane, self.alice = UserProfile.objects.bulk_create(
+            UserProfile(username=name, email=f'{name}@example.com')
+            for name in ('john', 'jane', 'alice')
+        )
+
+        now = timezone.now()
+        self.messages = Message.objects.bulk_create(
+            Message(sender=self.john, receiver=self.jane, content=f"Message {i}")
+            for i in range(25)
+        )
+        # two messages share every timestamp, so pages must break ties on id
+        for i, message in enumerate(self.messages):
+            message.timestamp = now - timedelta(minutes=i // 2)
+
+        Message.objects.bulk_update(self.messages, ['timestamp'])
+        Message.objects.create(sender=self.jane, receiver=self.john, content="Reply")
+        Message.objects.create(sender=self.alice, receiver=self.jane, content="Hi")
+
+    def test_pages_walk_the_inbox_without_gaps_or_repeats(self):
+        seen = []
+        cursor = None
+
+        while True:
+            with self.assertNumQueries(1):
+                page, cursor = Message.objects.inbox(self.jane).page(after=cursor, size=4)
+
+            seen.extend(page)
+
+            if cursor is None:
+                break
+
+        self.assertEqual(seen, list(Message.objects.inbox(self.jane)))
+        self.assertEqual(len(seen), 26)
+
+    def test_unread_counters(self):
+        self.assertEqual(Message.objects.unread_count(self.jane), 26)
+
+        with self.assertNumQueries(1):
+            counts = Message.objects.unread_counts([self.john, self.jane, self.alice])
+
+        self.assertEqual(counts, {self.john.pk: 1, self.jane.pk: 26, self.alice.pk: 0})
+
+    def test_thread_is_marked_as_read_with_one_update(self):
+        with self.assertNumQueries(1):
+            marked = Message.objects.thread(self.jane, self.john).filter(receiver=self.jane).mark_as_read()
+
+        self.assertEqual(marked, 25)
+        self.assertEqual(Message.objects.unread_count(self.jane), 1)
+        self.assertEqual(Message.objects.unread_count(self.john), 1)
+
+    def test_mark_as_read_saves_the_message(self):
+        message = self.messages[0]
+        message.mark_as_read()
+
+        self.assertTrue(Message.objects.get(pk=message.pk).is_read)
+
+
+class ReservationTests(TestCase):
+    def setUp(self):
+        hotel = Hotel.objects.create(name='Hotel', address='Street 1')
+        self.room = Room.objects.create(hotel=hotel, number='101', capacity=2, total_guests=1, price_per_night=Decimal('100.00'))
+        self.other_room = Room.objects.create(hotel=hotel, number='102', capacity=2, total_guests=1, price_per_night=Decimal('100.00'))
+        self.regular = RegularReservation(room=self.room, start_date=date(2024, 1, 1), end_date=date(2024, 1, 5))
+        self.regular.save()
+
+    def test_overlapping_reservation_of_another_type_is_rejected(self):
+        special = SpecialReservation(room=self.room, start_date=date(2024, 1, 5), end_date=date(2024, 1, 8))
+
+        with self.assertRaisesMessage(ValidationError, 'Room 101 cannot be reserved'):
+            special.save()
+
+        self.assertFalse(SpecialReservation.objects.exists())
+        self.assertEqual(RoomOccupancy.objects.count(), 1)
+
+    def test_overlapping_reservation_of_the_same_type_is_rejected(self):
+        with self.assertRaises(ValidationError):
+            RegularReservation(room=self.room, start_date=date(2023, 12, 30), end_date=date(2024, 1, 2)).save()
+
+    def test_free_stays_and_rooms_can_be_reserved(self):
+        SpecialReservation(room=self.room, start_date=date(2024, 1, 6), end_date=date(2024, 1, 8)).save()
+        SpecialReservation(room=self.other_room, start_date=date(2024, 1, 1), end_date=date(2024, 1, 4)).save()
+
+        self.assertEqual(RoomOccupancy.objects.count(), 3)
+        self.assertQuerySetEqual(Room.objects.free_between(date(2024, 1, 5), date(2024, 1, 5)), [self.other_room])
+
+    def test_extending_checks_the_other_types_but_not_itself(self):
+        special = SpecialReservation(room=self.room, start_date=date(2024, 1, 6), end_date=date(2024, 1, 8))
+        special.save()
+
+        self.assertTrue(special.is_available)
+        special.extend_reservation(2)
+        self.assertEqual(RoomOccupancy.objects.get(object_id=special.pk, end_date=date(2024, 1, 10)).room, self.room)
+
+        RegularReservation(room=self.room, start_date=date(2024, 1, 12), end_date=date(2024, 1, 14)).save()
+
+        with self.assertRaisesMessage(ValidationError, 'Error during extending reservation'):
+            special.extend_reservation(2)
+
+    def test_deleting_a_reservation_frees_the_room(self):
+        self.regular.delete()
+
+        self.assertFalse(RoomOccupancy.objects.exists())
+        SpecialReservation(room=self.room, start_date=date(2024, 1, 1), end_date=date(2024, 1, 5)).save()
+
+    def test_migration_refuses_overlapping_legacy_reservations(self):
+        migration = import_module('main_app.migrations.0012_room_occupancy')
+        # bulk_create skips save(), like the reservations written before 0012
+        clash, free, _ = SpecialReservation.objects.bulk_create([
+            SpecialReservation(room=self.room, start_date=date(2024, 1, 5), end_date=date(2024, 1, 8)),
+            SpecialReservation(room=self.room, start_date=date(2024, 1, 9), end_date=date(2024, 1, 10)),
+            SpecialReservation(room=self.other_room, start_date=date(2024, 1, 1), end_date=date(2024, 1, 5)),
+        ])
+        RoomOccupancy.objects.all().delete()
+
+        with self.assertRaisesMessage(
+            IntegrityError, f'RegularReservation {self.regular.pk} and SpecialReservation {clash.pk}',
+        ) as error:
+            migration.add_occupancies(apps, None)
+
+        self.assertNotIn(f'SpecialReservation {free.pk}', str(error.exception))
+        self.assertFalse(RoomOccupancy.objects.exists())
+
+        clash.delete()
+        migration.add_occupancies(apps, None)
+
+        self.assertEqual(RoomOccupancy.objects.count(), 3)
@@ -87,9 +87,9 @@ def add_records_to_database():
                author_name="Jane Johnson", rating=2),
     ]
 
-    Author.objects.bulk_create(authors)
-    Book.objects.bulk_create(books)
-    Review.objects.bulk_create(reviews)
+    Author.objects.bulk_load(authors)
+    Book.objects.bulk_load(books)
+    Review.objects.bulk_load(reviews)
     return "Records added to tables Authors, Books and Reviews"
 
 
@@ -0,0 +1,107 @@
+"""
+Bulk loading of model instances or plain mappings (rows of a CSV file, lines
+of a JSONL file) in constant memory.
+
+On PostgreSQL every batch is written into an in-memory CSV buffer and sent with
+COPY ... FROM STDIN, which skips parsing and planning an INSERT per batch.
+COPY cannot return the primary keys it inserts, so automatic keys are reserved
+from the table's sequence first and sent along with the rows. Other databases
+fall back to bulk_create() batch by batch.
+
+Either way fields are filled in like in save(): mappings are turned into model
+instances, so field defaults apply, and pre_save() runs, so auto_now_add and
+auto_now get the current time. Instances get their primary key set.
+"""
+import io
+from itertools import islice
+
+from django.db import connections, transaction
+from django.db.models import QuerySet
+from django.db.models.fields import AutoFieldMixin
+
+DEFAULT_BATCH_SIZE = 10_000
+
+
+def _instances(model, rows):
+    for row in rows:
+        yield row if isinstance(row, model) else model(**row)
+
+
+def _csv_value(value):
+    # COPY's CSV format reads an unquoted empty value as NULL and anything
+    # quoted as data, so every value but None is quoted.
+    if value is None:
+        return ''
+
+    return '"%s"' % str(value).replace('"', '""')
+
+
+def _reserve_pks(cursor, meta, count):
+    cursor.execute(
+        'SELECT nextval(pg_get_serial_sequence(%s, %s)) FROM generate_series(1, %s)',
+        [meta.db_table, meta.pk.column, count],
+    )
+
+    return [pk for pk, in cursor.fetchall()]
+
+
+def _copy_batch(cursor, connection, meta, fields, batch):
+    missing_pks = [obj for obj in batch if obj.pk is None]
+
+    if missing_pks and isinstance(meta.pk, AutoFieldMixin):
+        for obj, pk in zip(missing_pks, _reserve_pks(cursor, meta, len(missing_pks))):
+            obj.pk = pk
+
+    buffer = io.StringIO()
+
+    for obj in batch:
+        values = (field.get_db_prep_save(field.pre_save(obj, add=True), connection) for field in fields)
+        buffer.write(','.join(_csv_value(value) for value in values) + '\n')
+
+    buffer.seek(0)
+    quote = connection.ops.quote_name
+    columns = ', '.join(quote(field.column) for field in fields)
+    cursor.copy_expert(f'COPY {quote(meta.db_table)} ({columns}) FROM STDIN WITH (FORMAT csv)', buffer)
+
+    for obj in batch:
+        obj._state.adding = False
+        obj._state.db = connection.alias
+
+
+def bulk_load(queryset, rows, batch_size=None):
+    """
+    Inserts rows, model instances or mappings of field names to values, and
+    returns how many were inserted. rows may be any iterable, including a
+    generator over a file; only batch_size rows are held at a time.
+    queryset may be a manager; only its model and database are used.
+    """
+    queryset = queryset.all() if not isinstance(queryset, QuerySet) else queryset
+    model = queryset.model
+    meta = model._meta
+    connection = connections[queryset.db]
+    batch_size = batch_size or DEFAULT_BATCH_SIZE
+
+    if meta.parents:
+        raise ValueError("Can't bulk load a multi-table inherited model")
+
+    fields = [field for field in meta.concrete_fields if not field.generated]
+    copy = connection.vendor == 'postgresql'
+    instances = _instances(model, rows)
+    loaded = 0
+
+    with transaction.atomic(using=queryset.db, savepoint=False):
+        while batch := list(islice(instances, batch_size)):
+            if copy:
+                with connection.cursor() as cursor:
+                    _copy_batch(cursor, connection, meta, fields, batch)
+            else:
+                queryset.bulk_create(batch)
+
+            loaded += len(batch)
+
+    return loaded
+
+
+class BulkLoadQuerySet(QuerySet):
+    def bulk_load(self, rows, batch_size=None):
+        return bulk_load(self, rows, batch_size=batch_size)
@@ -0,0 +1,57 @@
+import csv
+import json
+import time
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from main_app.bulk_load import bulk_load
+
+FORMATS = ('csv', 'jsonl')
+
+
+def read_csv(path):
+    with open(path, newline='', encoding='utf-8') as file:
+        for row in csv.DictReader(file):
+            # An empty cell means "not given", so the field default applies.
+            yield {name: value for name, value in row.items() if value != ''}
+
+
+def read_jsonl(path):
+    with open(path, encoding='utf-8') as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+READERS = {'csv': read_csv, 'jsonl': read_jsonl}
+
+
+class Command(BaseCommand):
+    help = (
+        "Streams a CSV file (with a header row of field names) or a JSONL file "
+        "(one object per line) into a model's table in constant memory."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('model', help="Model label, e.g. main_app.Laptop.")
+        parser.add_argument('path')
+        parser.add_argument('--format', choices=FORMATS, help="Defaults to the file extension.")
+        parser.add_argument('--batch-size', type=int, help="Rows sent per COPY or INSERT.")
+
+    def handle(self, *args, **options):
+        try:
+            model = apps.get_model(options['model'])
+        except (LookupError, ValueError) as error:
+            raise CommandError(error)
+
+        file_format = options['format'] or options['path'].rsplit('.', 1)[-1].lower()
+
+        if file_format not in READERS:
+            raise CommandError(f"Unknown format {file_format!r}, use --format {' or '.join(FORMATS)}.")
+
+        start = time.perf_counter()
+        loaded = bulk_load(model._default_manager, READERS[file_format](options['path']), batch_size=options['batch_size'])
+        elapsed = time.perf_counter() - start
+
+        self.stdout.write(self.style.SUCCESS(f"Loaded {loaded} {model._meta.verbose_name_plural} in {elapsed:.3f}s."))
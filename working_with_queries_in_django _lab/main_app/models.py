@@ -1,5 +1,7 @@
 from django.db import models
 
+from main_app.bulk_load import BulkLoadQuerySet
+
 
 class Author(models.Model):
     first_name = models.CharField(max_length=50)
@@ -8,6 +10,8 @@ class Author(models.Model):
     nationality = models.CharField(max_length=50, null=True, blank=True)
     biography = models.TextField(null=True, blank=True)
 
+    objects = BulkLoadQuerySet.as_manager()
+
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
 
@@ -20,6 +24,8 @@ class Book(models.Model):
     language = models.CharField(max_length=50, null=True, blank=True)
     page_count = models.PositiveIntegerField(null=True, blank=True)
 
+    objects = BulkLoadQuerySet.as_manager()
+
     def __str__(self):
         return f"{self.title} by {self.author}"
 
@@ -32,5 +38,7 @@ class Review(models.Model):
     comment = models.TextField(null=True, blank=True)
     created_on = models.DateTimeField(auto_now_add=True, editable=False)
 
+    objects = BulkLoadQuerySet.as_manager()
+
     def __str__(self):
         return f"Review by {self.reviewer_name}"
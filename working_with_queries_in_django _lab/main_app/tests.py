@@ -0,0 +1,55 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from main_app.bulk_load import _csv_value
+from main_app.models import Author, Book, Review
+
+
+class BulkLoadTests(TestCase):
+    def test_instances_get_their_primary_keys(self):
+        authors = [Author(first_name='Jane', last_name=f'Doe {i}') for i in range(5)]
+
+        loaded = Author.objects.bulk_load(authors, batch_size=2)
+
+        self.assertEqual(loaded, 5)
+        self.assertEqual(
+            [author.pk for author in authors],
+            list(Author.objects.order_by('pk').values_list('pk', flat=True)),
+        )
+
+    def test_mappings_get_defaults_and_auto_now_add(self):
+        rows = ({'reviewer_name': 'Alice', 'book_title': f'Book {i}', 'author_name': 'Bob', 'rating': 5} for i in range(3))
+
+        Review.objects.bulk_load(rows)
+
+        self.assertEqual(Review.objects.filter(created_on__isnull=False, comment=None).count(), 3)
+
+    def test_csv_value_tells_null_from_empty_string(self):
+        self.assertEqual(_csv_value(None), '')
+        self.assertEqual(_csv_value(''), '""')
+        self.assertEqual(_csv_value('say "hi", then\nleave'), '"say ""hi"", then\nleave"')
+
+    def test_command_loads_csv_and_jsonl(self):
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = os.path.join(directory, 'books.csv')
+            jsonl_path = os.path.join(directory, 'books.jsonl')
+
+            with open(csv_path, 'w', encoding='utf-8') as file:
+                file.write('title,author,publication_year,page_count\n')
+                file.write('"Dune, Part One",Frank Herbert,1965,\n')
+
+            with open(jsonl_path, 'w', encoding='utf-8') as file:
+                file.write(json.dumps({'title': '1984', 'author': 'George Orwell', 'publication_year': 1949}) + '\n')
+
+            call_command('bulk_load', 'main_app.Book', csv_path, stdout=StringIO())
+            call_command('bulk_load', 'main_app.Book', jsonl_path, stdout=StringIO())
+
+        self.assertQuerySetEqual(
+            Book.objects.order_by('pk').values_list('title', 'publication_year', 'page_count'),
+            [('Dune, Part One', 1965, None), ('1984', 1949, None)],
+        )
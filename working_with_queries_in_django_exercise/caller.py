@@ -24,7 +24,7 @@ def show_highest_rated_art() -> str:
 
 
 def bulk_create_arts(first_art: ArtworkGallery, second_art: ArtworkGallery) -> None:
-    ArtworkGallery.objects.bulk_create(
+    ArtworkGallery.objects.bulk_load(
         [first_art,
          second_art,
          ])
@@ -42,7 +42,7 @@ def show_the_most_expensive_laptop() -> str:
 
 
 def bulk_create_laptops(args: List[Laptop]) -> None:
-    Laptop.objects.bulk_create(args)
+    Laptop.objects.bulk_load(args)
 
 
 def update_to_512_GB_storage() -> None:
@@ -70,7 +70,7 @@ def delete_inexpensive_laptops() -> None:
 
 #   3.Chess Player
 def bulk_create_chess_players(args: List[ChessPlayer]) -> None:
-    ChessPlayer.objects.bulk_create(args)
+    ChessPlayer.objects.bulk_load(args)
 
 
 def delete_chess_players() -> None:
@@ -148,7 +148,7 @@ def show_hard_dungeons() -> str:
 
 
 def bulk_create_dungeons(args: List[Dungeon]) -> None:
-    Dungeon.objects.bulk_create(args)
+    Dungeon.objects.bulk_load(args)
 
 
 def update_dungeon_names() -> None:
@@ -1,5 +1,6 @@
 from django.db import models
 
+from main_app.bulk_load import BulkLoadQuerySet
 from main_app.choices import LaptopBrandChoice, OperationSystemChoice, MealTypeChoice, DungeonDifficultyChoice, \
     WorkoutTypeChoice
 
@@ -23,6 +24,8 @@ class ChessPlayer(models.Model):
 
     games_drawn = models.PositiveIntegerField(default=0)
 
+    objects = BulkLoadQuerySet.as_manager()
+
 
 class Meal(models.Model):
     name = models.CharField(max_length=100)
@@ -55,6 +58,8 @@ class Dungeon(models.Model):
 
     reward = models.TextField()
 
+    objects = BulkLoadQuerySet.as_manager()
+
     def __str__(self):
         return f"{self.name} is guarded by {self.boss_name} who has {self.boss_health} health points!"
 
@@ -93,6 +98,8 @@ class ArtworkGallery(models.Model):
         decimal_places=2,
     )
 
+    objects = BulkLoadQuerySet.as_manager()
+
 
 class Laptop(models.Model):
     brand = models.CharField(
@@ -120,3 +127,5 @@ class Laptop(models.Model):
         max_digits=10,
         decimal_places=2,
     )
+
+    objects = BulkLoadQuerySet.as_manager()